@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List, Optional
 from app.models.ai_model import TestResult, GeneratedReport, Portfolio
-from app.schemas.ai import TestResultResponse, GeneratedReportResponse, PortfolioResponse
+from app.schemas.ai import TestResultResponse, TestResultBatchRequest, GeneratedReportResponse, PortfolioResponse
 from app.core.database import get_db
 
 router = APIRouter(prefix="/ai", tags=["ai"])
@@ -35,6 +35,33 @@ async def get_test_result_by_application(
         created_at=test_result.created_at
     )
 
+@router.post("/test-results/batch", response_model=List[TestResultResponse])
+async def get_test_results_batch(
+    request: TestResultBatchRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """여러 지원서의 테스트 결과 일괄 조회 (결과가 없는 지원서는 응답에서 제외)"""
+    application_ids = list(set(request.application_ids))
+    if not application_ids:
+        return []
+    
+    query = select(TestResult).where(TestResult.application_id.in_(application_ids))
+    result = await db.execute(query)
+    test_results = result.scalars().all()
+    
+    return [
+        TestResultResponse(
+            result_id=tr.result_id,
+            user_id=tr.user_id,
+            project_id=tr.project_id,
+            application_id=tr.application_id,
+            test_type=tr.test_type,
+            score=tr.score,
+            feedback=tr.feedback,
+            created_at=tr.created_at
+        ) for tr in test_results
+    ]
+
 @router.get("/test-results/user/{user_id}", response_model=List[TestResultResponse])
 async def get_user_test_results(
     user_id: str,
@@ -5,6 +5,7 @@ from app.core.exceptions import BusinessException
 from prometheus_fastapi_instrumentator import Instrumentator
 from app.core.middleware import LoggingMiddleware
 from app.controllers import all_routers
+from app.utils.msa_client import msa_client, register_pool_metrics
 
 # MSA API 라우터 추가
 from app.api.ai_data import router as ai_router
@@ -29,6 +30,7 @@ app.add_middleware(LoggingMiddleware)
 
 # 2. 프로메테우스 메트릭 설정 (자동으로 /metrics 엔드포인트 생성)
 Instrumentator().instrument(app).expose(app)
+register_pool_metrics()  # MSAClient 커넥션 풀 상태
 
 # 3. 반복문으로 새 컨트롤러(api) 자동 등록
 for router, prefix, tag in all_routers:
@@ -51,6 +53,13 @@ async def startup_event():
         print(f"CRITICAL DATABASE ERROR: {e}")
         # 여기서 에러가 나면 DB 연결 정보(.env)가 틀렸거나 DB 서버가 죽은 것입니다.
 
+    # MSA 통신용 공유 커넥션 풀 생성
+    await msa_client.startup()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await msa_client.aclose()
+
 # 전역 예외 핸들러: 한 번 등록하면 팀원들은 신경 안 써도 됨
 @app.exception_handler(BusinessException)
 async def business_exception_handler(request: Request, exc: BusinessException):
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 class TestResultResponse(BaseModel):
@@ -15,6 +15,9 @@ class TestResultResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class TestResultBatchRequest(BaseModel):
+    application_ids: List[int]
+
 class GeneratedReportResponse(BaseModel):
     report_id: int
     team_id: int
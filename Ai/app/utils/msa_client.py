@@ -8,10 +8,19 @@ from typing import List, Dict, Any, Optional
 from pydantic import BaseModel
 import logging
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
+# 서비스 간 호출 표식 겸 /internal 인증 헤더 (값: settings.INTERNAL_SERVICE_TOKEN)
+INTERNAL_TOKEN_HEADER = "X-Internal-Token"
+
 class MSAClient:
-    """MSA 서비스 간 HTTP 통신 클라이언트"""
+    """MSA 서비스 간 HTTP 통신 클라이언트
+    
+    대상 서비스별로 httpx.AsyncClient 하나를 앱 수명 동안 재사용합니다.
+    (요청마다 클라이언트를 새로 만들면 TCP 연결/해제 비용을 매번 지불하고 keep-alive가 동작하지 않음)
+    """
     
     def __init__(self):
         self.service_urls = {
@@ -21,14 +30,73 @@ class MSAClient:
             "ai": "http://localhost:8003",        # AI Service
             "support": "http://localhost:8004"    # Support Service
         }
-        self.timeout = 30.0
+        self.timeout = settings.MSA_HTTP_TIMEOUT
+        self.limits = httpx.Limits(
+            max_connections=settings.MSA_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.MSA_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.MSA_KEEPALIVE_EXPIRY,
+        )
+        self.http2 = settings.MSA_HTTP2 and _h2_available()
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+    
+    # =================================================================
+    # 커넥션 풀 수명 관리 (main.py startup/shutdown에서 호출)
+    # =================================================================
+    async def startup(self):
+        """모든 대상 서비스의 공유 클라이언트 생성"""
+        for service in self.service_urls:
+            self._get_client(service)
+        logger.info(
+            f"MSAClient 커넥션 풀 시작: max={self.limits.max_connections}, "
+            f"keepalive={self.limits.max_keepalive_connections}, http2={self.http2}"
+        )
+    
+    async def aclose(self):
+        """공유 클라이언트 종료 (열린 keep-alive 연결 정리)"""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"MSAClient 종료 중 오류: {str(e)}")
+    
+    def _get_client(self, service: str) -> httpx.AsyncClient:
+        """서비스별 공유 클라이언트 반환 (startup 전 호출 시 지연 생성)"""
+        client = self._clients.get(service)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+                headers={INTERNAL_TOKEN_HEADER: settings.INTERNAL_SERVICE_TOKEN},
+            )
+            self._clients[service] = client
+        return client
+    
+    def pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """서비스별 커넥션 풀 상태 (/metrics 노출용)"""
+        stats = {}
+        for service, client in self._clients.items():
+            # httpx는 풀 상태를 공개 API로 제공하지 않으므로 transport 내부 풀을 조회
+            pool = getattr(getattr(client, "_transport", None), "_pool", None)
+            connections = list(getattr(pool, "connections", []) or [])
+            idle = sum(1 for conn in connections if conn.is_idle())
+            stats[service] = {
+                "connections": len(connections),
+                "idle": idle,
+                "active": len(connections) - idle,
+                "pending_requests": len(getattr(pool, "_requests", []) or []),
+                "max_connections": self.limits.max_connections or 0,
+            }
+        return stats
     
     async def _make_request(
         self, 
         service: str, 
         endpoint: str, 
         method: str = "GET",
-        data: Optional[Dict] = None,
+        data: Optional[Any] = None,
         params: Optional[Dict] = None
     ) -> Optional[Dict]:
         """HTTP 요청 실행"""
@@ -37,30 +105,30 @@ class MSAClient:
             return None
             
         url = f"{self.service_urls[service]}{endpoint}"
+        client = self._get_client(service)
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                if method == "GET":
-                    response = await client.get(url, params=params)
-                elif method == "POST":
-                    response = await client.post(url, json=data, params=params)
-                elif method == "PUT":
-                    response = await client.put(url, json=data, params=params)
-                elif method == "DELETE":
-                    response = await client.delete(url, params=params)
-                else:
-                    logger.error(f"Unsupported method: {method}")
-                    return None
+            if method == "GET":
+                response = await client.get(url, params=params)
+            elif method == "POST":
+                response = await client.post(url, json=data, params=params)
+            elif method == "PUT":
+                response = await client.put(url, json=data, params=params)
+            elif method == "DELETE":
+                response = await client.delete(url, params=params)
+            else:
+                logger.error(f"Unsupported method: {method}")
+                return None
+            
+            if response.status_code == 200:
+                return response.json()
+            elif response.status_code == 404:
+                logger.warning(f"Resource not found: {url}")
+                return None
+            else:
+                logger.error(f"Request failed: {response.status_code} - {response.text}")
+                return None
                 
-                if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 404:
-                    logger.warning(f"Resource not found: {url}")
-                    return None
-                else:
-                    logger.error(f"Request failed: {response.status_code} - {response.text}")
-                    return None
-                    
         except httpx.TimeoutException:
             logger.error(f"Request timeout: {url}")
             return None
@@ -81,7 +149,8 @@ class MSAClient:
     
     async def get_users_batch(self, user_ids: List[str]) -> Optional[List[Dict]]:
         """여러 사용자 정보 일괄 조회"""
-        return await self._make_request("auth", "/users/batch", "POST", {"user_ids": user_ids})
+        # Auth /users/batch는 user_id 배열 자체를 body로 받음
+        return await self._make_request("auth", "/users/batch", "POST", user_ids)
     
     async def get_user_stacks(self, user_id: str) -> Optional[List[Dict]]:
         """사용자 기술 스택 조회"""
@@ -143,9 +212,55 @@ class MSAClient:
         data = {"start_time": start_time, "end_time": end_time}
         return await self._make_request("support", f"/chat/team/{team_id}/meeting-logs", "POST", data)
 
+
+def _h2_available() -> bool:
+    """HTTP/2 사용 시 필요한 h2 패키지 설치 여부 확인 (httpx[http2])"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        logger.warning("⚠️ h2 패키지가 없어 MSA_HTTP2 설정을 무시하고 HTTP/1.1을 사용합니다.")
+        return False
+
+
 # 싱글톤 인스턴스
 msa_client = MSAClient()
 
+
+def register_pool_metrics():
+    """MSAClient 커넥션 풀 상태를 Prometheus /metrics에 노출"""
+    try:
+        from prometheus_client import REGISTRY
+        from prometheus_client.core import GaugeMetricFamily
+    except ImportError:
+        logger.warning("⚠️ prometheus_client가 없어 MSAClient 풀 메트릭을 등록하지 않습니다.")
+        return
+
+    class _PoolCollector:
+        def collect(self):
+            gauges = {
+                key: GaugeMetricFamily(
+                    f"msa_client_pool_{key}", description, labels=["service"]
+                )
+                for key, description in [
+                    ("connections", "MSAClient 풀에 열린 연결 수"),
+                    ("idle", "MSAClient 풀의 유휴(keep-alive) 연결 수"),
+                    ("active", "MSAClient 풀에서 요청 처리 중인 연결 수"),
+                    ("pending_requests", "연결을 기다리는 요청 수"),
+                    ("max_connections", "MSAClient 풀 최대 연결 수"),
+                ]
+            }
+            for service, stats in msa_client.pool_stats().items():
+                for key, gauge in gauges.items():
+                    gauge.add_metric([service], stats[key])
+            yield from gauges.values()
+
+    try:
+        REGISTRY.register(_PoolCollector())
+    except ValueError:
+        # --reload 등으로 중복 등록되는 경우 무시
+        pass
+
 # =================================================================
 # 편의 함수들
 # =================================================================
@@ -3,7 +3,7 @@ import uuid
 import aioboto3
 import httpx
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, Header
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Header
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 from app.api.deps import get_db, get_current_user # 의존성 임포트 확인
@@ -12,6 +12,7 @@ from app.models.enums import UserRole, StackCategory, TechStack
 from app.core.config import settings  # [추가] 중앙 설정 import
 from app.core.exceptions import BusinessException, ErrorCode  # [추가] 비즈니스 예외
 from app.schemas.user_update import UserUpdate # [추가] UserUpdate 스키마
+from app.utils.msa_client import msa_client
 from app.schemas.user import (
     UserSimple,
     UserCreate, 
@@ -227,9 +228,13 @@ def get_stack_category(stack_name: str) -> StackCategory:
 @router.put("/users/me")
 def update_user_me(
     user_data: UserUpdate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
+    # 다른 서비스에 캐시된 기본 정보(닉네임/프로필 이미지)가 바뀌는지 확인용
+    previous_profile = (current_user.nickname, current_user.profile_image_url)
+
     # 1. 닉네임 수정
     if user_data.name:
         current_user.nickname = user_data.name
@@ -265,6 +270,9 @@ def update_user_me(
     try:
         db.commit()
         db.refresh(current_user)
+        if (current_user.nickname, current_user.profile_image_url) != previous_profile:
+            # 응답 후 Project/Team 서비스의 사용자 정보 캐시 무효화
+            background_tasks.add_task(msa_client.notify_user_profile_changed, current_user.user_id)
         return {"message": "프로필이 업데이트되었습니다."}
     except Exception as e:
         db.rollback()
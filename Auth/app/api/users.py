@@ -4,14 +4,14 @@ from sqlalchemy import select
 from typing import List, Optional
 from app.models.user import User, UserStack
 from app.schemas.user import UserResponse, UserStackResponse, UserDetailResponse
-from app.core.database import get_db
+from app.core.database import get_read_db
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 @router.get("/{user_id}", response_model=UserDetailResponse)
 async def get_user_detail(
     user_id: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """사용자 상세 정보 조회 (다른 서비스에서 호출)"""
     # 사용자 기본 정보 조회
@@ -54,7 +54,7 @@ async def get_user_detail(
 @router.get("/{user_id}/basic", response_model=UserResponse)
 async def get_user_basic(
     user_id: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """사용자 기본 정보만 조회 (가벼운 조회용)"""
     query = select(User).where(User.user_id == user_id)
@@ -79,7 +79,7 @@ async def get_user_basic(
 @router.post("/batch", response_model=List[UserResponse])
 async def get_users_batch(
     user_ids: List[str],
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """여러 사용자 정보 일괄 조회"""
     query = select(User).where(User.user_id.in_(user_ids))
@@ -100,7 +100,7 @@ async def get_users_batch(
 @router.get("/{user_id}/stacks", response_model=List[UserStackResponse])
 async def get_user_stacks(
     user_id: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """사용자 기술 스택 조회"""
     query = select(UserStack).where(UserStack.user_id == user_id)
@@ -10,6 +10,7 @@ class Settings(BaseSettings):
 
     # [Database - MySQL]
     DATABASE_URL: str = ""
+    DATABASE_REPLICA_URL: Optional[str] = None  # 읽기 전용 세션(get_read_db)용 복제본, 없으면 primary 사용
 
     # [AWS Infrastructure]
     AWS_REGION: str = "ap-northeast-2"
@@ -29,6 +30,16 @@ class Settings(BaseSettings):
         """COGNITO_USER_POOL_ID 또는 COGNITO_USERPOOL_ID 중 값이 있는 것을 반환"""
         return self.COGNITO_USER_POOL_ID or self.COGNITO_USERPOOL_ID
     
+    # [MSA HTTP Client - 서비스 간 통신 커넥션 풀]
+    MSA_HTTP_TIMEOUT: float = 30.0
+    MSA_MAX_CONNECTIONS: int = 100            # 대상 서비스별 최대 연결 수
+    MSA_MAX_KEEPALIVE_CONNECTIONS: int = 20   # 유지할 keep-alive 연결 수
+    MSA_KEEPALIVE_EXPIRY: float = 30.0        # 유휴 연결 만료 시간(초)
+    MSA_HTTP2: bool = False                   # HTTP/2 사용 (h2 패키지 필요)
+
+    # [MSA Internal Auth - 서비스 간 /internal 호출 인증]
+    INTERNAL_SERVICE_TOKEN: str = ""         # X-Internal-Token 공유 토큰 (비어 있으면 /internal은 loopback 호출만 허용)
+    
     # [Security - JWT Settings]
     JWT_ALGORITHM: str = "RS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
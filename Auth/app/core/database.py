@@ -7,6 +7,17 @@ import aioboto3
 engine = create_async_engine(settings.DATABASE_URL, echo=True)
 AsyncSessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
 
+# 읽기 전용 엔진/세션 (조회 API용)
+# - AUTOCOMMIT: 요청 끝의 COMMIT 왕복 없음, 커넥션 반환 시 ROLLBACK(reset)도 생략
+# - DATABASE_REPLICA_URL이 있으면 복제본, 없으면 primary에 접속 (별도 커넥션 풀)
+read_engine = create_async_engine(
+    settings.DATABASE_REPLICA_URL or settings.DATABASE_URL,
+    pool_pre_ping=True,
+    isolation_level="AUTOCOMMIT",
+    pool_reset_on_return=None,
+)
+ReadSessionLocal = async_sessionmaker(bind=read_engine, expire_on_commit=False, autoflush=False, class_=AsyncSession)
+
 class Base(DeclarativeBase):
     pass
 
@@ -42,4 +53,9 @@ async def get_db():
             await session.rollback()
             raise
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
+
+async def get_read_db():
+    """읽기 전용 세션 (flush/commit 없음)"""
+    async with ReadSessionLocal() as session:
+        yield session
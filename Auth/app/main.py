@@ -35,6 +35,7 @@ except ImportError:
 # Auth 라우터 임포트
 from app.api.auth import router as auth_router
 from app.api.users import router as users_router
+from app.utils.msa_client import msa_client, register_pool_metrics
 
 app = FastAPI(title="Portforge-Auth-Service")
 
@@ -65,6 +66,7 @@ if LoggingMiddleware:
 if PROMETHEUS_AVAILABLE:
     try:
         Instrumentator().instrument(app).expose(app)
+        register_pool_metrics()  # MSAClient 커넥션 풀 상태
     except Exception as e:
         logger.warning(f"⚠️ Prometheus 설정 실패: {e}")
 
@@ -78,7 +80,18 @@ app.include_router(auth_router)
 app.include_router(users_router)
 
 # =================================================================
-# 4. 예외 핸들러
+# 4. MSA 통신용 공유 커넥션 풀 생성/정리
+# =================================================================
+@app.on_event("startup")
+async def startup_event():
+    await msa_client.startup()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await msa_client.aclose()
+
+# =================================================================
+# 5. 예외 핸들러
 # =================================================================
 if BusinessException:
     @app.exception_handler(BusinessException)
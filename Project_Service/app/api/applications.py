@@ -1,19 +1,23 @@
 """
-Project Service - 지원서 (Applications) API (보상 트랜잭션 + Circuit Breaker 적용)
+Project Service - 지원서 (Applications) API (보상 트랜잭션 + 공유 Circuit Breaker 적용)
 ERD 기반 MSA 분리: 지원서 CRUD 및 승인/거절 처리
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Header, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import Optional
+from sqlalchemy import or_, select, update
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 import logging
-import httpx
-import time
 import json
+import uuid
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
+from app.utils.msa_client import msa_client
+from app.services.project_list_cache import project_list_cache
+from app.services.recommendations import recommendation_service
+from app.services.notification_queue import notification_queue
+from app.utils.projections import USER_APPLICATION_COLUMNS, user_application_row
 from app.models.project_recruitment import (
     Project, ProjectRecruitmentPosition, Application,
     ApplicationStatus, PositionType as StackCategory  # Alias for compatibility
@@ -23,104 +27,24 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/projects", tags=["applications"])
 
-# =====================================================
-# Circuit Breaker 구현 (인라인)
-# =====================================================
-class SimpleCircuitBreaker:
-    """간단한 Circuit Breaker 구현"""
-    
-    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
-        self.name = name
-        self.failure_threshold = failure_threshold
-        self.recovery_timeout = recovery_timeout
-        self.failure_count = 0
-        self.last_failure_time = None
-        self.is_open = False
-    
-    def can_execute(self) -> bool:
-        if not self.is_open:
-            return True
-        
-        if self.last_failure_time and (time.time() - self.last_failure_time) >= self.recovery_timeout:
-            logger.info(f"🟡 [{self.name}] Circuit 복구 테스트")
-            return True
-        
-        logger.warning(f"🔴 [{self.name}] Circuit OPEN - 요청 차단")
-        return False
-    
-    def record_success(self):
-        self.failure_count = 0
-        self.is_open = False
-    
-    def record_failure(self):
-        self.failure_count += 1
-        self.last_failure_time = time.time()
-        
-        if self.failure_count >= self.failure_threshold:
-            self.is_open = True
-            logger.warning(f"🔴 [{self.name}] Circuit OPEN - 연속 {self.failure_count}회 실패")
 
-# 서비스별 Circuit Breaker
-team_service_breaker = SimpleCircuitBreaker("TeamService")
-support_service_breaker = SimpleCircuitBreaker("SupportService")
+def build_existing_application_query(project_id: int, user_id: str):
+    """중복 지원 확인 쿼리 (POST /projects/{project_id}/applications)"""
+    return select(Application).where(
+        Application.project_id == project_id,
+        Application.user_id == user_id
+    )
 
-# =====================================================
-# Team Service 통신용 클라이언트 (Circuit Breaker 적용)
-# =====================================================
-TEAM_SERVICE_URL = "http://localhost:8002"
-SUPPORT_SERVICE_URL = "http://localhost:8004"
 
-async def call_team_service(method: str, endpoint: str, data: dict = None) -> dict:
-    """Team Service API 호출 (Circuit Breaker 적용)"""
-    
-    if not team_service_breaker.can_execute():
-        logger.warning("Team Service 호출 차단됨 (Circuit Open)")
-        return None
-    
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        url = f"{TEAM_SERVICE_URL}{endpoint}"
-        try:
-            if method == "POST":
-                response = await client.post(url, json=data)
-            elif method == "GET":
-                response = await client.get(url)
-            else:
-                response = await client.request(method, url, json=data)
-            
-            if response.status_code >= 400:
-                logger.error(f"Team Service 호출 실패: {response.status_code}")
-                team_service_breaker.record_failure()
-                return None
-            
-            team_service_breaker.record_success()
-            return response.json()
-            
-        except httpx.TimeoutException:
-            logger.error(f"Team Service 타임아웃: {url}")
-            team_service_breaker.record_failure()
-            return None
-        except Exception as e:
-            logger.error(f"Team Service 연결 실패: {str(e)}")
-            team_service_breaker.record_failure()
-            return None
-
-async def send_notification(user_id: str, message: str, link: str = "/"):
-    """Support Service에 알림 전송 (실패해도 계속 진행 - Fire and Forget)"""
-    if not support_service_breaker.can_execute():
-        logger.debug("알림 전송 스킵 (Support Service Circuit Open)")
-        return
-    
-    async with httpx.AsyncClient(timeout=5.0) as client:
-        try:
-            await client.post(f"{SUPPORT_SERVICE_URL}/notifications", json={
-                "user_id": user_id,
-                "message": message,
-                "link": link,
-            })
-            support_service_breaker.record_success()
-        except Exception as e:
-            support_service_breaker.record_failure()
-            logger.warning(f"알림 전송 실패 (무시됨): {str(e)}")
+def build_user_applications_query(user_id: str):
+    """사용자별 지원 현황 쿼리 (GET /projects/user/{user_id}/applications)"""
+    # 필요한 컬럼만 Row로 조회 (지원서 message, 프로젝트 description 미로딩)
+    return (
+        select(*USER_APPLICATION_COLUMNS)
+        .join(Project, Application.project_id == Project.project_id)
+        .where(Application.user_id == user_id)
+        .order_by(Application.created_at.desc())
+    )
 
 # =====================================================
 # 1. 프로젝트 지원하기
@@ -148,12 +72,7 @@ async def apply_to_project(
             raise HTTPException(status_code=400, detail="user_id는 필수입니다.")
         
         # 이미 지원했는지 확인
-        existing_result = await db.execute(
-            select(Application).where(
-                Application.project_id == project_id,
-                Application.user_id == user_id
-            )
-        )
+        existing_result = await db.execute(build_existing_application_query(project_id, user_id))
         existing = existing_result.scalar_one_or_none()
         
         if existing:
@@ -183,8 +102,8 @@ async def apply_to_project(
         await db.commit()
         await db.refresh(new_application)
         
-        # 팀장에게 알림 전송 (실패해도 계속)
-        await send_notification(
+        # 팀장에게 알림 (큐에 넣고 바로 진행 - 백그라운드 일괄 전송)
+        notification_queue.enqueue(
             project.user_id,
             f"'{project.title}' 프로젝트에 새로운 지원자가 있습니다!",
             f"/projects/{project_id}"
@@ -215,7 +134,7 @@ async def apply_to_project(
 # 2. 프로젝트 지원자 목록 조회
 # =====================================================
 @router.get("/{project_id}/applications")
-async def get_project_applications(project_id: int, db: AsyncSession = Depends(get_db)):
+async def get_project_applications(project_id: int, db: AsyncSession = Depends(get_read_db)):
     """프로젝트의 지원자 목록 조회 (팀장용)"""
     try:
         applications_result = await db.execute(
@@ -254,18 +173,111 @@ async def get_project_applications(project_id: int, db: AsyncSession = Depends(g
 # =====================================================
 # 3. 지원자 승인/거절 (보상 트랜잭션 적용)
 # =====================================================
+async def _reserve_seat(db: AsyncSession, project_id: int, position_type) -> Optional[bool]:
+    """
+    모집 포지션 좌석 1개 예약 (조건부 UPDATE 한 번 - 동시 승인 시에도 초과 예약 없음)
+    반환: True=예약됨, False=마감, None=모집 포지션 없음 (인원 관리 대상 아님)
+    """
+    result = await db.execute(
+        update(ProjectRecruitmentPosition)
+        .where(
+            ProjectRecruitmentPosition.project_id == project_id,
+            ProjectRecruitmentPosition.position_type == position_type,
+            or_(
+                ProjectRecruitmentPosition.target_count.is_(None),
+                ProjectRecruitmentPosition.current_count < ProjectRecruitmentPosition.target_count,
+            ),
+        )
+        .values(current_count=ProjectRecruitmentPosition.current_count + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount:
+        return True
+
+    exists = await db.execute(
+        select(ProjectRecruitmentPosition.project_id).where(
+            ProjectRecruitmentPosition.project_id == project_id,
+            ProjectRecruitmentPosition.position_type == position_type,
+        )
+    )
+    return False if exists.first() else None
+
+
+async def _reserve_seats(db: AsyncSession, project_id: int, position_type, count: int) -> Optional[int]:
+    """
+    모집 포지션 좌석 최대 count개 예약 (일괄 승인용)
+    포지션 행을 잠그고 남은 좌석만큼만 증가 - 트랜잭션 안에서 원격 호출 없이 바로 커밋하는 경로에서만 사용
+    반환: 예약된 좌석 수, None=모집 포지션 없음
+    """
+    result = await db.execute(
+        select(ProjectRecruitmentPosition.current_count, ProjectRecruitmentPosition.target_count)
+        .where(
+            ProjectRecruitmentPosition.project_id == project_id,
+            ProjectRecruitmentPosition.position_type == position_type,
+        )
+        .with_for_update()
+    )
+    row = result.first()
+    if row is None:
+        return None
+
+    current, target = row
+    granted = count if target is None else max(0, min(count, target - (current or 0)))
+    if granted:
+        await db.execute(
+            update(ProjectRecruitmentPosition)
+            .where(
+                ProjectRecruitmentPosition.project_id == project_id,
+                ProjectRecruitmentPosition.position_type == position_type,
+            )
+            .values(current_count=ProjectRecruitmentPosition.current_count + granted)
+            .execution_options(synchronize_session=False)
+        )
+    return granted
+
+
+async def _release_seat(db: AsyncSession, project_id: int, position_type, count: int = 1) -> None:
+    """예약한 좌석 반환 (보상 - 다른 승인 결과를 덮어쓰지 않도록 감소 연산)"""
+    await db.execute(
+        update(ProjectRecruitmentPosition)
+        .where(
+            ProjectRecruitmentPosition.project_id == project_id,
+            ProjectRecruitmentPosition.position_type == position_type,
+            ProjectRecruitmentPosition.current_count >= count,
+        )
+        .values(current_count=ProjectRecruitmentPosition.current_count - count)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def _decide(db: AsyncSession, application_id: int, new_status: ApplicationStatus, decision_key: str) -> bool:
+    """PENDING인 지원서만 결정 상태로 변경 (조건부 UPDATE - 동시 요청 중 하나만 성공)"""
+    result = await db.execute(
+        update(Application)
+        .where(Application.application_id == application_id, Application.status == ApplicationStatus.PENDING)
+        .values(status=new_status, decision_key=decision_key, updated_at=datetime.now())
+        .execution_options(synchronize_session=False)
+    )
+    return bool(result.rowcount)
+
+
 @router.patch("/{project_id}/applications/{application_id}")
 async def handle_application(
     project_id: int,
     application_id: int,
     action_data: dict,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=64),
     db: AsyncSession = Depends(get_db)
 ):
     """
     지원자 승인/거절 처리
     
+    - 좌석 예약: 조건부 UPDATE (current_count < target_count) 한 번으로 처리, 마감 시 409
+    - 멱등성: Idempotency-Key 헤더 (또는 body의 idempotency_key)가 같은 재요청은 이전 결과 반환
+    - 예약은 먼저 커밋하고 팀 서비스를 호출 (호출 동안 포지션 행 잠금을 잡지 않음)
+    
     보상 트랜잭션 (승인 시):
-    - 팀 멤버 추가 실패 시 승인 취소 (PENDING으로 복원)
+    - 팀 멤버 추가 실패 시 이번 결정만 정확히 되돌림 (PENDING 복원 + 좌석 1개 반환)
     """
     try:
         action = action_data.get("status", "").lower()
@@ -273,147 +285,366 @@ async def handle_application(
         if action not in ["accepted", "rejected"]:
             raise HTTPException(status_code=400, detail="status는 'accepted' 또는 'rejected'만 가능합니다.")
         
-        # 지원서 조회
-        application_result = await db.execute(
-            select(Application).where(Application.application_id == application_id)
-        )
-        application = application_result.scalar_one_or_none()
+        new_status = ApplicationStatus.ACCEPTED if action == "accepted" else ApplicationStatus.REJECTED
+        decision_key = str(idempotency_key or action_data.get("idempotency_key") or uuid.uuid4())[:64]
+        
+        # 지원서 + 프로젝트 제목 한 번에 조회
+        row = (await db.execute(
+            select(Application.user_id, Application.position_type, Application.status,
+                   Application.decision_key, Project.title)
+            .join(Project, Project.project_id == Application.project_id)
+            .where(Application.application_id == application_id, Application.project_id == project_id)
+        )).one_or_none()
         
-        if not application:
+        if not row:
             raise HTTPException(status_code=404, detail="지원서를 찾을 수 없습니다.")
         
-        if application.status != ApplicationStatus.PENDING:
+        user_id, position_type, current_status, current_key, project_title = row
+        
+        if current_status != ApplicationStatus.PENDING:
+            # 같은 결정의 재요청이면 이전 결과 그대로 반환
+            if current_key == decision_key and current_status == new_status:
+                return _decision_response(application_id, user_id, new_status)
             raise HTTPException(status_code=400, detail="이미 처리된 지원서입니다.")
         
-        # 프로젝트 정보 조회
-        project_result = await db.execute(select(Project).where(Project.project_id == project_id))
-        project = project_result.scalar_one_or_none()
+        if not await _decide(db, application_id, new_status, decision_key):
+            await db.rollback()
+            raise HTTPException(status_code=409, detail="다른 요청에서 이미 처리 중인 지원서입니다.")
         
-        if action == "accepted":
-            # ✅ Step 1: 지원서 승인
-            original_status = application.status
-            application.status = ApplicationStatus.ACCEPTED
+        if new_status == ApplicationStatus.REJECTED:
+            await db.commit()
+            project_list_cache.invalidate_project(project_id)
             
-            # 모집 포지션 현재 인원 증가
-            position_result = await db.execute(
-                select(ProjectRecruitmentPosition).where(
-                    ProjectRecruitmentPosition.project_id == project_id,
-                    ProjectRecruitmentPosition.position_type == application.position_type
-                )
+            # 지원자에게 알림 (큐에 넣고 바로 진행 - 백그라운드 일괄 전송)
+            notification_queue.enqueue(
+                user_id,
+                f"'{project_title}' 프로젝트 지원이 거절되었습니다.",
+                f"/projects/{project_id}"
             )
-            position = position_result.scalar_one_or_none()
             
-            original_count = None
-            if position:
-                original_count = position.current_count
-                position.current_count = (position.current_count or 0) + 1
+            logger.info(f"✅ 지원자 거절 완료: {user_id}")
+            return _decision_response(application_id, user_id, new_status)
+        
+        # ✅ Step 1: 지원서 승인 + 좌석 예약 (짧은 트랜잭션으로 커밋)
+        seat = await _reserve_seat(db, project_id, position_type)
+        if seat is False:
+            await db.rollback()
+            raise HTTPException(status_code=409, detail="해당 포지션의 모집 인원이 마감되었습니다.")
+        await db.commit()
+        logger.info(f"✅ Step 1: 지원서 승인 + 좌석 예약 (ID: {application_id})")
+        
+        # ✅ Step 2: Team Service에 팀 멤버 추가 요청
+        member_data = {
+            "project_id": project_id,
+            "user_id": user_id,
+            "position_type": position_type.value if position_type else "BACKEND",
+            "role": "MEMBER",
+        }
+        
+        team_response = await msa_client.add_team_member(member_data)
+        
+        # ❌ 팀 멤버 추가 실패 시 보상 트랜잭션
+        if team_response is None:
+            logger.error("❌ Team Service 호출 실패 - 보상 트랜잭션 실행")
             
-            await db.flush()
-            logger.info(f"✅ Step 1: 지원서 승인됨 (ID: {application_id})")
+            # 🔄 보상: 이번 결정(decision_key)으로 승인된 경우에만 PENDING 복원 + 좌석 반환
+            reverted = await db.execute(
+                update(Application)
+                .where(
+                    Application.application_id == application_id,
+                    Application.status == ApplicationStatus.ACCEPTED,
+                    Application.decision_key == decision_key,
+                )
+                .values(status=ApplicationStatus.PENDING, decision_key=None, updated_at=datetime.now())
+                .execution_options(synchronize_session=False)
+            )
+            if reverted.rowcount and seat:
+                await _release_seat(db, project_id, position_type)
+            await db.commit()  # 보상 결과 저장
             
-            # ✅ Step 2: Team Service에 팀 멤버 추가 요청
-            member_data = {
-                "project_id": project_id,
-                "user_id": application.user_id,
-                "position_type": application.position_type.value if application.position_type else "BACKEND",
-                "role": "MEMBER",
+            raise HTTPException(
+                status_code=503,
+                detail="팀 서비스 연결 실패로 승인이 취소되었습니다. 잠시 후 다시 시도해주세요."
+            )
+        
+        # ✅ 모든 단계 성공
+        project_list_cache.invalidate_project(project_id)
+        recommendation_service.invalidate_projects()  # 모집 인원 변경
+        logger.info(f"✅ 지원자 승인 완료: {user_id} -> 프로젝트 {project_id}")
+        
+        # 지원자에게 알림 (큐에 넣고 바로 진행 - 백그라운드 일괄 전송)
+        notification_queue.enqueue(
+            user_id,
+            f"'{project_title}' 프로젝트 지원이 승인되었습니다! 팀 스페이스에 참여하세요.",
+            f"/projects/{project_id}"
+        )
+        
+        return _decision_response(application_id, user_id, new_status)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"지원 처리 실패: {str(e)}")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"지원 처리 실패: {str(e)}")
+
+
+def _decision_response(application_id: int, user_id: str, decided: ApplicationStatus) -> dict:
+    if decided == ApplicationStatus.ACCEPTED:
+        return {
+            "status": "success",
+            "message": "지원자가 승인되어 팀 멤버로 추가되었습니다.",
+            "data": {
+                "application_id": application_id,
+                "user_id": user_id,
+                "team_member_added": True,
             }
-            
-            team_response = await call_team_service("POST", "/api/v1/teams/members", member_data)
-            
-            # ❌ 팀 멤버 추가 실패 시 보상 트랜잭션
-            if team_response is None:
-                logger.error("❌ Team Service 호출 실패 - 보상 트랜잭션 실행")
-                
-                # 🔄 보상: 승인 취소 (PENDING으로 복원)
-                application.status = original_status
-                if position and original_count is not None:
-                    position.current_count = original_count
-                
-                await db.commit()  # 보상 결과 저장
-                
-                raise HTTPException(
-                    status_code=503,
-                    detail="팀 서비스 연결 실패로 승인이 취소되었습니다. 잠시 후 다시 시도해주세요."
+        }
+    return {
+        "status": "success",
+        "message": "지원자가 거절되었습니다.",
+        "data": {
+            "application_id": application_id,
+            "user_id": user_id,
+        }
+    }
+
+# =====================================================
+# 3-1. 지원자 일괄 승인/거절
+# =====================================================
+MAX_BATCH_DECISIONS = 100
+
+
+async def _revert_decisions(db: AsyncSession, application_ids: List[int], decided: ApplicationStatus,
+                            decision_key: str) -> int:
+    """이번 요청(decision_key)으로 결정된 지원서만 PENDING으로 되돌리고 건수 반환"""
+    if not application_ids:
+        return 0
+    result = await db.execute(
+        update(Application)
+        .where(
+            Application.application_id.in_(application_ids),
+            Application.status == decided,
+            Application.decision_key == decision_key,
+        )
+        .values(status=ApplicationStatus.PENDING, decision_key=None, updated_at=datetime.now())
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount or 0
+
+
+@router.post("/{project_id}/applications/decisions")
+async def handle_applications_batch(
+    project_id: int,
+    batch_data: dict,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=64),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    지원자 일괄 승인/거절
+    body: {"decisions": [{"application_id": 1, "status": "accepted"}, ...]}
+    
+    - 지원서 조회/결정/좌석 예약을 한 트랜잭션으로 처리
+    - 승인된 지원자는 Team Service에 한 번에 추가 (/api/v1/teams/members/batch)
+    - 알림은 일괄로 큐에 추가
+    - 항목별 결과 반환: 마감/이미 처리됨/팀 추가 실패 등은 해당 항목만 failed (나머지는 그대로 반영)
+    - Idempotency-Key가 같은 재요청은 이미 반영된 항목을 이전 결과로 반환
+    """
+    try:
+        decisions = batch_data.get("decisions")
+        if not isinstance(decisions, list) or not decisions:
+            raise HTTPException(status_code=400, detail="decisions 목록은 필수입니다.")
+        if len(decisions) > MAX_BATCH_DECISIONS:
+            raise HTTPException(status_code=400, detail=f"한 번에 최대 {MAX_BATCH_DECISIONS}건까지 처리할 수 있습니다.")
+        
+        decision_key = str(idempotency_key or batch_data.get("idempotency_key") or uuid.uuid4())[:64]
+        
+        # 요청 검증 (중복/잘못된 항목은 해당 항목만 실패)
+        results: Dict[int, dict] = {}
+        requested: Dict[int, ApplicationStatus] = {}
+        order: List[int] = []
+        for index, decision in enumerate(decisions):
+            decision = decision if isinstance(decision, dict) else {}
+            application_id = decision.get("application_id")
+            action = str(decision.get("status", "")).lower()
+            if not isinstance(application_id, int) or action not in ["accepted", "rejected"]:
+                results[-index - 1] = {"application_id": application_id, "status": "failed",
+                                       "detail": "application_id와 status('accepted'/'rejected')가 필요합니다."}
+                order.append(-index - 1)
+                continue
+            if application_id in requested:
+                results[-index - 1] = {"application_id": application_id, "status": "failed",
+                                       "detail": "같은 지원서가 중복 요청되었습니다."}
+                order.append(-index - 1)
+                continue
+            requested[application_id] = ApplicationStatus.ACCEPTED if action == "accepted" else ApplicationStatus.REJECTED
+            order.append(application_id)
+        
+        # 지원서 + 프로젝트 제목 한 번에 조회
+        rows = (await db.execute(
+            select(Application.application_id, Application.user_id, Application.position_type,
+                   Application.status, Application.decision_key, Project.title)
+            .join(Project, Project.project_id == Application.project_id)
+            .where(Application.application_id.in_(list(requested)), Application.project_id == project_id)
+        )).all() if requested else []
+        applications = {row.application_id: row for row in rows}
+        project_title = rows[0].title if rows else None
+        
+        pending: Dict[ApplicationStatus, List[int]] = {ApplicationStatus.ACCEPTED: [], ApplicationStatus.REJECTED: []}
+        for application_id, new_status in requested.items():
+            row = applications.get(application_id)
+            if row is None:
+                results[application_id] = {"application_id": application_id, "status": "failed",
+                                           "detail": "지원서를 찾을 수 없습니다."}
+            elif row.status != ApplicationStatus.PENDING:
+                if row.decision_key == decision_key and row.status == new_status:
+                    results[application_id] = {"application_id": application_id, "user_id": row.user_id,
+                                               "status": new_status.value.lower()}
+                else:
+                    results[application_id] = {"application_id": application_id, "status": "failed",
+                                               "detail": "이미 처리된 지원서입니다."}
+            else:
+                pending[new_status].append(application_id)
+        
+        # ✅ Step 1: 결정 반영 (상태별 조건부 UPDATE 한 번씩) → 이번 요청이 반영한 지원서만 골라냄
+        for new_status, application_ids in pending.items():
+            if application_ids:
+                await db.execute(
+                    update(Application)
+                    .where(Application.application_id.in_(application_ids), Application.status == ApplicationStatus.PENDING)
+                    .values(status=new_status, decision_key=decision_key, updated_at=datetime.now())
+                    .execution_options(synchronize_session=False)
                 )
-            
-            # ✅ 모든 단계 성공 - 커밋
-            await db.commit()
-            logger.info(f"✅ 지원자 승인 완료: {application.user_id} -> 프로젝트 {project_id}")
-            
-            # 지원자에게 알림 (실패해도 계속)
-            if project:
-                await send_notification(
-                    application.user_id,
-                    f"'{project.title}' 프로젝트 지원이 승인되었습니다! 팀 스페이스에 참여하세요.",
-                    f"/projects/{project_id}"
+        pending_ids = pending[ApplicationStatus.ACCEPTED] + pending[ApplicationStatus.REJECTED]
+        decided = set()
+        if pending_ids:
+            decided_result = await db.execute(
+                select(Application.application_id).where(
+                    Application.application_id.in_(pending_ids),
+                    Application.decision_key == decision_key,
                 )
-            
-            return {
-                "status": "success",
-                "message": "지원자가 승인되어 팀 멤버로 추가되었습니다.",
-                "data": {
-                    "application_id": application_id,
-                    "user_id": application.user_id,
-                    "team_member_added": True,
-                }
-            }
+            )
+            decided = set(decided_result.scalars().all())
+        for application_id in pending_ids:
+            if application_id not in decided:
+                results[application_id] = {"application_id": application_id, "status": "failed",
+                                           "detail": "다른 요청에서 이미 처리 중인 지원서입니다."}
+        
+        # ✅ Step 2: 승인 좌석 예약 (포지션별로 남은 좌석만큼, 초과분은 PENDING 복원)
+        accepted_by_position: Dict[Any, List[int]] = {}
+        for application_id in pending[ApplicationStatus.ACCEPTED]:
+            if application_id in decided:
+                accepted_by_position.setdefault(applications[application_id].position_type, []).append(application_id)
+        
+        reserved_positions = set()
+        for position_type, application_ids in accepted_by_position.items():
+            granted = await _reserve_seats(db, project_id, position_type, len(application_ids))
+            if granted is None:
+                continue
+            reserved_positions.add(position_type)
+            overflow = application_ids[granted:]
+            if overflow:
+                await _revert_decisions(db, overflow, ApplicationStatus.ACCEPTED, decision_key)
+                del application_ids[granted:]
+                for application_id in overflow:
+                    decided.discard(application_id)
+                    results[application_id] = {"application_id": application_id, "status": "failed",
+                                               "detail": "해당 포지션의 모집 인원이 마감되었습니다."}
         
-        else:  # rejected
-            application.status = ApplicationStatus.REJECTED
-            await db.commit()
-            
-            # 지원자에게 알림 (실패해도 계속)
-            if project:
-                await send_notification(
-                    application.user_id,
-                    f"'{project.title}' 프로젝트 지원이 거절되었습니다.",
-                    f"/projects/{project_id}"
-                )
-            
-            logger.info(f"✅ 지원자 거절 완료: {application.user_id}")
-            
-            return {
-                "status": "success",
-                "message": "지원자가 거절되었습니다.",
-                "data": {
-                    "application_id": application_id,
-                    "user_id": application.user_id,
+        await db.commit()
+        
+        # ✅ Step 3: 승인된 지원자를 Team Service에 한 번에 추가
+        accepted_ids = [application_id for ids in accepted_by_position.values() for application_id in ids]
+        team_failed: Dict[int, str] = {}
+        if accepted_ids:
+            team_response = await msa_client.add_team_members_batch([
+                {
+                    "project_id": project_id,
+                    "user_id": applications[application_id].user_id,
+                    "position_type": applications[application_id].position_type.value
+                    if applications[application_id].position_type else "BACKEND",
+                    "role": "MEMBER",
+                }
+                for application_id in accepted_ids
+            ])
+            if team_response is None:
+                team_failed = {application_id: "팀 서비스 연결 실패로 승인이 취소되었습니다." for application_id in accepted_ids}
+            else:
+                member_results = {
+                    item.get("user_id"): item for item in (team_response.get("data") or {}).get("results", [])
                 }
+                for application_id in accepted_ids:
+                    item = member_results.get(applications[application_id].user_id)
+                    if item is None or item.get("status") == "error":
+                        team_failed[application_id] = (item or {}).get("detail") or "팀 멤버 추가에 실패하여 승인이 취소되었습니다."
+        
+        # ❌ 팀 멤버 추가 실패 항목만 보상 (PENDING 복원 + 포지션별 좌석 반환)
+        if team_failed:
+            logger.error(f"❌ Team Service 일괄 추가 실패 {len(team_failed)}건 - 보상 트랜잭션 실행")
+            for position_type, application_ids in accepted_by_position.items():
+                failed_ids = [application_id for application_id in application_ids if application_id in team_failed]
+                reverted = await _revert_decisions(db, failed_ids, ApplicationStatus.ACCEPTED, decision_key)
+                if reverted and position_type in reserved_positions:
+                    await _release_seat(db, project_id, position_type, reverted)
+            await db.commit()  # 보상 결과 저장
+            for application_id, detail in team_failed.items():
+                decided.discard(application_id)
+                results[application_id] = {"application_id": application_id, "status": "failed", "detail": detail}
+        
+        # 최종 반영 항목 결과 + 알림 (큐에 일괄 추가 - 백그라운드 전송)
+        notifications = []
+        for application_id in decided:
+            new_status = requested[application_id]
+            user_id = applications[application_id].user_id
+            results[application_id] = {"application_id": application_id, "user_id": user_id,
+                                       "status": new_status.value.lower()}
+            notifications.append({
+                "user_id": user_id,
+                "message": f"'{project_title}' 프로젝트 지원이 승인되었습니다! 팀 스페이스에 참여하세요."
+                if new_status == ApplicationStatus.ACCEPTED else f"'{project_title}' 프로젝트 지원이 거절되었습니다.",
+                "link": f"/projects/{project_id}",
+            })
+        
+        if decided:
+            project_list_cache.invalidate_project(project_id)
+            if any(requested[application_id] == ApplicationStatus.ACCEPTED for application_id in decided):
+                recommendation_service.invalidate_projects()  # 모집 인원 변경
+            notification_queue.enqueue_many(notifications)
+        
+        items = [results[key] for key in order]
+        summary = {
+            "accepted": sum(1 for item in items if item["status"] == "accepted"),
+            "rejected": sum(1 for item in items if item["status"] == "rejected"),
+            "failed": sum(1 for item in items if item["status"] == "failed"),
+        }
+        logger.info(f"✅ 지원자 일괄 처리 완료 (프로젝트 {project_id}): {summary}")
+        
+        return {
+            "status": "success",
+            "message": f"승인 {summary['accepted']}건, 거절 {summary['rejected']}건, 실패 {summary['failed']}건",
+            "data": {
+                "project_id": project_id,
+                "results": items,
+                "summary": summary,
             }
+        }
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"지원 처리 실패: {str(e)}")
+        logger.error(f"지원 일괄 처리 실패: {str(e)}")
         await db.rollback()
-        raise HTTPException(status_code=500, detail=f"지원 처리 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"지원 일괄 처리 실패: {str(e)}")
 
 # =====================================================
 # 4. 사용자의 지원 현황 조회
 # =====================================================
 @router.get("/user/{user_id}/applications")
-async def get_user_applications(user_id: str, db: AsyncSession = Depends(get_db)):
+async def get_user_applications(user_id: str, db: AsyncSession = Depends(get_read_db)):
     """특정 사용자의 지원 현황 조회"""
     try:
-        applications_result = await db.execute(
-            select(Application, Project)
-            .join(Project, Application.project_id == Project.project_id)
-            .where(Application.user_id == user_id)
-            .order_by(Application.created_at.desc())
-        )
-        applications = applications_result.all()
-        
-        application_list = []
-        for app, project in applications:
-            application_list.append({
-                "application_id": app.application_id,
-                "project_id": app.project_id,
-                "project_title": project.title,
-                "position_type": app.position_type.value if app.position_type else "UNKNOWN",
-                "status": app.status.value if app.status else "PENDING",
-                "created_at": app.created_at.isoformat() if app.created_at else None,
-            })
+        applications_result = await db.execute(build_user_applications_query(user_id))
+        application_list = [user_application_row(row) for row in applications_result.all()]
         
         return {
             "status": "success",
@@ -431,7 +662,7 @@ async def get_user_applications(user_id: str, db: AsyncSession = Depends(get_db)
 # 5. 모집 포지션 조회 (지원하기 페이지용)
 # =====================================================
 @router.get("/{project_id}/positions")
-async def get_project_positions(project_id: int, db: AsyncSession = Depends(get_db)):
+async def get_project_positions(project_id: int, db: AsyncSession = Depends(get_read_db)):
     """프로젝트의 모집 포지션 목록 조회"""
     try:
         positions_result = await db.execute(
@@ -1,18 +1,45 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import logging
 from app.models.project_recruitment import Project, Application
 from app.schemas.project import ProjectResponse, ApplicationResponse
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_db, get_read_db
+from app.repositories.project_recruitment_repository import ProjectRecruitmentRepository
+from app.api.projects import build_project_detail_response
 from app.utils.msa_client import msa_client, enrich_data_with_user_info
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/enriched", tags=["enriched-data"])
 
+async def _await_until_deadline(
+    tasks: Dict[str, asyncio.Task], deadline: float
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    병렬 실행 중인 외부 조회를 공통 마감 시각(loop.time 기준)까지만 기다림
+    - 마감 내 완료된 결과만 반환하고, 미완료 작업은 취소 후 이름 목록으로 반환
+    """
+    timeout = max(0.0, deadline - asyncio.get_running_loop().time())
+    done, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+    
+    results: Dict[str, Any] = {}
+    timed_out: List[str] = []
+    for name, task in tasks.items():
+        if task in done and not task.cancelled() and task.exception() is None:
+            results[name] = task.result()
+        elif task in pending:
+            task.cancel()
+            timed_out.append(name)
+    return results, timed_out
+
 @router.get("/projects/{project_id}/applications-with-users")
 async def get_project_applications_with_user_info(
     project_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """프로젝트 지원서 목록을 사용자 정보와 함께 조회 (MSA 통신 예시)"""
     
@@ -39,9 +66,12 @@ async def get_project_applications_with_user_info(
     # 3. Auth Service에서 사용자 정보 조회 및 데이터 보강
     enriched_applications = await enrich_data_with_user_info(applications_data)
     
-    # 4. AI Service에서 테스트 결과 조회 및 추가
+    # 4. AI Service에서 테스트 결과 일괄 조회 및 추가 (지원자 수와 무관하게 1회 호출)
+    test_results = await msa_client.get_test_results_batch(
+        [app_data["application_id"] for app_data in enriched_applications]
+    )
     for app_data in enriched_applications:
-        test_result = await msa_client.get_test_result_by_application(app_data["application_id"])
+        test_result = test_results.get(app_data["application_id"])
         if test_result:
             app_data["test_result"] = {
                 "score": test_result.get("score"),
@@ -55,7 +85,7 @@ async def get_project_applications_with_user_info(
 async def get_projects_with_leader_info(
     limit: int = 10,
     offset: int = 0,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """프로젝트 목록을 팀장 정보와 함께 조회"""
     
@@ -89,7 +119,7 @@ async def get_projects_with_leader_info(
 @router.get("/applications/{application_id}/full-detail")
 async def get_application_full_detail(
     application_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """지원서 상세 정보를 모든 관련 데이터와 함께 조회"""
     
@@ -115,19 +145,32 @@ async def get_application_full_detail(
         "created_at": application.created_at.isoformat()
     }
     
-    # 3. 사용자 정보 조회 (Auth Service)
-    user_info = await msa_client.get_user_detail(application.user_id)
-    if user_info:
-        app_data["user_info"] = user_info
-    
-    # 4. 프로젝트 정보 조회 (자신의 서비스이지만 API 호출 예시)
-    project_info = await msa_client.get_project_detail(application.project_id)
-    if project_info:
-        app_data["project_info"] = project_info
+    # 3. 외부 서비스 조회를 하나의 마감 시간 안에서 병렬 실행 (Auth, AI)
+    deadline = asyncio.get_running_loop().time() + settings.ENRICH_DEADLINE_SECONDS
+    tasks: Dict[str, asyncio.Task] = {
+        "user_info": asyncio.create_task(msa_client.get_user_detail(application.user_id)),
+        "test_result": asyncio.create_task(msa_client.get_test_result_by_application(application_id)),
+    }
     
-    # 5. 테스트 결과 조회 (AI Service)
-    test_result = await msa_client.get_test_result_by_application(application_id)
-    if test_result:
-        app_data["test_result"] = test_result
+    # 4. 프로젝트 정보는 자기 서비스이므로 HTTP 대신 DB에서 직접 조회 (외부 호출과 동시 진행)
+    try:
+        project = await ProjectRecruitmentRepository(db).get_project_by_id(application.project_id)
+        if project:
+            app_data["project_info"] = build_project_detail_response(project)
+    except Exception:
+        for task in tasks.values():
+            task.cancel()
+        raise
+    
+    # 5. 마감 내 도착한 결과만 반영, 늦은 의존성은 degraded로 표시 (부분 응답)
+    results, timed_out = await _await_until_deadline(tasks, deadline)
+    for key, value in results.items():
+        if value:
+            app_data[key] = value
+    
+    if timed_out:
+        logger.warning(f"지원서 {application_id} 상세 조회 지연 예산 초과: {timed_out}")
+    app_data["degraded"] = bool(timed_out)
+    app_data["degraded_sources"] = timed_out
     
     return app_data
\ No newline at end of file
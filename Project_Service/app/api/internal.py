@@ -0,0 +1,20 @@
+"""
+서비스 간 내부 API (다른 MSA 서비스에서만 호출)
+"""
+from fastapi import APIRouter, Depends
+import logging
+
+from app.core.deps import verify_internal_service
+from app.services.user_profile_cache import user_profile_cache
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/internal", tags=["internal"], dependencies=[Depends(verify_internal_service)])
+
+
+@router.post("/users/{user_id}/invalidate")
+async def invalidate_user_profile(user_id: str):
+    """Auth에서 닉네임/프로필 이미지 변경 시 호출 - 캐시된 사용자 기본 정보 제거"""
+    user_profile_cache.invalidate(user_id)
+    logger.info(f"🧹 사용자 정보 캐시 무효화: {user_id}")
+    return {"status": "success", "user_id": user_id}
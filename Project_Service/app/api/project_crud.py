@@ -1,9 +1,9 @@
 """
-Project Service - 프로젝트 CRUD API (보상 트랜잭션 + Circuit Breaker 적용)
+Project Service - 프로젝트 CRUD API (보상 트랜잭션 + 공유 Circuit Breaker 적용)
 ERD 기반 MSA 분리: 프로젝트/모집포지션/지원서 관리
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
@@ -11,129 +11,32 @@ from typing import List, Optional
 from datetime import datetime
 import json
 import logging
-import httpx
-import time
 import sys
 import os
 
 # shared 모듈 경로 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
+from app.utils.msa_client import msa_client
+from app.utils.pagination import paginate_projects, split_page
+from app.utils.list_format import parse_list_format, to_compact
+from app.services.view_counter import view_counter
+from app.services.project_list_cache import project_list_cache, to_response
+from app.services.recommendations import recommendation_service
+from app.services.outbox_relay import outbox_relay, add_outbox_event, get_latest_event, TEAM_CREATE
+from app.repositories.project_recruitment_repository import build_project_stack_rows
 from app.models.project_recruitment import (
     Project, ProjectRecruitmentPosition, Application,
     ProjectType, ProjectMethod, ProjectStatus, ApplicationStatus, 
     PositionType as StackCategory  # Alias for compatibility
 )
+from app.models.outbox import OutboxStatus
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
-# =====================================================
-# Circuit Breaker 구현 (인라인)
-# =====================================================
-class SimpleCircuitBreaker:
-    """간단한 Circuit Breaker 구현"""
-    
-    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
-        self.name = name
-        self.failure_threshold = failure_threshold
-        self.recovery_timeout = recovery_timeout
-        self.failure_count = 0
-        self.last_failure_time = None
-        self.is_open = False
-    
-    def can_execute(self) -> bool:
-        if not self.is_open:
-            return True
-        
-        # 복구 시간 경과 확인
-        if self.last_failure_time and (time.time() - self.last_failure_time) >= self.recovery_timeout:
-            logger.info(f"🟡 [{self.name}] Circuit 복구 테스트")
-            return True
-        
-        logger.warning(f"🔴 [{self.name}] Circuit OPEN - 요청 차단")
-        return False
-    
-    def record_success(self):
-        self.failure_count = 0
-        self.is_open = False
-    
-    def record_failure(self):
-        self.failure_count += 1
-        self.last_failure_time = time.time()
-        
-        if self.failure_count >= self.failure_threshold:
-            self.is_open = True
-            logger.warning(f"🔴 [{self.name}] Circuit OPEN - 연속 {self.failure_count}회 실패")
-
-# 서비스별 Circuit Breaker
-team_service_breaker = SimpleCircuitBreaker("TeamService")
-support_service_breaker = SimpleCircuitBreaker("SupportService")
-
-# =====================================================
-# Team Service 통신용 클라이언트 (Circuit Breaker 적용)
-# =====================================================
-TEAM_SERVICE_URL = "http://localhost:8002"
-SUPPORT_SERVICE_URL = "http://localhost:8004"
-
-async def call_team_service(method: str, endpoint: str, data: dict = None) -> dict:
-    """Team Service API 호출 (Circuit Breaker 적용)"""
-    
-    # 1. Circuit Breaker 확인
-    if not team_service_breaker.can_execute():
-        logger.warning("Team Service 호출 차단됨 (Circuit Open)")
-        return None
-    
-    # 2. 실제 호출
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        url = f"{TEAM_SERVICE_URL}{endpoint}"
-        try:
-            if method == "POST":
-                response = await client.post(url, json=data)
-            elif method == "GET":
-                response = await client.get(url)
-            elif method == "DELETE":
-                response = await client.delete(url)
-            else:
-                response = await client.request(method, url, json=data)
-            
-            if response.status_code >= 400:
-                logger.error(f"Team Service 호출 실패: {response.status_code}")
-                team_service_breaker.record_failure()
-                return None
-            
-            # 성공
-            team_service_breaker.record_success()
-            return response.json()
-            
-        except httpx.TimeoutException:
-            logger.error(f"Team Service 타임아웃: {url}")
-            team_service_breaker.record_failure()
-            return None
-        except Exception as e:
-            logger.error(f"Team Service 연결 실패: {str(e)}")
-            team_service_breaker.record_failure()
-            return None
-
-async def send_notification(user_id: str, message: str, link: str = "/"):
-    """Support Service에 알림 전송 (실패해도 계속 진행)"""
-    if not support_service_breaker.can_execute():
-        return
-    
-    async with httpx.AsyncClient(timeout=5.0) as client:
-        try:
-            await client.post(f"{SUPPORT_SERVICE_URL}/notifications", json={
-                "user_id": user_id,
-                "message": message,
-                "link": link,
-            })
-            support_service_breaker.record_success()
-        except Exception as e:
-            support_service_breaker.record_failure()
-            logger.warning(f"알림 전송 실패 (무시됨): {str(e)}")
-
 # =====================================================
 # 헬퍼 함수
 # =====================================================
@@ -161,20 +64,58 @@ def convert_position_type(position_str: str) -> StackCategory:
     }
     return mapping.get(position_str, StackCategory.BACKEND)
 
+# 목록 compact 형식의 필드 (호환용 중복 필드 id/authorId/startDate/endDate/testRequired/authorName 제외)
+COMPACT_FIELDS = (
+    "project_id", "type", "title", "description", "deadline", "views", "members", "tags", "position",
+    "method", "status", "user_id", "start_date", "end_date", "test_required", "recruitment_positions",
+)
+# ?format=compact 기본 필드 (모집 포지션 상세는 members/tags 요약으로 대신, 필요하면 fields로 요청)
+COMPACT_DEFAULT_FIELDS = tuple(f for f in COMPACT_FIELDS if f != "recruitment_positions")
+
 # =====================================================
 # 1. 프로젝트 목록 조회 (공개 API)
 # =====================================================
 @router.get("")
 async def get_projects(
+    request: Request,
     page: int = 1,
     size: int = 20,
     type: Optional[str] = None,
     status: Optional[str] = None,
-    db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = None,
+    format: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """프로젝트 목록 조회 (메인 페이지용)"""
+    """
+    프로젝트 목록 조회 (메인 페이지용)
+    
+    - cursor 지정 시 keyset 페이지네이션 (page 무시)
+    - 다음 페이지 커서는 X-Next-Cursor 응답 헤더로 전달 (마지막 페이지면 없음)
+    - 직렬화된 결과를 짧은 TTL로 캐시 (생성/수정/삭제, 지원 승인/거절 시 무효화)
+    - format=compact: 중복 호환 필드 없이 한 벌의 필드만, 모집 포지션 상세 제외
+    - fields=title,tags,...: compact 형식에서 지정한 필드만 (project_id는 항상 포함)
+    - Accept-Encoding: gzip이면 일정 크기 이상 응답은 압축
+    """
+    try:
+        list_format, list_fields = parse_list_format(format, fields, COMPACT_FIELDS, COMPACT_DEFAULT_FIELDS)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    accept_encoding = request.headers.get("accept-encoding", "")
+    
+    cache_key = project_list_cache.make_key(
+        "project_crud", page=page, size=size, type=type, status=status, cursor=cursor, fields=list_fields
+    )
+    cached = project_list_cache.get(cache_key)
+    if cached:
+        return to_response(cached, "HIT", accept_encoding)
+    generation = project_list_cache.generation
+    
     try:
-        query = select(Project).options(selectinload(Project.recruitment_positions))
+        query = select(Project).options(
+            selectinload(Project.recruitment_positions),
+            selectinload(Project.stacks),
+        )
         
         # 필터 적용
         if type:
@@ -189,16 +130,17 @@ async def get_projects(
             elif status == "진행중":
                 query = query.where(Project.status == ProjectStatus.PROCEEDING)
         
-        # 정렬 및 페이지네이션
-        query = query.order_by(Project.created_at.desc())
-        query = query.offset((page - 1) * size).limit(size)
+        # 정렬 및 페이지네이션 (cursor 있으면 keyset)
+        try:
+            query = paginate_projects(query, page, size, cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
         result = await db.execute(query)
-        projects = result.scalars().all()
+        projects, next_cursor = split_page(result.scalars().all(), size)
         
         project_list = []
         for p in projects:
-            logger.info(f"📋 프로젝트 {p.project_id}: {p.title}, 포지션 수: {len(p.recruitment_positions) if p.recruitment_positions else 0}")
             
             # 마감일 계산
             deadline = "D-?"
@@ -233,19 +175,12 @@ async def get_projects(
             
             members_str = ", ".join(members_parts) if members_parts else "0/0명"
             
-            # 기술 스택 추출
+            # 기술 스택 추출 (project_stack 인덱스 사용 - 행마다 JSON 파싱하지 않음)
             all_stacks = set()
-            for pos in p.recruitment_positions:
-                logger.info(f"  📦 포지션 {pos.position_type}: required_stacks = {repr(pos.required_stacks)}")
-                if pos.required_stacks:
-                    try:
-                        stacks = json.loads(pos.required_stacks) if isinstance(pos.required_stacks, str) else []
-                        logger.info(f"    → 파싱된 스택: {stacks}")
-                        all_stacks.update(stacks)
-                    except Exception as e:
-                        logger.error(f"    → 파싱 실패: {e}")
-            
-            logger.info(f"  📋 최종 tags: {list(all_stacks)}")
+            stacks_by_position = {}
+            for stack_row in p.stacks:
+                all_stacks.add(stack_row.stack)
+                stacks_by_position.setdefault(stack_row.position_type, []).append(stack_row.stack)
             
             project_list.append({
                 "id": p.project_id,
@@ -272,7 +207,7 @@ async def get_projects(
                 "recruitment_positions": [
                     {
                         "position_type": pos.position_type.value if pos.position_type else "UNKNOWN",
-                        "required_stacks": json.loads(pos.required_stacks) if isinstance(pos.required_stacks, str) and pos.required_stacks else [],
+                        "required_stacks": stacks_by_position.get(pos.position_type, []),
                         "target_count": pos.target_count or 0,
                         "current_count": pos.current_count or 0,
                         "recruitment_deadline": pos.recruitment_deadline.isoformat() if pos.recruitment_deadline else None,
@@ -280,8 +215,16 @@ async def get_projects(
                 ],
             })
         
-        return project_list
+        if list_fields:
+            project_list = [to_compact(item, list_fields) for item in project_list]
+        
+        entry = project_list_cache.put(
+            cache_key, generation, project_list, next_cursor, (p.project_id for p in projects), format=list_format
+        )
+        return to_response(entry, "MISS", accept_encoding)
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"프로젝트 목록 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"프로젝트 목록 조회 실패: {str(e)}")
@@ -290,7 +233,7 @@ async def get_projects(
 # 2. 프로젝트 상세 조회
 # =====================================================
 @router.get("/{project_id}")
-async def get_project_detail(project_id: int, db: AsyncSession = Depends(get_db)):
+async def get_project_detail(project_id: int, db: AsyncSession = Depends(get_read_db)):
     """프로젝트 상세 정보 조회"""
     try:
         query = select(Project).options(
@@ -303,9 +246,8 @@ async def get_project_detail(project_id: int, db: AsyncSession = Depends(get_db)
         if not project:
             raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
         
-        # 조회수 증가
-        project.views = (project.views or 0) + 1
-        await db.commit()
+        # 조회수 기록은 실제로 서빙되는 app/api/projects.py:get_project_detail에서 처리
+        views = (project.views or 0) + view_counter.pending_for(project_id)
         
         # 모집 포지션 정보
         positions = []
@@ -335,7 +277,7 @@ async def get_project_detail(project_id: int, db: AsyncSession = Depends(get_db)
             "start_date": project.start_date.isoformat() if project.start_date else None,
             "end_date": project.end_date.isoformat() if project.end_date else None,
             "test_required": project.test_required or False,
-            "views": project.views or 0,
+            "views": views,
             "created_at": project.created_at.isoformat() if project.created_at else None,
             "recruitment_positions": positions,
         }
@@ -347,18 +289,17 @@ async def get_project_detail(project_id: int, db: AsyncSession = Depends(get_db)
         raise HTTPException(status_code=500, detail=f"프로젝트 상세 조회 실패: {str(e)}")
 
 # =====================================================
-# 3. 프로젝트 생성 (보상 트랜잭션 적용)
+# 3. 프로젝트 생성 (Transactional Outbox 적용)
 # =====================================================
 @router.post("")
 async def create_project(project_data: dict, db: AsyncSession = Depends(get_db)):
     """
-    프로젝트 생성 + Team Service에 팀 생성 요청
+    프로젝트 생성 + Team Service 팀 생성 이벤트 기록 (Transactional Outbox)
     
-    보상 트랜잭션:
-    - 팀 생성 실패 시 프로젝트도 삭제 (롤백)
+    - 팀 생성 요청은 프로젝트와 같은 트랜잭션에 outbox 이벤트로 기록하고, 커밋 즉시 응답
+    - 릴레이가 커밋 후 Team Service에 전달 (실패 시 백오프 재시도)
+    - 재시도 한도 초과 시 프로젝트 삭제 (보상), 진행 상태는 GET /projects/{id}/creation-status
     """
-    project = None  # 보상용
-    
     try:
         logger.info(f"프로젝트 생성 요청: {project_data}")
         
@@ -416,6 +357,7 @@ async def create_project(project_data: dict, db: AsyncSession = Depends(get_db))
             logger.warning("⚠️ 모집 포지션 데이터가 비어있습니다!")
         
         total_target_count = 0
+        stack_pairs = []  # project_stack 인덱스용 (position_type, required_stacks)
         for pos_data in positions_data:
             logger.info(f"  - 포지션 처리 중: {pos_data}")
             position_type = convert_position_type(pos_data.get("position_type", "백엔드"))
@@ -444,13 +386,17 @@ async def create_project(project_data: dict, db: AsyncSession = Depends(get_db))
                 recruitment_deadline=recruit_deadline,
             )
             db.add(recruitment_position)
+            stack_pairs.append((position_type, required_stacks))
             total_target_count += target_count
             logger.info(f"  ✅ 포지션 추가됨: {position_type.value}, 인원: {target_count}")
         
+        # 기술 스택 정규화 인덱스 (목록 필터/태그용)
+        db.add_all(build_project_stack_rows(project_id, stack_pairs))
+        
         await db.flush()
         logger.info(f"✅ Step 2: 모집 포지션 생성됨 ({len(positions_data)}개)")
         
-        # ✅ Step 3: Team Service에 팀 생성 요청
+        # ✅ Step 3: 팀 생성 이벤트를 같은 트랜잭션에 기록 (원격 호출은 커밋 후 릴레이가 수행)
         team_data = {
             "project_id": project_id,
             "name": project_data.get("title", "새 프로젝트") + (" 개발팀" if project_type == ProjectType.PROJECT else " 스터디"),
@@ -458,23 +404,14 @@ async def create_project(project_data: dict, db: AsyncSession = Depends(get_db))
             "leader_position": project_data.get("leader_position", "백엔드"),
         }
         
-        team_response = await call_team_service("POST", "/api/v1/teams", team_data)
+        add_outbox_event(db, "project", project_id, TEAM_CREATE, team_data)
         
-        # ❌ 팀 생성 실패 시 보상 트랜잭션 실행
-        if team_response is None:
-            logger.error("❌ Team Service 호출 실패 - 보상 트랜잭션 실행")
-            
-            # 🔄 보상: 프로젝트 삭제 (롤백)
-            await db.rollback()
-            
-            raise HTTPException(
-                status_code=503,
-                detail="팀 서비스 연결 실패로 프로젝트 생성이 취소되었습니다. 잠시 후 다시 시도해주세요."
-            )
-        
-        # ✅ 모든 단계 성공 - 커밋
+        # ✅ 로컬 커밋 후 바로 응답 (팀 생성은 비동기 전달)
         await db.commit()
-        logger.info(f"✅ 프로젝트+팀 생성 완료 (Project ID: {project_id})")
+        project_list_cache.invalidate_all()
+        recommendation_service.invalidate_projects()
+        outbox_relay.notify()
+        logger.info(f"✅ 프로젝트 생성 완료, 팀 생성 대기 중 (Project ID: {project_id})")
         
         return {
             "status": "success",
@@ -484,7 +421,8 @@ async def create_project(project_data: dict, db: AsyncSession = Depends(get_db))
                 "title": project.title,
                 "type": project_type.value,
                 "total_positions": total_target_count,
-                "team": team_response,
+                "team_status": "PENDING",
+                "creation_status_url": f"/projects/{project_id}/creation-status",
             }
         }
         
@@ -495,6 +433,32 @@ async def create_project(project_data: dict, db: AsyncSession = Depends(get_db))
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"프로젝트 생성 실패: {str(e)}")
 
+@router.get("/{project_id}/creation-status")
+async def get_project_creation_status(project_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    프로젝트 생성 후속 작업(팀 생성) 진행 상태 조회
+    
+    - PENDING: 전달 대기/재시도 중
+    - SENT: 팀 생성 완료
+    - FAILED: 재시도 한도 초과 (프로젝트는 지원서와 함께 보상으로 삭제됨, 보상도 실패하면 last_error에 기록)
+    """
+    event = await get_latest_event(db, "project", project_id, TEAM_CREATE)
+    if not event:
+        raise HTTPException(status_code=404, detail="프로젝트 생성 기록을 찾을 수 없습니다.")
+    
+    team = json.loads(event.result).get("data") if event.result else None
+    return {
+        "status": "success",
+        "data": {
+            "project_id": project_id,
+            "team_status": event.status.value,
+            "attempts": event.attempts,
+            "last_error": event.last_error,
+            "next_attempt_at": event.next_attempt_at.isoformat() if event.status == OutboxStatus.PENDING else None,
+            "team": team,
+        }
+    }
+
 # =====================================================
 # 4. 프로젝트 수정
 # =====================================================
@@ -526,6 +490,8 @@ async def update_project(project_id: int, project_data: dict, db: AsyncSession =
         
         project.updated_at = datetime.now()
         await db.commit()
+        project_list_cache.invalidate_all()
+        recommendation_service.invalidate_projects()
         
         return {"status": "success", "message": "프로젝트가 수정되었습니다."}
         
@@ -559,7 +525,7 @@ async def delete_project(project_id: int, user_id: str = None, db: AsyncSession
             raise HTTPException(status_code=403, detail="프로젝트 삭제 권한이 없습니다.")
         
         # ✅ Step 1: Team Service에 팀 삭제 요청 (먼저!)
-        team_response = await call_team_service("DELETE", f"/api/v1/teams/by-project/{project_id}")
+        team_response = await msa_client.delete_team_by_project(project_id)
         
         # 팀 삭제 실패해도 프로젝트 삭제는 진행 (팀이 없을 수도 있음)
         if team_response is None:
@@ -568,6 +534,8 @@ async def delete_project(project_id: int, user_id: str = None, db: AsyncSession
         # ✅ Step 2: 프로젝트 삭제 (cascade로 관련 데이터 삭제)
         await db.delete(project)
         await db.commit()
+        project_list_cache.invalidate_all()
+        recommendation_service.invalidate_projects()
         
         logger.info(f"✅ 프로젝트 삭제 완료 (ID: {project_id})")
         
@@ -1,12 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.orm import selectinload
 from typing import List, Optional
 import json
 from app.models.project_recruitment import Project, Application, ProjectRecruitmentPosition
 from app.schemas.project import ProjectResponse, ApplicationResponse, ProjectDetailResponse, RecruitmentPositionResponse
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
+from app.utils.pagination import paginate_projects, split_page
+from app.utils.list_format import parse_list_format, to_compact
+from app.services.project_list_cache import project_list_cache, to_response
+from app.utils.projections import PROJECT_LIST_COLUMNS, load_positions
+from app.utils.etag import etag_matches, make_etag
+from app.services.view_counter import view_counter
+from app.utils.msa_client import INTERNAL_TOKEN_HEADER
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
@@ -24,62 +31,148 @@ def _parse_required_stacks(required_stacks) -> List[str]:
             return []
     return []
 
+def build_project_detail_response(project, positions=None) -> ProjectDetailResponse:
+    """
+    프로젝트를 상세 응답으로 변환
+    - ORM 객체: positions 생략 시 recruitment_positions 사용 (로드 필요)
+    - 목록용 Row(PROJECT_LIST_COLUMNS): positions에 POSITION_LIST_COLUMNS Row 목록 전달
+    """
+    if positions is None:
+        positions = project.recruitment_positions or []
+    return ProjectDetailResponse(
+        project_id=project.project_id,
+        user_id=project.user_id,
+        type=project.type.value if hasattr(project.type, 'value') else project.type,
+        title=project.title,
+        description=project.description,
+        method=project.method.value if hasattr(project.method, 'value') else project.method,
+        status=project.status.value if hasattr(project.status, 'value') else project.status,
+        start_date=project.start_date,
+        end_date=project.end_date,
+        test_required=project.test_required,
+        views=project.views,
+        created_at=project.created_at,
+        updated_at=project.updated_at,
+        recruitment_positions=[
+            RecruitmentPositionResponse(
+                position_type=pos.position_type.value if hasattr(pos.position_type, 'value') else str(pos.position_type),
+                required_stacks=_parse_required_stacks(pos.required_stacks),
+                target_count=pos.target_count or 0,
+                current_count=pos.current_count or 0,
+                recruitment_deadline=pos.recruitment_deadline
+            ) for pos in positions
+        ]
+    )
+
+# 목록 compact 형식에서 고를 수 있는 필드 (전체 형식과 같은 이름/순서)
+LIST_FIELDS = tuple(ProjectDetailResponse.model_fields)
+# ?format=compact 기본 필드 (모집 포지션 상세와 목록에서 항상 비어 있는 author_name 제외, 필요하면 fields로 요청)
+LIST_COMPACT_DEFAULT_FIELDS = tuple(f for f in LIST_FIELDS if f not in ("recruitment_positions", "author_name"))
+
+def build_project_list_query(page: int, size: int, type: Optional[str] = None, status: Optional[str] = None,
+                             cursor: Optional[str] = None):
+    """GET /projects 목록 쿼리 (잘못된 cursor면 ValueError)"""
+    # ORM 엔티티 대신 필요한 컬럼만 Row로 조회
+    query = select(*PROJECT_LIST_COLUMNS)
+    
+    if type:
+        query = query.where(Project.type == type)
+    if status:
+        query = query.where(Project.status == status)
+    
+    # 최신순 정렬 및 페이지네이션 (다음 커서는 X-Next-Cursor 헤더)
+    return paginate_projects(query, page, size, cursor)
+
 @router.get("", response_model=List[ProjectDetailResponse])
 async def get_projects(
+    request: Request,
     page: int = 1,
     size: int = 20,
     type: str = None,
     status: str = None,
-    db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = None,
+    format: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """프로젝트 목록 조회 (공개 API - 인증 불필요)"""
-    query = select(Project).options(selectinload(Project.recruitment_positions))
-    
-    if type:
-        query = query.where(Project.type == type)
-    if status:
-        query = query.where(Project.status == status)
+    """
+    프로젝트 목록 조회 (공개 API - 인증 불필요, cursor 지정 시 keyset 페이지네이션, 짧은 TTL 캐시, gzip 지원)
+    - format=compact: 모집 포지션 상세 없이 기본 필드만
+    - fields=title,views,...: 지정한 필드만 (project_id는 항상 포함)
+    """
+    try:
+        list_format, list_fields = parse_list_format(format, fields, LIST_FIELDS, LIST_COMPACT_DEFAULT_FIELDS)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    accept_encoding = request.headers.get("accept-encoding", "")
+    cache_key = project_list_cache.make_key(
+        "projects", page=page, size=size, type=type, status=status, cursor=cursor, fields=list_fields
+    )
+    cached = project_list_cache.get(cache_key)
+    if cached:
+        return to_response(cached, "HIT", accept_encoding)
+    generation = project_list_cache.generation
     
-    # 최신순 정렬 및 페이지네이션
-    query = query.order_by(Project.created_at.desc())
-    query = query.offset((page - 1) * size).limit(size)
+    try:
+        query = build_project_list_query(page, size, type, status, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     result = await db.execute(query)
-    projects = result.scalars().all()
+    projects, next_cursor = split_page(result.all(), size)
+    # 모집 포지션을 넣지 않는 compact 형식이면 포지션 조회 생략
+    with_positions = list_fields is None or "recruitment_positions" in list_fields
+    positions = await load_positions(db, (p.project_id for p in projects)) if with_positions else {}
+    payload = [build_project_detail_response(p, positions.get(p.project_id, [])) for p in projects]
+    if list_fields:
+        payload = [to_compact(item.model_dump(include=set(list_fields)), list_fields) for item in payload]
     
-    return [
-        ProjectDetailResponse(
-            project_id=p.project_id,
-            user_id=p.user_id,
-            type=p.type.value if hasattr(p.type, 'value') else p.type,
-            title=p.title,
-            description=p.description,
-            method=p.method.value if hasattr(p.method, 'value') else p.method,
-            status=p.status.value if hasattr(p.status, 'value') else p.status,
-            start_date=p.start_date,
-            end_date=p.end_date,
-            test_required=p.test_required,
-            views=p.views,
-            created_at=p.created_at,
-            updated_at=p.updated_at,
-            recruitment_positions=[
-                RecruitmentPositionResponse(
-                    position_type=pos.position_type.value if hasattr(pos.position_type, 'value') else str(pos.position_type),
-                    required_stacks=_parse_required_stacks(pos.required_stacks),
-                    target_count=pos.target_count or 0,
-                    current_count=pos.current_count or 0,
-                    recruitment_deadline=pos.recruitment_deadline
-                ) for pos in (p.recruitment_positions or [])
-            ]
-        ) for p in projects
-    ]
+    entry = project_list_cache.put(
+        cache_key, generation, payload, next_cursor, (p.project_id for p in projects), format=list_format
+    )
+    return to_response(entry, "MISS", accept_encoding)
+
+async def get_project_version(db: AsyncSession, project_id: int) -> Optional[tuple]:
+    """
+    상세 응답 ETag용 버전 (집계 쿼리 한 번, 본문 컬럼/포지션 객체는 읽지 않음)
+    - 포지션은 개수/최종 수정 시각/현재 인원 합계
+    - 조회수는 포함하지 않음 (조회마다 바뀌어 재검증이 항상 빗나가므로, 304 동안의 조회수는 다소 오래될 수 있음)
+    """
+    result = await db.execute(
+        select(
+            Project.updated_at,
+            func.count(ProjectRecruitmentPosition.position_type),
+            func.max(ProjectRecruitmentPosition.updated_at),
+            func.sum(ProjectRecruitmentPosition.current_count),
+        )
+        .outerjoin(ProjectRecruitmentPosition, ProjectRecruitmentPosition.project_id == Project.project_id)
+        .where(Project.project_id == project_id)
+        .group_by(Project.project_id)
+    )
+    row = result.first()
+    return tuple(row) if row else None
 
 @router.get("/{project_id}", response_model=ProjectDetailResponse)
 async def get_project_detail(
     project_id: int,
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """프로젝트 상세 정보 조회 (다른 서비스에서 호출)"""
+    """프로젝트 상세 정보 조회 (다른 서비스에서 호출, If-None-Match가 같으면 304)"""
+    version = await get_project_version(db, project_id)
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+    
+    etag = make_etag(project_id, *version)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    
     query = select(Project).options(selectinload(Project.recruitment_positions)).where(Project.project_id == project_id)
     result = await db.execute(query)
     project = result.scalar_one_or_none()
@@ -90,35 +183,19 @@ async def get_project_detail(
             detail="Project not found"
         )
     
-    return ProjectDetailResponse(
-        project_id=project.project_id,
-        user_id=project.user_id,
-        type=project.type.value if hasattr(project.type, 'value') else project.type,
-        title=project.title,
-        description=project.description,
-        method=project.method.value if hasattr(project.method, 'value') else project.method,
-        status=project.status.value if hasattr(project.status, 'value') else project.status,
-        start_date=project.start_date,
-        end_date=project.end_date,
-        test_required=project.test_required,
-        views=project.views,
-        created_at=project.created_at,
-        updated_at=project.updated_at,
-        recruitment_positions=[
-            RecruitmentPositionResponse(
-                position_type=pos.position_type.value if hasattr(pos.position_type, 'value') else str(pos.position_type),
-                required_stacks=_parse_required_stacks(pos.required_stacks),
-                target_count=pos.target_count or 0,
-                current_count=pos.current_count or 0,
-                recruitment_deadline=pos.recruitment_deadline
-            ) for pos in (project.recruitment_positions or [])
-        ]
-    )
+    # 조회수 증가 (write-behind: 카운터에만 기록하고 주기적으로 일괄 반영)
+    # 304 재검증과 다른 서비스의 내부 조회(X-Internal-Token)는 사용자 조회가 아니므로 집계하지 않음
+    if INTERNAL_TOKEN_HEADER not in request.headers:
+        view_counter.record(project_id)
+    
+    detail = build_project_detail_response(project)
+    detail.views = (project.views or 0) + view_counter.pending_for(project_id)
+    return detail
 
 @router.get("/{project_id}/basic", response_model=ProjectResponse)
 async def get_project_basic(
     project_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """프로젝트 기본 정보만 조회 (가벼운 조회용)"""
     query = select(Project).where(Project.project_id == project_id)
@@ -143,7 +220,7 @@ async def get_project_basic(
 @router.post("/batch", response_model=List[ProjectResponse])
 async def get_projects_batch(
     project_ids: List[int],
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """여러 프로젝트 정보 일괄 조회"""
     query = select(Project).where(Project.project_id.in_(project_ids))
@@ -161,19 +238,22 @@ async def get_projects_batch(
         ) for project in projects
     ]
 
+def build_project_applications_query(project_id: int, status: Optional[str] = None):
+    """GET /projects/{project_id}/applications 지원서 목록 쿼리"""
+    query = select(Application).where(Application.project_id == project_id)
+    
+    if status:
+        query = query.where(Application.status == status)
+    return query
+
 @router.get("/{project_id}/applications", response_model=List[ApplicationResponse])
 async def get_project_applications(
     project_id: int,
     status: Optional[str] = None,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """프로젝트의 지원서 목록 조회"""
-    query = select(Application).where(Application.project_id == project_id)
-    
-    if status:
-        query = query.where(Application.status == status)
-    
-    result = await db.execute(query)
+    result = await db.execute(build_project_applications_query(project_id, status))
     applications = result.scalars().all()
     
     return [
@@ -190,7 +270,7 @@ async def get_project_applications(
 @router.get("/applications/{application_id}", response_model=ApplicationResponse)
 async def get_application_detail(
     application_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """지원서 상세 정보 조회"""
     query = select(Application).where(Application.application_id == application_id)
@@ -0,0 +1,32 @@
+"""
+기술 스택 기반 프로젝트 추천 API
+"""
+from fastapi import APIRouter, HTTPException, Query
+import logging
+
+from app.services.recommendations import recommendation_service
+from app.utils.msa_client import msa_client
+
+logger = logging.getLogger(__name__)
+
+# /projects/{project_id} 경로와 겹치지 않도록 별도 prefix 사용
+router = APIRouter(prefix="/recommendations", tags=["recommendations"])
+
+
+@router.get("/projects")
+async def get_recommended_projects(
+    user_id: str = Query(..., description="추천 대상 사용자 ID"),
+    limit: int = Query(20, ge=1, le=100),
+):
+    """
+    사용자 기술 스택과 모집 중인 포지션의 요구 스택이 많이 겹치는 순서로 프로젝트 추천
+    - score: 겹치는 스택 수, 같은 점수는 최신순
+    """
+    stacks = await msa_client.get_user_stacks(user_id)
+    if stacks is None:
+        raise HTTPException(status_code=503, detail="사용자 기술 스택을 조회할 수 없습니다. 잠시 후 다시 시도해주세요.")
+
+    items = await recommendation_service.recommend(
+        user_id, (stack.get("stack_name") for stack in stacks), limit
+    )
+    return {"status": "success", "data": items}
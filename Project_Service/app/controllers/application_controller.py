@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.deps import get_db
+from app.core.deps import get_db, get_read_db
 from app.schemas.project_recruitment import (
     ApplicationCreate, ApplicationUpdate, ApplicationResponse, 
     ApplicationListResponse, ApplicationFilters
@@ -80,7 +80,7 @@ async def get_project_applications(
     position_type: Optional[str] = Query(None, description="포지션 타입 필터"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(10, ge=1, le=100, description="페이지 크기"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     ## 프로젝트 지원서 목록 조회
@@ -158,7 +158,7 @@ async def get_project_applications(
 
 
 @router.get("/{application_id}", response_model=ApplicationResponse)
-async def get_application_detail(application_id: int, db: AsyncSession = Depends(get_db)):
+async def get_application_detail(application_id: int, db: AsyncSession = Depends(get_read_db)):
     """Get application detail"""
     try:
         from sqlalchemy import select
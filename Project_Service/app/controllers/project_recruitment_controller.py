@@ -1,34 +1,25 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
 from typing import List, Dict, Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.deps import get_db
+from app.core.deps import get_db, get_read_db
 from app.repositories.project_recruitment_repository import ProjectRecruitmentRepository
 from app.schemas.project_recruitment import (
     ProjectFilters, ProjectCreate, ProjectUpdate, ProjectStatusUpdate,
     ProjectDetail, ProjectListResponse, ProjectSummary
 )
 from app.models.project_recruitment import ProjectStatus
+from app.services.view_counter import view_counter
+from app.services.project_list_cache import project_list_cache
+from app.services.recommendations import recommendation_service
+from app.services.db_health import db_health  # DB 연결 상태 (백그라운드 프로버 캐시)
+from app.storage.memory_store import memory_store  # DB 장애 시 저장소 (ID 인덱스 + 변경 journal)
 from datetime import datetime
 import json
 
 router = APIRouter(prefix="/recruitment-projects", tags=["Project Recruitment"])
 
-# 메모리 기반 프로젝트 저장소 (DB 연결 실패 시 사용)
-memory_projects = []
-next_project_id = 1000
-
-# DB 연결 상태 확인 함수
-async def is_db_available() -> bool:
-    try:
-        from sqlalchemy import text
-        from app.core.database import AsyncSessionLocal
-        async with AsyncSessionLocal() as session:
-            # SQLite의 경우 간단한 쿼리로 연결 확인
-            await session.execute(text("SELECT 1"))
-            return True
-    except Exception as e:
-        print(f"DB 연결 실패: {e}")
-        return False
+# DB 연결 실패 중 생성한 프로젝트는 memory_store에 이 번호부터 저장 (샘플 데이터 ID와 겹치지 않도록)
+MEMORY_PROJECT_ID_START = 1000
 
 @router.post("", 
     status_code=status.HTTP_201_CREATED, 
@@ -64,11 +55,13 @@ async def create_project(project_data: ProjectCreate, db: AsyncSession = Depends
     print(f"🔍 프로젝트 데이터 dict: {project_data.dict()}")
     try:
         # DB 연결 확인
-        if await is_db_available():
+        if db_health.is_up:
             repo = ProjectRecruitmentRepository(db)
             project_dict = project_data.dict()
             # user_id를 임시로 설정 (실제로는 인증에서 가져와야 함)
             project = await repo.create_project(project_dict, "1")
+            project_list_cache.invalidate_all()
+            recommendation_service.invalidate_projects()
             
             return ProjectDetail(
                 id=project.project_id,
@@ -101,7 +94,7 @@ async def create_project(project_data: ProjectCreate, db: AsyncSession = Depends
             )
         else:
             # 메모리 기반 저장소에 프로젝트 추가
-            global next_project_id
+            next_project_id = max(memory_store.next_id, MEMORY_PROJECT_ID_START)
             print(f"🔍 메모리 저장소 사용 - 받은 데이터: {project_data.dict()}")
             new_project = {
                 "id": next_project_id,
@@ -133,9 +126,8 @@ async def create_project(project_data: ProjectCreate, db: AsyncSession = Depends
                 ]
             }
             
-            # 메모리에 저장
-            memory_projects.append(new_project)
-            next_project_id += 1
+            # 메모리에 저장 (journal에 한 줄 추가)
+            new_project = memory_store.create_project(new_project)
             
             print(f"✅ 메모리에 저장된 프로젝트: {new_project}")
             
@@ -179,7 +171,8 @@ async def get_project_list(
     tech_stack: Optional[str] = Query(None, description="기술 스택 필터"),
     page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작)"),
     size: int = Query(10, ge=1, le=100, description="페이지 크기 (1-100)"),
-    db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (지정 시 page 무시)"),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     ## 프로젝트 목록 조회
@@ -192,24 +185,26 @@ async def get_project_list(
     - **tech_stack**: 기술 스택으로 필터링
     - **page**: 페이지 번호
     - **size**: 페이지당 항목 수
+    - **cursor**: 이전 응답의 next_cursor (깊은 페이지도 일정한 속도로 조회)
     
     ### 반환값:
-    - 프로젝트 목록과 페이지네이션 정보
+    - 프로젝트 목록과 페이지네이션 정보 (next_cursor 포함)
     """
     print(f"🔍 API 호출됨: GET /recruitment-projects (page={page}, size={size})")
     try:
         # DB 연결 확인
-        if await is_db_available():
+        if db_health.is_up:
             repo = ProjectRecruitmentRepository(db)
             filters = ProjectFilters(
                 type=type,
                 status=status,
                 tech_stack=tech_stack,
                 page=page,
-                size=size
+                size=size,
+                cursor=cursor
             )
             
-            projects, total = await repo.get_projects_with_filters(filters)
+            projects, total, next_cursor = await repo.get_projects_with_filters(filters)
             
             project_list = []
             for project in projects:
@@ -261,7 +256,8 @@ async def get_project_list(
                 total=total,
                 page=page,
                 size=size,
-                total_pages=(total + size - 1) // size
+                total_pages=(total + size - 1) // size,
+                next_cursor=next_cursor
             )
         else:
             # Fallback to sample data + memory projects if DB is not available
@@ -402,7 +398,9 @@ async def get_project_list(
             ]
             
             # 메모리에 저장된 프로젝트들과 합치기
-            all_projects = sample_projects + memory_projects
+            all_projects = sample_projects + [
+                p for p in memory_store.get_all_projects() if p["id"] >= MEMORY_PROJECT_ID_START
+            ]
             
             return {
                 "projects": all_projects,
@@ -411,6 +409,8 @@ async def get_project_list(
                 "size": size,
                 "total_pages": 1
             }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         print(f"프로젝트 목록 조회 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -428,7 +428,7 @@ async def get_project_list(
 )
 async def get_project_detail(
     project_id: int = Path(..., description="조회할 프로젝트 ID"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     ## 프로젝트 상세 조회
@@ -444,13 +444,13 @@ async def get_project_detail(
     """
     try:
         # DB 연결 확인
-        if await is_db_available():
+        if db_health.is_up:
             repo = ProjectRecruitmentRepository(db)
             project = await repo.get_project_by_id(project_id)
             if not project:
                 raise HTTPException(status_code=404, detail="Project not found")
             
-            await repo.increment_views(project_id)
+            view_counter.record(project_id)  # write-behind 조회수 (주기적으로 일괄 반영)
             
             return ProjectDetail(
                 id=project.project_id,
@@ -459,7 +459,7 @@ async def get_project_detail(
                 type=project.type,
                 status=project.status,
                 method=project.method,
-                views=project.views + 1,
+                views=project.views + view_counter.pending_for(project_id),
                 user_id=project.user_id,
                 created_at=project.created_at,
                 updated_at=project.updated_at,
@@ -485,12 +485,12 @@ async def get_project_detail(
             # Fallback to sample data + memory projects if DB is not available
             print("DB 연결 실패, 샘플 데이터 사용")
             
-            # 메모리에서 해당 ID의 프로젝트 찾기
-            for project in memory_projects:
-                if project["id"] == project_id:
-                    # 조회수 증가
-                    project["views"] = project.get("views", 0) + 1
-                    return project
+            # 메모리에서 해당 ID의 프로젝트 찾기 (ID 인덱스 조회)
+            project = memory_store.get_project_by_id(project_id) if project_id >= MEMORY_PROJECT_ID_START else None
+            if project is not None:
+                # 조회수 증가 (조회마다 journal을 쓰지 않음 - 다음 compaction 스냅샷에 반영)
+                project["views"] = project.get("views", 0) + 1
+                return project
             
             # 기본 샘플 데이터에서 찾기
             if project_id == 1:
@@ -642,12 +642,14 @@ async def get_project_detail(
 async def update_project(project_id: int, project_data: ProjectUpdate, db: AsyncSession = Depends(get_db)):
     """Update project (only by project owner)"""
     try:
-        if await is_db_available():
+        if db_health.is_up:
             repo = ProjectRecruitmentRepository(db)
             project_dict = project_data.dict(exclude_unset=True)
             project = await repo.update_project(project_id, project_dict)
             if not project:
                 raise HTTPException(status_code=404, detail="Project not found")
+            project_list_cache.invalidate_all()
+            recommendation_service.invalidate_projects()
             return ProjectDetail.from_orm(project)
         else:
             raise HTTPException(status_code=503, detail="Database not available")
@@ -661,12 +663,14 @@ async def update_project(project_id: int, project_data: ProjectUpdate, db: Async
 async def update_project_status(project_id: int, status_data: ProjectStatusUpdate, db: AsyncSession = Depends(get_db)):
     """Update project status (only by project owner)"""
     try:
-        if await is_db_available():
+        if db_health.is_up:
             repo = ProjectRecruitmentRepository(db)
             status_value = ProjectStatus(status_data.status)
             success = await repo.update_project_status(project_id, status_value)
             if not success:
                 raise HTTPException(status_code=404, detail="Project not found")
+            project_list_cache.invalidate_all()
+            recommendation_service.invalidate_projects()
             return {"message": "Status updated successfully"}
         else:
             raise HTTPException(status_code=503, detail="Database not available")
@@ -704,17 +708,18 @@ async def delete_project(
     """
     print(f"🗑️ 프로젝트 삭제 요청: ID {project_id}")
     try:
-        if await is_db_available():
+        if db_health.is_up:
             repo = ProjectRecruitmentRepository(db)
             success = await repo.delete_project(project_id)
             if not success:
                 raise HTTPException(status_code=404, detail="Project not found")
+            project_list_cache.invalidate_all()
+            recommendation_service.invalidate_projects()
             print(f"✅ 프로젝트 {project_id} 삭제 완료")
             return {"message": "Project deleted successfully"}
         else:
             # 메모리에서 프로젝트 삭제
-            global memory_projects
-            memory_projects = [p for p in memory_projects if p["id"] != project_id]
+            memory_store.delete_project(project_id)
             print(f"✅ 메모리에서 프로젝트 {project_id} 삭제 완료")
             return {"message": "Project deleted successfully"}
     except Exception as e:
@@ -12,6 +12,20 @@ engine = create_async_engine(
 )
 AsyncSessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
 
+# 읽기 전용 엔진/세션 (GET 핸들러용)
+# - AUTOCOMMIT: 문장마다 바로 끝나므로 요청 끝의 COMMIT 왕복이 없음 (READ COMMITTED처럼 항상 최신 커밋을 읽음)
+# - DATABASE_REPLICA_URL이 있으면 복제본, 없으면 primary에 접속 (쓰기 풀과 분리된 커넥션 풀)
+# - 열린 트랜잭션이 없으므로 커넥션 반환 시 ROLLBACK(reset)도 생략
+read_engine = create_async_engine(
+    settings.DATABASE_REPLICA_URL or settings.DATABASE_URL,
+    echo=False,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    isolation_level="AUTOCOMMIT",
+    pool_reset_on_return=None,
+)
+ReadSessionLocal = async_sessionmaker(bind=read_engine, expire_on_commit=False, autoflush=False, class_=AsyncSession)
+
 class Base(DeclarativeBase):
     pass
 
@@ -47,4 +61,10 @@ async def get_db():
             await session.rollback()
             raise
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
+
+
+async def get_read_db():
+    """읽기 전용 세션 (flush/commit 없음 - 쓰기가 있는 핸들러는 get_db 사용)"""
+    async with ReadSessionLocal() as session:
+        yield session
@@ -1,9 +1,15 @@
 # app/core/deps.py
-from fastapi import Depends, HTTPException, status
+import secrets
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.security import cognito_verifier
-from app.core.database import AsyncSessionLocal
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, get_read_db  # get_read_db: GET 핸들러용 읽기 전용 세션
+from app.utils.msa_client import INTERNAL_TOKEN_HEADER
+
+# 토큰 미설정(로컬 개발) 시 /internal 호출을 허용할 클라이언트 주소
+LOOPBACK_HOSTS = {"127.0.0.1", "::1", "localhost"}
 
 # Swagger UI에서 'Authorize' 버튼을 통해 토큰을 입력받을 수 있게 해줍니다.
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
@@ -36,4 +42,23 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         )
     
     # 3. 인증된 유저의 정보를 반환 (나중에 클래스 객체로 변환 가능)
-    return payload
\ No newline at end of file
+    return payload
+
+
+async def verify_internal_service(request: Request) -> None:
+    """
+    /internal 라우트 전용 - 다른 MSA 서비스의 호출인지 확인합니다.
+    INTERNAL_SERVICE_TOKEN이 설정되어 있으면 X-Internal-Token 헤더가 일치해야 하고,
+    설정되어 있지 않으면 loopback 주소에서 온 호출만 허용합니다.
+    """
+    if settings.INTERNAL_SERVICE_TOKEN:
+        token = request.headers.get(INTERNAL_TOKEN_HEADER, "")
+        if secrets.compare_digest(token.encode(), settings.INTERNAL_SERVICE_TOKEN.encode()):
+            return
+    elif request.client and request.client.host in LOOPBACK_HOSTS:
+        return
+
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Internal service access only",
+    )
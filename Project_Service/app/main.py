@@ -6,6 +6,12 @@ from app.core.exceptions import BusinessException
 from prometheus_fastapi_instrumentator import Instrumentator
 from app.core.middleware import LoggingMiddleware
 from app.controllers import all_routers
+from app.utils.msa_client import msa_client, register_pool_metrics
+from app.services.view_counter import view_counter
+from app.services.outbox_relay import outbox_relay
+from app.services.notification_queue import notification_queue
+from app.services.db_health import db_health
+from app.services.user_profile_cache import register_user_profile_cache_metrics
 # from app.controllers.project_controller import router as project_router  # Temporarily disabled
 
 # MSA API 라우터 추가
@@ -13,6 +19,8 @@ from app.api.projects import router as projects_router
 from app.api.enriched_projects import router as enriched_router
 from app.api.project_crud import router as project_crud_router
 from app.api.applications import router as applications_router
+from app.api.recommendations import router as recommendations_router
+from app.api.internal import router as internal_router
 
 app = FastAPI(
     title="Portforge Project Collaboration Platform API",
@@ -47,6 +55,7 @@ app.add_middleware(
     allow_credentials=False,  # credentials를 False로 설정 (allow_origins=["*"]와 함께 사용 시 필요)
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # 커서 페이지네이션 헤더를 FE에서 읽을 수 있도록
 )
 
 # 2. 로그 미들웨어 등록
@@ -54,6 +63,8 @@ app.add_middleware(LoggingMiddleware)
 
 # 3. 프로메테우스 메트릭 설정 (자동으로 /metrics 엔드포인트 생성)
 Instrumentator().instrument(app).expose(app)
+register_pool_metrics()  # MSAClient 커넥션 풀 상태
+register_user_profile_cache_metrics()  # Auth 사용자 정보 캐시 적중률/크기
 
 # 4. 반복문으로 새 컨트롤러(api) 자동 등록
 for router, prefix, tag in all_routers:
@@ -64,10 +75,29 @@ app.include_router(projects_router)  # /projects 경로 (기존 조회용)
 app.include_router(enriched_router)  # /enriched 경로
 app.include_router(project_crud_router)  # /projects 경로 (CRUD용)
 app.include_router(applications_router)  # /projects/{id}/applications 경로
+app.include_router(recommendations_router)  # /recommendations 경로
+app.include_router(internal_router)  # /internal 경로 (서비스 간 캐시 무효화)
 
 # 6. Explicitly include project router to ensure it's always available (temporarily disabled)
 # app.include_router(project_router, tags=["Projects"])
 
+# MSA 통신용 공유 커넥션 풀 생성/정리 + 백그라운드 작업 (DB 헬스 체크, 조회수 반영, outbox 릴레이, 알림 큐)
+@app.on_event("startup")
+async def startup_event():
+    await msa_client.startup()
+    db_health.start()
+    view_counter.start()
+    outbox_relay.start()
+    notification_queue.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await view_counter.stop()  # 남은 조회수 최종 반영
+    await outbox_relay.stop()
+    await notification_queue.stop()  # 남은 알림 전송
+    await db_health.stop()
+    await msa_client.aclose()
+
 # 전역 예외 핸들러: 한 번 등록하면 팀원들은 신경 안 써도 됨
 @app.exception_handler(BusinessException)
 async def business_exception_handler(request: Request, exc: BusinessException):
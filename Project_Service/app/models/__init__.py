@@ -2,6 +2,7 @@
 from .project_recruitment import (
     Project, 
     ProjectRecruitmentPosition, 
+    ProjectStack,
     ProjectType, 
     ProjectMethod, 
     ProjectStatus,
@@ -11,6 +12,9 @@ from .project_recruitment import (
     TechStack
 )
 
+# Transactional Outbox (별도 파일)
+from .outbox import OutboxEvent, OutboxStatus
+
 # Report 모델 (별도 파일)
 try:
     from .report import Report, ReportReason, ReportStatus
@@ -22,6 +26,7 @@ except ImportError:
 __all__ = [
     "Project",
     "ProjectRecruitmentPosition",
+    "ProjectStack",
     "ProjectType",
     "ProjectMethod",
     "ProjectStatus",
@@ -29,6 +34,8 @@ __all__ = [
     "ApplicationStatus",
     "Application",
     "TechStack",
+    "OutboxEvent",
+    "OutboxStatus",
     "Report",
     "ReportReason",
     "ReportStatus",
@@ -0,0 +1,37 @@
+from sqlalchemy import Column, Integer, BigInteger, String, Text, DateTime, Enum, Index
+from sqlalchemy.sql import func
+from app.core.database import Base
+import enum
+
+
+class OutboxStatus(enum.Enum):
+    PENDING = "PENDING"      # 전달 대기 (재시도 포함)
+    SENT = "SENT"            # 전달 완료
+    FAILED = "FAILED"        # 재시도 한도 초과
+
+
+class OutboxEvent(Base):
+    """
+    Transactional Outbox - 다른 서비스에 전달할 이벤트
+    업무 데이터와 같은 트랜잭션에서 기록하고, 릴레이(app/services/outbox_relay.py)가 커밋 후 전달합니다.
+    """
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        # 릴레이 폴링 (전달 대기 + 재시도 시각 도래)
+        Index("ix_outbox_events_status_next_attempt_at", "status", "next_attempt_at"),
+        # 생성 상태 조회 (프로젝트별 이벤트)
+        Index("ix_outbox_events_aggregate", "aggregate_type", "aggregate_id"),
+    )
+
+    event_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    aggregate_type = Column(String(50), nullable=False, comment="예: project")
+    aggregate_id = Column(BigInteger, nullable=False, comment="예: project_id (삭제 후에도 상태 조회 가능하도록 FK 없음)")
+    event_type = Column(String(50), nullable=False, comment="예: team.create")
+    payload = Column(Text, nullable=False, comment="JSON")
+    status = Column(Enum(OutboxStatus), nullable=False, default=OutboxStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=func.now())
+    last_error = Column(Text, nullable=True)
+    result = Column(Text, nullable=True, comment="전달 성공 시 응답 JSON")
+    created_at = Column(DateTime, nullable=False, default=func.now())
+    updated_at = Column(DateTime, nullable=True)
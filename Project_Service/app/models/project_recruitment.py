@@ -1,8 +1,9 @@
-from sqlalchemy import Column, Integer, BigInteger, String, Text, DateTime, Boolean, Enum, ForeignKey, Date
+from sqlalchemy import Column, Integer, BigInteger, String, Text, DateTime, Boolean, Enum, ForeignKey, Date, Index
 from sqlalchemy.dialects.mysql import CHAR
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
+from app.utils.stacks import STACK_NAME_MAX_LENGTH
 import enum
 
 
@@ -66,6 +67,12 @@ class TechStack(enum.Enum):
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        # 목록 keyset 페이지네이션 (created_at DESC, project_id DESC)
+        Index("ix_projects_created_at_project_id", "created_at", "project_id"),
+        # 상태/유형 필터 목록 (status, type) + 최신순 정렬
+        Index("ix_projects_status_type_created_at", "status", "type", "created_at", "project_id"),
+    )
 
     project_id = Column(BigInteger, primary_key=True, autoincrement=True)
     user_id = Column(CHAR(36), nullable=False, comment="🔗 팀장 ID")
@@ -79,11 +86,12 @@ class Project(Base):
     test_required = Column(Boolean, nullable=False, default=False)
     views = Column(Integer, nullable=False, default=0)
     created_at = Column(DateTime, nullable=False, default=func.now())
-    updated_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, nullable=True, onupdate=func.now())  # ETag 버전
 
     # Relationships
     recruitment_positions = relationship("ProjectRecruitmentPosition", back_populates="project", cascade="all, delete-orphan")
     applications = relationship("Application", back_populates="project", cascade="all, delete-orphan")
+    stacks = relationship("ProjectStack", back_populates="project", cascade="all, delete-orphan")
 
 
 class ProjectRecruitmentPosition(Base):
@@ -97,14 +105,38 @@ class ProjectRecruitmentPosition(Base):
     current_count = Column(Integer, nullable=False, default=0)
     recruitment_deadline = Column(Date, nullable=True)
     created_at = Column(DateTime, nullable=False, default=func.now())
-    updated_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, nullable=True, onupdate=func.now())  # ETag 버전
 
     # Relationships
     project = relationship("Project", back_populates="recruitment_positions")
 
 
+class ProjectStack(Base):
+    """포지션별 요구 기술 스택 정규화 인덱스 (required_stacks JSON 파싱 없이 스택 필터링)"""
+    __tablename__ = "project_stack"
+    __table_args__ = (
+        # 스택 → 프로젝트 조회 ("React AND TypeScript" 필터)
+        Index("ix_project_stack_stack_project_id", "stack", "project_id"),
+    )
+
+    project_id = Column(BigInteger, ForeignKey("projects.project_id", ondelete="CASCADE"), primary_key=True, nullable=False)
+    position_type = Column(Enum(PositionType), primary_key=True, nullable=False)
+    stack = Column(String(STACK_NAME_MAX_LENGTH), primary_key=True, nullable=False)
+
+    # Relationships
+    project = relationship("Project", back_populates="stacks")
+
+
 class Application(Base):
     __tablename__ = "applications"
+    __table_args__ = (
+        # 프로젝트별 지원자 목록 (최신순)
+        Index("ix_applications_project_id_created_at", "project_id", "created_at"),
+        # 중복 지원 확인 (project_id, user_id)
+        Index("ix_applications_project_id_user_id", "project_id", "user_id"),
+        # 사용자별 지원 현황 (최신순)
+        Index("ix_applications_user_id_created_at", "user_id", "created_at"),
+    )
 
     application_id = Column(BigInteger, primary_key=True, autoincrement=True)
     project_id = Column(BigInteger, ForeignKey("projects.project_id"), nullable=False)
@@ -112,6 +144,7 @@ class Application(Base):
     position_type = Column(Enum(PositionType), nullable=False)
     message = Column(Text, nullable=False)
     status = Column(Enum(ApplicationStatus), nullable=False, default=ApplicationStatus.PENDING)
+    decision_key = Column(String(64), nullable=True, comment="승인/거절 요청 멱등성 키")
     created_at = Column(DateTime, nullable=False, default=func.now())
     updated_at = Column(DateTime, nullable=True)
 
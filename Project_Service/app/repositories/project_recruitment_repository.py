@@ -1,12 +1,23 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func, update, delete
+from sqlalchemy import select, and_, or_, func, update, delete, case
 from sqlalchemy.orm import selectinload
-from app.models.project_recruitment import Project as RecruitmentProject, ProjectRecruitmentPosition, ProjectStatus
+from app.models.project_recruitment import Project as RecruitmentProject, ProjectRecruitmentPosition, ProjectStack, ProjectStatus, Application
 from app.schemas.project_recruitment import ProjectFilters
+from app.utils.pagination import paginate_projects, split_page
+from app.utils.stacks import parse_stack_index_names
 from math import ceil
 
 
+def build_project_stack_rows(project_id: int, positions: Iterable[Tuple[Any, Any]]) -> List[ProjectStack]:
+    """Build project_stack index rows from (position_type, required_stacks) pairs"""
+    return [
+        ProjectStack(project_id=project_id, position_type=position_type, stack=stack)
+        for position_type, required_stacks in positions
+        for stack in parse_stack_index_names(required_stacks)
+    ]
+
+
 class ProjectRecruitmentRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -38,6 +49,12 @@ class ProjectRecruitmentRepository:
             )
             self.db.add(position)
         
+        # Maintain normalized stack index
+        self.db.add_all(build_project_stack_rows(
+            project.project_id,
+            [(p["position_type"], p["required_stacks"]) for p in project_data["recruitment_positions"]]
+        ))
+        
         await self.db.commit()
         await self.db.refresh(project)
         return project
@@ -51,8 +68,11 @@ class ProjectRecruitmentRepository:
         )
         return result.scalar_one_or_none()
 
-    async def get_projects_with_filters(self, filters: ProjectFilters) -> tuple[List[RecruitmentProject], int]:
-        """Get projects with filtering and pagination"""
+    async def get_projects_with_filters(self, filters: ProjectFilters) -> tuple[List[RecruitmentProject], int, Optional[str]]:
+        """Get projects with filtering and pagination (keyset when filters.cursor is set)
+
+        Returns (projects, total, next_cursor). Raises ValueError on a malformed cursor.
+        """
         query = select(RecruitmentProject).options(selectinload(RecruitmentProject.recruitment_positions))
         
         # Apply filters
@@ -64,10 +84,14 @@ class ProjectRecruitmentRepository:
         if filters.status:
             conditions.append(RecruitmentProject.status == filters.status)
         
-        if filters.tech_stack:
-            # Filter projects that have positions with specific tech stack
-            subquery = select(ProjectRecruitmentPosition.project_id).where(
-                ProjectRecruitmentPosition.tech_stack.ilike(f"%{filters.tech_stack}%")
+        stacks = parse_stack_index_names(filters.tech_stack)  # 저장 시와 같은 규칙 (자르기/대소문자 중복 제거)
+        if stacks:
+            # Projects requiring ALL given stacks ("React,TypeScript"), answered from the project_stack index
+            subquery = (
+                select(ProjectStack.project_id)
+                .where(ProjectStack.stack.in_(stacks))
+                .group_by(ProjectStack.project_id)
+                .having(func.count(func.distinct(ProjectStack.stack)) == len(stacks))
             )
             conditions.append(RecruitmentProject.project_id.in_(subquery))  # Updated field name
         
@@ -83,13 +107,12 @@ class ProjectRecruitmentRepository:
         total = total_result.scalar()
         
         # Apply pagination and ordering
-        query = query.order_by(RecruitmentProject.created_at.desc())
-        query = query.offset((filters.page - 1) * filters.size).limit(filters.size)
+        query = paginate_projects(query, filters.page, filters.size, filters.cursor)
         
         result = await self.db.execute(query)
-        projects = result.scalars().all()
+        projects, next_cursor = split_page(result.scalars().all(), filters.size)
         
-        return projects, total
+        return projects, total, next_cursor
 
     async def update_project(self, project_id: int, project_data: Dict[str, Any]) -> Optional[RecruitmentProject]:
         """Update project and its recruitment positions"""
@@ -116,11 +139,20 @@ class ProjectRecruitmentRepository:
             for position_data in project_data["recruitment_positions"]:
                 position = ProjectRecruitmentPosition(
                     project_id=project_id,
-                    position_name=position_data["position_name"],
-                    tech_stack=position_data["tech_stack"],
-                    required_count=position_data["required_count"]
+                    position_type=position_data["position_type"],
+                    required_stacks=position_data["required_stacks"],
+                    target_count=position_data["target_count"],
+                    employment_type=position_data.get("employment_type"),
+                    recruitment_deadline=position_data.get("recruitment_deadline")
                 )
                 self.db.add(position)
+            
+            # Rebuild normalized stack index for the new positions
+            await self.db.execute(delete(ProjectStack).where(ProjectStack.project_id == project_id))
+            self.db.add_all(build_project_stack_rows(
+                project_id,
+                [(p["position_type"], p["required_stacks"]) for p in project_data["recruitment_positions"]]
+            ))
         
         await self.db.commit()
         await self.db.refresh(project)
@@ -136,6 +168,24 @@ class ProjectRecruitmentRepository:
         await self.db.commit()
         return result.rowcount > 0
 
+    async def add_views_batch(self, view_counts: Dict[int, int]) -> int:
+        """Add buffered view counts for many projects in a single UPDATE ... CASE statement"""
+        if not view_counts:
+            return 0
+        result = await self.db.execute(
+            update(RecruitmentProject)
+            .where(RecruitmentProject.project_id.in_(list(view_counts.keys())))
+            .values(
+                views=RecruitmentProject.views + case(
+                    view_counts, value=RecruitmentProject.project_id, else_=0
+                ),
+                updated_at=RecruitmentProject.updated_at,  # 조회수 반영은 수정 시각을 바꾸지 않음
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        return result.rowcount
+
     async def update_project_status(self, project_id: int, status: ProjectStatus) -> bool:
         """Update project status"""
         result = await self.db.execute(
@@ -155,12 +205,19 @@ class ProjectRecruitmentRepository:
         return result.scalar_one_or_none() is not None
     async def delete_project(self, project_id: int) -> bool:
         """Delete project permanently (hard delete)"""
-        # First delete related recruitment positions
+        # First delete related applications, recruitment positions and stack index rows
+        # (applications.project_id FK has no ON DELETE CASCADE, so the project delete would fail)
+        await self.db.execute(
+            delete(Application).where(Application.project_id == project_id)
+        )
         await self.db.execute(
             delete(ProjectRecruitmentPosition).where(
                 ProjectRecruitmentPosition.project_id == project_id
             )
         )
+        await self.db.execute(
+            delete(ProjectStack).where(ProjectStack.project_id == project_id)
+        )
         
         # Then delete the project
         result = await self.db.execute(
@@ -191,6 +191,7 @@ class ProjectListResponse(BaseModel):
     page: int = Field(..., description="현재 페이지")
     size: int = Field(..., description="페이지 크기")
     total_pages: int = Field(..., description="전체 페이지 수")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (keyset 페이지네이션, 마지막 페이지면 null)")
 
 
 class ApplicationListResponse(BaseModel):
@@ -208,6 +209,7 @@ class ProjectFilters(BaseModel):
     tech_stack: Optional[str] = Field(None, description="기술 스택 필터")
     page: int = Field(1, ge=1, description="페이지 번호")
     size: int = Field(10, ge=1, le=100, description="페이지 크기")
+    cursor: Optional[str] = Field(None, description="다음 페이지 커서 (지정 시 page 무시)")
 
 
 class ApplicationFilters(BaseModel):
@@ -0,0 +1,101 @@
+"""
+DB 헬스 프로버
+백그라운드에서 주기적으로 SELECT 1을 실행해 DB 가용 상태를 캐시합니다.
+요청 처리 중에는 캐시된 상태만 읽으므로 DB 왕복/세션 체크아웃이 추가되지 않습니다.
+- 히스테리시스: 연속 실패 N회에 DOWN, 연속 성공 M회에 UP (일시적 오류로 상태가 흔들리지 않도록)
+"""
+import asyncio
+import logging
+from typing import Optional
+
+from prometheus_client import Counter, Gauge
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import engine
+
+logger = logging.getLogger(__name__)
+
+DB_AVAILABLE = Gauge("db_available", "DB 가용 상태 (1=UP, 0=DOWN, 헬스 프로버 기준)")
+DB_STATE_TRANSITIONS = Counter("db_state_transitions_total", "DB 가용 상태 전환 횟수 (잦으면 flapping)", ["to"])
+
+
+class DBHealthProber:
+    """DB 가용 상태를 주기적으로 확인하여 캐시"""
+
+    def __init__(self, interval: float, timeout: float, failure_threshold: int, recovery_threshold: int):
+        self.interval = interval
+        self.timeout = timeout
+        self.failure_threshold = failure_threshold
+        self.recovery_threshold = recovery_threshold
+        self.is_up = True  # 첫 프로브 전에는 DB 사용을 시도
+        self._consecutive_failures = 0
+        self._consecutive_successes = 0
+        self._task: Optional[asyncio.Task] = None
+        DB_AVAILABLE.set(1)
+
+    async def _select_one(self) -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    async def _ping(self) -> bool:
+        try:
+            # 연결 체크아웃(풀 대기/TCP 연결)까지 포함해 timeout 적용
+            await asyncio.wait_for(self._select_one(), timeout=self.timeout)
+            return True
+        except Exception as e:
+            logger.warning(f"DB 헬스 체크 실패: {type(e).__name__} {str(e)}")
+            return False
+
+    def _set_state(self, is_up: bool) -> None:
+        if is_up == self.is_up:
+            return
+        self.is_up = is_up
+        DB_AVAILABLE.set(1 if is_up else 0)
+        DB_STATE_TRANSITIONS.labels(to="up" if is_up else "down").inc()
+        if is_up:
+            logger.info("🟢 DB 연결 복구 - DB 모드로 전환")
+        else:
+            logger.error("🔴 DB 연결 불가 - 메모리 저장소 모드로 전환")
+
+    async def probe(self) -> bool:
+        """한 번 확인하고 히스테리시스를 적용한 현재 상태 반환"""
+        if await self._ping():
+            self._consecutive_failures = 0
+            self._consecutive_successes += 1
+            if self._consecutive_successes >= self.recovery_threshold:
+                self._set_state(True)
+        else:
+            self._consecutive_successes = 0
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self.failure_threshold:
+                self._set_state(False)
+        return self.is_up
+
+    async def _run(self):
+        while True:
+            await self.probe()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """주기적 확인 시작 (app startup)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# 전역 인스턴스
+db_health = DBHealthProber(
+    interval=settings.DB_HEALTH_INTERVAL_SECONDS,
+    timeout=settings.DB_HEALTH_TIMEOUT_SECONDS,
+    failure_threshold=settings.DB_HEALTH_FAILURE_THRESHOLD,
+    recovery_threshold=settings.DB_HEALTH_RECOVERY_THRESHOLD,
+)
@@ -0,0 +1,130 @@
+"""
+Support Service 알림 전송 큐
+지원/승인/거절 요청에서 알림을 바로 보내지 않고 프로세스 내 큐에 넣은 뒤,
+백그라운드 sender가 모아서 POST /notifications/batch 한 번으로 전송합니다.
+- 사용자 요청은 Support Service 응답을 기다리지 않음
+- 큐가 가득 차거나 재시도 후에도 전송 실패 시 알림을 버리고 drop 카운터 증가 (알림은 best-effort)
+"""
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.core.config import settings
+from app.utils.msa_client import msa_client
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATIONS_SENT = Counter("notifications_sent_total", "Support Service에 전송된 알림 수")
+NOTIFICATIONS_DROPPED = Counter("notifications_dropped_total", "전송하지 못하고 버린 알림 수", ["reason"])
+NOTIFICATION_BATCH_SIZE = Histogram(
+    "notification_batch_size", "알림 일괄 전송 1회당 건수",
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+NOTIFICATION_QUEUE_DEPTH = Gauge("notification_queue_depth", "전송 대기 중인 알림 수")
+
+
+class NotificationQueue:
+    """알림을 모아 일괄 전송하는 백그라운드 큐"""
+
+    def __init__(self, max_size: int, batch_size: int, linger: float, retries: int):
+        self.batch_size = batch_size
+        self.linger = linger
+        self.retries = retries
+        self._queue: "asyncio.Queue[Dict]" = asyncio.Queue(maxsize=max_size)
+        self._task: Optional[asyncio.Task] = None
+        self._inflight: List[Dict] = []  # 큐에서 꺼냈지만 아직 전송 완료되지 않은 알림 (종료 시 재전송)
+        NOTIFICATION_QUEUE_DEPTH.set_function(self._queue.qsize)
+
+    def enqueue(self, user_id: str, message: str, link: str = "/") -> bool:
+        """알림 추가 (대기 없음, 큐가 가득 차면 버리고 False)"""
+        try:
+            self._queue.put_nowait({"user_id": user_id, "message": message, "link": link})
+            return True
+        except asyncio.QueueFull:
+            NOTIFICATIONS_DROPPED.labels(reason="queue_full").inc()
+            logger.warning(f"알림 큐 가득 참 - 알림 버림 (user: {user_id})")
+            return False
+
+    def enqueue_many(self, notifications: List[Dict]) -> int:
+        """여러 알림 추가 (user_id/message/link 딕셔너리 목록), 큐에 들어간 건수 반환"""
+        queued = 0
+        for notification in notifications:
+            if self.enqueue(notification["user_id"], notification["message"], notification.get("link", "/")):
+                queued += 1
+        return queued
+
+    async def _collect_batch(self, batch: List[Dict]) -> None:
+        """첫 알림을 기다린 뒤 batch_size 또는 linger 시간까지 batch에 추가로 모음"""
+        batch.append(await self._queue.get())
+        deadline = time.monotonic() + self.linger
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+    def _drain_nowait(self) -> List[Dict]:
+        batch = []
+        while not self._queue.empty() and len(batch) < self.batch_size:
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _send(self, batch: List[Dict]) -> bool:
+        """한 배치 전송 (짧은 간격으로 재시도, 최종 실패 시 버림)"""
+        for attempt in range(self.retries + 1):
+            if await msa_client.send_notifications_batch(batch) is not None:
+                NOTIFICATIONS_SENT.inc(len(batch))
+                NOTIFICATION_BATCH_SIZE.observe(len(batch))
+                return True
+            if attempt < self.retries:
+                await asyncio.sleep(0.5 * (2 ** attempt))
+
+        NOTIFICATIONS_DROPPED.labels(reason="send_failed").inc(len(batch))
+        logger.warning(f"알림 {len(batch)}건 전송 실패 (무시됨)")
+        return False
+
+    async def _run(self):
+        while True:
+            await self._collect_batch(self._inflight)
+            try:
+                await self._send(self._inflight)
+            except Exception as e:
+                NOTIFICATIONS_DROPPED.labels(reason="send_failed").inc(len(self._inflight))
+                logger.error(f"알림 전송 오류: {str(e)}")
+            self._inflight = []
+
+    def start(self) -> None:
+        """백그라운드 sender 시작 (app startup)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """sender 중지 후 남은 알림 전송 (graceful shutdown)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._inflight:
+            batch, self._inflight = self._inflight, []
+            await self._send(batch)
+        while not self._queue.empty():
+            await self._send(self._drain_nowait())
+
+
+# 전역 인스턴스
+notification_queue = NotificationQueue(
+    max_size=settings.NOTIFICATION_QUEUE_MAX_SIZE,
+    batch_size=settings.NOTIFICATION_BATCH_SIZE,
+    linger=settings.NOTIFICATION_LINGER_SECONDS,
+    retries=settings.NOTIFICATION_SEND_RETRIES,
+)
@@ -0,0 +1,245 @@
+"""
+Transactional Outbox 릴레이
+업무 트랜잭션에서 outbox_events에 기록한 이벤트를 커밋 이후 다른 서비스에 전달합니다.
+- 요청 처리 중에는 원격 호출을 하지 않으므로 DB 트랜잭션/커넥션을 오래 잡지 않음
+- 전달 실패 시 지수 백오프(+지터)로 재시도, 한도 초과 시 FAILED 처리 후 보상 작업 실행
+- 이벤트는 짧은 트랜잭션으로 임대(lease)한 뒤 트랜잭션 밖에서 전달 (여러 인스턴스 동시 실행 가능)
+"""
+import asyncio
+import json
+import logging
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from prometheus_client import Counter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.outbox import OutboxEvent, OutboxStatus
+from app.models.project_recruitment import Project
+from app.repositories.project_recruitment_repository import ProjectRecruitmentRepository
+from app.services.project_list_cache import project_list_cache
+from app.services.recommendations import recommendation_service
+from app.utils.msa_client import msa_client
+
+logger = logging.getLogger(__name__)
+
+TEAM_CREATE = "team.create"
+
+OUTBOX_DELIVERED = Counter("outbox_events_delivered_total", "전달 완료된 outbox 이벤트 수", ["event_type"])
+OUTBOX_RETRIES = Counter("outbox_event_retries_total", "전달 실패 후 재시도 예약된 횟수", ["event_type"])
+OUTBOX_FAILED = Counter("outbox_events_failed_total", "재시도 한도 초과로 실패 처리된 이벤트 수", ["event_type"])
+OUTBOX_COMPENSATION_FAILURES = Counter(
+    "outbox_compensation_failures_total", "최종 실패 이벤트의 보상 작업 실패 횟수 (수동 정리 필요)", ["event_type"]
+)
+
+
+def add_outbox_event(db: AsyncSession, aggregate_type: str, aggregate_id: int,
+                     event_type: str, payload: Dict[str, Any]) -> OutboxEvent:
+    """현재 트랜잭션에 outbox 이벤트 추가 (커밋은 호출자가 수행)"""
+    event = OutboxEvent(
+        aggregate_type=aggregate_type,
+        aggregate_id=aggregate_id,
+        event_type=event_type,
+        payload=json.dumps(payload, ensure_ascii=False),
+        status=OutboxStatus.PENDING,
+        attempts=0,
+        next_attempt_at=datetime.now(),
+        created_at=datetime.now(),
+    )
+    db.add(event)
+    return event
+
+
+async def get_latest_event(db: AsyncSession, aggregate_type: str, aggregate_id: int,
+                           event_type: str) -> Optional[OutboxEvent]:
+    """집합체(예: 프로젝트)의 가장 최근 이벤트 조회 (생성 상태 확인용)"""
+    result = await db.execute(
+        select(OutboxEvent)
+        .where(
+            OutboxEvent.aggregate_type == aggregate_type,
+            OutboxEvent.aggregate_id == aggregate_id,
+            OutboxEvent.event_type == event_type,
+        )
+        .order_by(OutboxEvent.event_id.desc())
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+class OutboxRelay:
+    """outbox_events를 폴링하여 전달하는 백그라운드 작업"""
+
+    def __init__(self, poll_interval: float, batch_size: int, max_attempts: int,
+                 backoff_base: float, backoff_max: float, lease_seconds: float):
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.lease_seconds = lease_seconds
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def notify(self) -> None:
+        """새 이벤트 커밋 직후 호출 - 다음 폴링 주기를 기다리지 않고 바로 전달"""
+        self._wakeup.set()
+
+    def _backoff(self, attempts: int) -> float:
+        """지수 백오프 + 지터 (동시에 실패한 이벤트들이 한꺼번에 재시도하지 않도록)"""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** max(attempts - 1, 0)))
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _claim_batch(self) -> List[Dict[str, Any]]:
+        """전달할 이벤트를 임대 (시도 횟수 증가 + 임대 시간만큼 다음 시도 시각 연기)"""
+        now = datetime.now()
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(OutboxEvent)
+                .where(OutboxEvent.status == OutboxStatus.PENDING, OutboxEvent.next_attempt_at <= now)
+                .order_by(OutboxEvent.next_attempt_at)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            events = result.scalars().all()
+            claimed = []
+            for event in events:
+                event.attempts += 1
+                event.next_attempt_at = now + timedelta(seconds=self.lease_seconds)
+                claimed.append({
+                    "event_id": event.event_id,
+                    "event_type": event.event_type,
+                    "aggregate_id": event.aggregate_id,
+                    "payload": json.loads(event.payload),
+                    "attempts": event.attempts,
+                })
+            await session.commit()
+            return claimed
+
+    async def _deliver(self, event: Dict[str, Any]) -> Optional[Dict]:
+        """이벤트 타입별 전달 (실패 시 None)"""
+        if event["event_type"] == TEAM_CREATE:
+            return await msa_client.create_team(event["payload"])
+        logger.error(f"알 수 없는 outbox 이벤트 타입: {event['event_type']}")
+        return None
+
+    async def _compensate(self, session: AsyncSession, event: Dict[str, Any]) -> None:
+        """재시도 한도 초과 시 보상 작업 (팀 생성 실패 → 프로젝트 삭제)"""
+        if event["event_type"] == TEAM_CREATE:
+            deleted = await ProjectRecruitmentRepository(session).delete_project(event["aggregate_id"])
+            if deleted:
+                project_list_cache.invalidate_all()
+                recommendation_service.invalidate_projects()
+                logger.warning(f"🔄 팀 생성 실패로 프로젝트 {event['aggregate_id']} 삭제 (보상)")
+
+    async def _process(self, event: Dict[str, Any]) -> bool:
+        event_type = event["event_type"]
+
+        # 전달 전에 프로젝트가 삭제되었으면 팀을 만들지 않음
+        if event_type == TEAM_CREATE:
+            async with AsyncSessionLocal() as session:
+                exists = await session.get(Project, event["aggregate_id"])
+            if exists is None:
+                await self._finish(event, OutboxStatus.FAILED, error="프로젝트가 삭제되어 전달하지 않음")
+                return False
+
+        try:
+            result = await self._deliver(event)
+            error = None if result is not None else f"{event_type} 전달 실패"
+        except Exception as e:
+            result, error = None, str(e)
+
+        if error is None:
+            await self._finish(event, OutboxStatus.SENT, result=result)
+            OUTBOX_DELIVERED.labels(event_type=event_type).inc()
+            return True
+
+        if event["attempts"] >= self.max_attempts:
+            await self._finish(event, OutboxStatus.FAILED, error=error, compensate=True)
+            OUTBOX_FAILED.labels(event_type=event_type).inc()
+            logger.error(f"❌ outbox 이벤트 {event['event_id']} 최종 실패 ({event['attempts']}회): {error}")
+        else:
+            delay = self._backoff(event["attempts"])
+            await self._finish(event, OutboxStatus.PENDING, error=error, retry_in=delay)
+            OUTBOX_RETRIES.labels(event_type=event_type).inc()
+            logger.warning(f"⚠️ outbox 이벤트 {event['event_id']} 전달 실패 - {delay:.1f}초 후 재시도 ({event['attempts']}/{self.max_attempts})")
+        return False
+
+    async def _finish(self, event: Dict[str, Any], status: OutboxStatus, result: Optional[Dict] = None,
+                      error: Optional[str] = None, retry_in: Optional[float] = None,
+                      compensate: bool = False) -> None:
+        """전달 결과 기록 (+ 필요 시 보상 작업)"""
+        async with AsyncSessionLocal() as session:
+            row = await session.get(OutboxEvent, event["event_id"])
+            if row is None:
+                return
+            row.status = status
+            row.last_error = error
+            row.updated_at = datetime.now()
+            if result is not None:
+                row.result = json.dumps(result, ensure_ascii=False, default=str)
+            if retry_in is not None:
+                row.next_attempt_at = datetime.now() + timedelta(seconds=retry_in)
+            await session.commit()
+
+            if compensate:
+                try:
+                    await self._compensate(session, event)
+                except Exception as e:
+                    # 보상 실패는 이벤트에 남겨 creation-status/메트릭으로 드러냄 (프로젝트가 팀 없이 남아 있음)
+                    await session.rollback()
+                    OUTBOX_COMPENSATION_FAILURES.labels(event_type=event["event_type"]).inc()
+                    logger.error(f"❌ outbox 보상 작업 실패 (event {event['event_id']}): {str(e)}")
+                    row = await session.get(OutboxEvent, event["event_id"])
+                    row.last_error = f"{error} / 보상 작업 실패: {str(e)}"
+                    row.updated_at = datetime.now()
+                    await session.commit()
+
+    async def relay_once(self) -> int:
+        """전달 대기 이벤트를 한 번 처리하고 성공 건수 반환"""
+        events = await self._claim_batch()
+        if not events:
+            return 0
+        results = await asyncio.gather(*(self._process(event) for event in events))
+        return sum(1 for ok in results if ok)
+
+    async def _run(self):
+        while True:
+            try:
+                await self.relay_once()
+            except Exception as e:
+                logger.error(f"outbox 릴레이 오류: {str(e)}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def start(self) -> None:
+        """릴레이 시작 (app startup)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """릴레이 중지 (남은 이벤트는 DB에 PENDING으로 남아 재시작 후 전달)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# 전역 인스턴스
+outbox_relay = OutboxRelay(
+    poll_interval=settings.OUTBOX_POLL_INTERVAL_SECONDS,
+    batch_size=settings.OUTBOX_BATCH_SIZE,
+    max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+    backoff_base=settings.OUTBOX_BACKOFF_BASE_SECONDS,
+    backoff_max=settings.OUTBOX_BACKOFF_MAX_SECONDS,
+    lease_seconds=settings.OUTBOX_LEASE_SECONDS,
+)
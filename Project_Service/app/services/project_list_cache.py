@@ -0,0 +1,140 @@
+"""
+메인 페이지 프로젝트 목록 Read-Through 캐시
+GET /projects 결과(직렬화된 JSON 바이트)를 필터/커서별로 짧은 TTL 동안 보관합니다.
+- 프로젝트 생성/수정/삭제 시 전체 무효화 (목록 순서·필터 소속이 바뀜)
+- 지원 승인/거절 시 해당 프로젝트가 포함된 페이지만 무효화 (인원 수만 바뀜)
+- 무효화 세대(generation)를 두어, 조회 도중 무효화가 일어나면 오래된 결과를 저장하지 않음
+- 임계 크기 이상 응답은 gzip 압축 (항목별로 한 번만 압축해 재사용)
+"""
+import gzip
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, FrozenSet, Hashable, Iterable, Optional, Tuple
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.core.config import settings
+from app.utils.pagination import NEXT_CURSOR_HEADER
+
+CACHE_HITS = Counter("project_list_cache_hits_total", "프로젝트 목록 캐시 적중 횟수", ["endpoint"])
+CACHE_MISSES = Counter("project_list_cache_misses_total", "프로젝트 목록 캐시 미스 횟수", ["endpoint"])
+CACHE_INVALIDATIONS = Counter("project_list_cache_invalidations_total", "프로젝트 목록 캐시 무효화 횟수", ["scope"])
+CACHE_ENTRIES = Gauge("project_list_cache_entries", "프로젝트 목록 캐시 항목 수")
+RESPONSE_BYTES = Histogram(
+    "project_list_response_bytes", "프로젝트 목록 응답 크기 (전송 바이트)",
+    ["endpoint", "format", "encoding"],
+    buckets=(512, 1024, 2048, 4096, 8192, 16384, 32768, 65536, 131072, 262144),
+)
+
+
+@dataclass
+class CachedPage:
+    body: bytes                       # 직렬화된 JSON 응답 본문
+    next_cursor: Optional[str]
+    project_ids: FrozenSet[int]       # 부분 무효화용
+    expires_at: float
+    endpoint: str = ""
+    format: str = "full"              # 응답 형식 (메트릭 라벨)
+    gzip_body: Optional[bytes] = field(default=None, repr=False)  # 첫 압축 요청 시 생성
+
+    def compressed(self) -> bytes:
+        if self.gzip_body is None:
+            self.gzip_body = gzip.compress(self.body, compresslevel=settings.RESPONSE_GZIP_LEVEL)
+        return self.gzip_body
+
+
+class ProjectListCache:
+    """필터/커서 키별 직렬화된 목록 페이지를 보관하는 TTL + LRU 캐시"""
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, CachedPage]" = OrderedDict()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """조회 시작 시점에 받아 두었다가 put()에 넘김"""
+        return self._generation
+
+    @staticmethod
+    def make_key(endpoint: str, **params: Any) -> Tuple:
+        """엔드포인트 + 쿼리 파라미터 + 오늘 날짜(D-day 계산이 날짜에 의존) 키"""
+        return (endpoint, date.today().isoformat(), tuple(sorted(params.items())))
+
+    def get(self, key: Tuple) -> Optional[CachedPage]:
+        entry = self._entries.get(key)
+        endpoint = key[0]
+        if entry is None or entry.expires_at <= time.monotonic():
+            if entry is not None:
+                self._entries.pop(key, None)
+                CACHE_ENTRIES.set(len(self._entries))
+            CACHE_MISSES.labels(endpoint=endpoint).inc()
+            return None
+
+        self._entries.move_to_end(key)
+        CACHE_HITS.labels(endpoint=endpoint).inc()
+        return entry
+
+    def put(self, key: Tuple, generation: int, payload: Any,
+            next_cursor: Optional[str], project_ids: Iterable[int], format: str = "full") -> CachedPage:
+        """응답 데이터를 직렬화해 저장 (조회 중 무효화가 있었으면 저장하지 않고 반환만)"""
+        entry = CachedPage(
+            body=json.dumps(jsonable_encoder(payload), ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+            next_cursor=next_cursor,
+            project_ids=frozenset(project_ids),
+            expires_at=time.monotonic() + self.ttl,
+            endpoint=key[0],
+            format=format,
+        )
+        if generation != self._generation:
+            return entry
+
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        CACHE_ENTRIES.set(len(self._entries))
+        return entry
+
+    def invalidate_all(self) -> None:
+        """프로젝트 생성/수정/삭제 시 전체 무효화"""
+        self._generation += 1
+        self._entries.clear()
+        CACHE_ENTRIES.set(0)
+        CACHE_INVALIDATIONS.labels(scope="all").inc()
+
+    def invalidate_project(self, project_id: int) -> None:
+        """해당 프로젝트가 포함된 페이지만 무효화 (지원 승인/거절)"""
+        self._generation += 1
+        for key in [k for k, entry in self._entries.items() if project_id in entry.project_ids]:
+            del self._entries[key]
+        CACHE_ENTRIES.set(len(self._entries))
+        CACHE_INVALIDATIONS.labels(scope="project").inc()
+
+
+def to_response(entry: CachedPage, cache_status: str, accept_encoding: str = "") -> Response:
+    """캐시 항목을 그대로 응답 (재직렬화 없음, 클라이언트가 gzip을 받고 임계 크기 이상이면 압축본 전송)"""
+    headers = {"X-Cache": cache_status, "Vary": "Accept-Encoding"}
+    if entry.next_cursor:
+        headers[NEXT_CURSOR_HEADER] = entry.next_cursor
+
+    body, encoding = entry.body, "identity"
+    if len(entry.body) >= settings.RESPONSE_GZIP_MIN_BYTES and "gzip" in accept_encoding.lower():
+        body, encoding = entry.compressed(), "gzip"
+        headers["Content-Encoding"] = "gzip"
+
+    RESPONSE_BYTES.labels(endpoint=entry.endpoint, format=entry.format, encoding=encoding).observe(len(body))
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# 전역 인스턴스
+project_list_cache = ProjectListCache(
+    ttl=settings.PROJECT_LIST_CACHE_TTL_SECONDS,
+    max_entries=settings.PROJECT_LIST_CACHE_MAX_ENTRIES,
+)
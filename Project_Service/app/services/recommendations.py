@@ -0,0 +1,217 @@
+"""
+기술 스택 기반 프로젝트 추천
+사용자 기술 스택(Auth UserStack)과 모집 중인 포지션(current_count < target_count)의 요구 스택이
+많이 겹치는 순서로 모집 중 프로젝트를 추천합니다.
+
+인덱스 구조 (스택별 비트셋):
+- 모집 중 프로젝트를 최신순으로 0..N-1 번호를 매기고,
+  스택마다 "이 스택을 요구하는 열린 포지션이 있는 프로젝트" 비트맵(파이썬 int)을 미리 만들어 둠
+- 점수 계산은 사용자 스택 비트맵들을 bit-sliced 덧셈으로 합산 → 프로젝트 수와 무관하게
+  (사용자 스택 수 × 점수 비트 수)번의 정수 비트 연산으로 전체 프로젝트 점수를 한 번에 계산
+- 높은 점수부터 해당 점수의 프로젝트 비트맵을 구해 낮은 비트(최신)부터 limit개만 꺼냄
+
+캐시:
+- 인덱스: 모집 포지션이 바뀌는 쓰기(생성/수정/삭제/승인) 시 invalidate, TTL로도 재생성
+- 사용자별 결과: (인덱스 버전, 사용자 스택 집합) 기준 - 스택이나 포지션이 바뀌면 자동으로 미스
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from prometheus_client import Counter
+from sqlalchemy import or_, select
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.project_recruitment import Project, ProjectRecruitmentPosition, ProjectStack, ProjectStatus
+
+logger = logging.getLogger(__name__)
+
+RECOMMENDATION_CACHE_HITS = Counter("recommendation_cache_hits_total", "추천 결과 캐시 적중 횟수")
+RECOMMENDATION_CACHE_MISSES = Counter("recommendation_cache_misses_total", "추천 결과 캐시 미스 횟수")
+RECOMMENDATION_INDEX_BUILDS = Counter("recommendation_index_builds_total", "추천 인덱스 재생성 횟수")
+
+
+def normalize_stack(name: str) -> str:
+    """스택 이름 비교용 정규화 (대소문자/공백 무시)"""
+    return str(name).strip().lower()
+
+
+@dataclass
+class StackIndex:
+    version: int
+    built_at: float
+    projects: List[Dict] = field(default_factory=list)          # 비트 번호 → 프로젝트 요약 (최신순)
+    project_stacks: List[FrozenSet[str]] = field(default_factory=list)  # 비트 번호 → 열린 포지션 요구 스택
+    bitmaps: Dict[str, int] = field(default_factory=dict)       # 정규화된 스택 → 프로젝트 비트맵
+
+
+def _bit_sliced_sum(bitmaps: Iterable[int]) -> List[int]:
+    """
+    비트맵들을 프로젝트별로 더한 점수를 bit-sliced 형태로 반환
+    counters[k]의 i번째 비트 = 프로젝트 i 점수의 k번째 비트
+    """
+    counters: List[int] = []
+    for carry in bitmaps:
+        k = 0
+        while carry:
+            if k == len(counters):
+                counters.append(0)
+            counters[k], carry = counters[k] ^ carry, counters[k] & carry
+            k += 1
+    return counters
+
+
+def _score_mask(counters: List[int], score: int, universe: int) -> int:
+    """점수가 정확히 score인 프로젝트 비트맵"""
+    if score >> len(counters):
+        # counters로 표현할 수 없는 점수 (하위 비트만 비교하면 다른 점수와 겹침)
+        return 0
+    mask = universe
+    for k, bits in enumerate(counters):
+        mask &= bits if (score >> k) & 1 else ~bits
+    return mask
+
+
+def rank(index: StackIndex, user_stacks: FrozenSet[str], limit: int) -> List[Tuple[int, int]]:
+    """(비트 번호, 점수) 목록을 점수 내림차순 → 최신순으로 최대 limit개 반환"""
+    bitmaps = [index.bitmaps[s] for s in user_stacks if s in index.bitmaps]
+    if not bitmaps:
+        return []
+
+    counters = _bit_sliced_sum(bitmaps)
+    universe = (1 << len(index.projects)) - 1
+    ranked: List[Tuple[int, int]] = []
+    max_score = min(len(bitmaps), (1 << len(counters)) - 1)
+    for score in range(max_score, 0, -1):
+        mask = _score_mask(counters, score, universe)
+        while mask and len(ranked) < limit:
+            low = mask & -mask
+            ranked.append((low.bit_length() - 1, score))
+            mask ^= low
+        if len(ranked) >= limit:
+            break
+    return ranked
+
+
+class RecommendationService:
+    """스택 비트셋 인덱스 + 사용자별 추천 결과 캐시"""
+
+    def __init__(self, index_ttl: float, result_ttl: float, max_users: int):
+        self.index_ttl = index_ttl
+        self.result_ttl = result_ttl
+        self.max_users = max_users
+        self._index: Optional[StackIndex] = None
+        self._version = 0
+        self._generation = 0  # 인덱스 생성 중 invalidate 감지용
+        self._build_lock = asyncio.Lock()
+        self._results: "OrderedDict[str, Tuple[int, FrozenSet[str], int, float, List[Dict]]]" = OrderedDict()
+
+    def invalidate_projects(self) -> None:
+        """모집 포지션이 바뀌는 쓰기 후 호출 - 다음 요청에서 인덱스 재생성 (사용자 결과도 버전 불일치로 무효)"""
+        self._index = None
+        self._generation += 1
+
+    def invalidate_user(self, user_id: str) -> None:
+        self._results.pop(user_id, None)
+
+    async def _build_index(self) -> StackIndex:
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(Project.project_id, Project.title, Project.type, Project.method, Project.created_at, ProjectStack.stack)
+                .join(ProjectRecruitmentPosition, ProjectRecruitmentPosition.project_id == Project.project_id)
+                .join(
+                    ProjectStack,
+                    (ProjectStack.project_id == ProjectRecruitmentPosition.project_id)
+                    & (ProjectStack.position_type == ProjectRecruitmentPosition.position_type),
+                )
+                .where(
+                    Project.status == ProjectStatus.RECRUITING,
+                    or_(
+                        ProjectRecruitmentPosition.target_count.is_(None),
+                        ProjectRecruitmentPosition.current_count < ProjectRecruitmentPosition.target_count,
+                    ),
+                )
+                .order_by(Project.created_at.desc(), Project.project_id.desc())
+            )
+            rows = result.all()
+
+        self._version += 1
+        index = StackIndex(version=self._version, built_at=time.monotonic())
+        positions: Dict[int, int] = {}
+        stacks_by_bit: List[set] = []
+        for project_id, title, type_, method, created_at, stack in rows:
+            bit = positions.get(project_id)
+            if bit is None:
+                bit = positions[project_id] = len(index.projects)
+                index.projects.append({
+                    "project_id": project_id,
+                    "title": title,
+                    "type": type_.value if hasattr(type_, "value") else type_,
+                    "method": method.value if hasattr(method, "value") else method,
+                    "created_at": created_at,
+                })
+                stacks_by_bit.append(set())
+            name = normalize_stack(stack)
+            stacks_by_bit[bit].add(stack)
+            index.bitmaps[name] = index.bitmaps.get(name, 0) | (1 << bit)
+        index.project_stacks = [frozenset(s) for s in stacks_by_bit]
+
+        RECOMMENDATION_INDEX_BUILDS.inc()
+        logger.info(f"추천 인덱스 생성: 프로젝트 {len(index.projects)}개, 스택 {len(index.bitmaps)}개")
+        return index
+
+    async def get_index(self) -> StackIndex:
+        index = self._index
+        if index is not None and time.monotonic() - index.built_at < self.index_ttl:
+            return index
+        async with self._build_lock:
+            index = self._index
+            if index is None or time.monotonic() - index.built_at >= self.index_ttl:
+                generation = self._generation
+                index = await self._build_index()
+                # 생성 중 쓰기가 있었으면 저장하지 않음 (다음 요청에서 다시 생성)
+                if generation == self._generation:
+                    self._index = index
+            return index
+
+    async def recommend(self, user_id: str, user_stacks: Iterable[str], limit: int) -> List[Dict]:
+        """사용자 스택과 겹치는 모집 중 프로젝트 추천 (점수 = 겹치는 스택 수)"""
+        stacks = frozenset(normalize_stack(s) for s in user_stacks if s)
+        index = await self.get_index()
+
+        cached = self._results.get(user_id)
+        if cached:
+            version, cached_stacks, cached_limit, expires_at, items = cached
+            if (version == index.version and cached_stacks == stacks
+                    and cached_limit >= limit and expires_at > time.monotonic()):
+                self._results.move_to_end(user_id)
+                RECOMMENDATION_CACHE_HITS.inc()
+                return items[:limit]
+        RECOMMENDATION_CACHE_MISSES.inc()
+
+        items = []
+        for bit, score in rank(index, stacks, limit):
+            project_stacks = index.project_stacks[bit]
+            items.append({
+                **index.projects[bit],
+                "score": score,
+                "matched_stacks": sorted(s for s in project_stacks if normalize_stack(s) in stacks),
+            })
+
+        self._results[user_id] = (index.version, stacks, limit, time.monotonic() + self.result_ttl, items)
+        self._results.move_to_end(user_id)
+        while len(self._results) > self.max_users:
+            self._results.popitem(last=False)
+        return items
+
+
+# 전역 인스턴스
+recommendation_service = RecommendationService(
+    index_ttl=settings.RECOMMENDATION_INDEX_TTL_SECONDS,
+    result_ttl=settings.RECOMMENDATION_RESULT_TTL_SECONDS,
+    max_users=settings.RECOMMENDATION_CACHE_MAX_USERS,
+)
@@ -0,0 +1,93 @@
+"""
+프로젝트 조회수 Write-Behind 카운터
+상세 조회 시 DB에 바로 쓰지 않고 프로세스 내 카운터에 모아 두었다가,
+주기적으로 하나의 UPDATE ... CASE 문으로 일괄 반영합니다.
+(인기 프로젝트 상세 조회가 행 잠금 쓰기로 직렬화되는 문제 방지)
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Dict, Optional
+
+from prometheus_client import Counter, Gauge
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.repositories.project_recruitment_repository import ProjectRecruitmentRepository
+
+logger = logging.getLogger(__name__)
+
+VIEWS_PENDING = Gauge("project_views_pending", "DB에 아직 반영되지 않은 조회수 합계")
+VIEWS_FLUSHED = Counter("project_views_flushed_total", "DB에 일괄 반영된 조회수 합계")
+VIEW_FLUSH_FAILURES = Counter("project_view_flush_failures_total", "조회수 일괄 반영 실패 횟수")
+
+
+class ViewCounter:
+    """프로젝트별 조회수 증가분을 모아 주기적으로 flush"""
+
+    def __init__(self, flush_interval: float):
+        self.flush_interval = flush_interval
+        self._pending: Dict[int, int] = defaultdict(int)
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, project_id: int) -> None:
+        """조회 1회 기록 (DB 접근 없음)"""
+        self._pending[project_id] += 1
+        VIEWS_PENDING.inc()
+
+    def pending_for(self, project_id: int) -> int:
+        """아직 반영되지 않은 해당 프로젝트의 조회수 (응답 views 보정용)"""
+        return self._pending.get(project_id, 0)
+
+    async def flush(self) -> int:
+        """모아 둔 조회수를 한 번의 UPDATE로 반영하고 반영 건수 반환 (실패 시 다음 주기에 재시도)"""
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            batch, self._pending = dict(self._pending), defaultdict(int)
+            total = sum(batch.values())
+            flushed = False
+            try:
+                async with AsyncSessionLocal() as session:
+                    await ProjectRecruitmentRepository(session).add_views_batch(batch)
+                flushed = True
+            except Exception as e:
+                VIEW_FLUSH_FAILURES.inc()
+                logger.error(f"조회수 일괄 반영 실패 ({len(batch)}개 프로젝트): {str(e)}")
+                return 0
+            finally:
+                if not flushed:
+                    # 실패하거나 취소된(shutdown 중 CancelledError 등) 증가분은 버리지 않고 다시 합산
+                    for project_id, count in batch.items():
+                        self._pending[project_id] += count
+
+            VIEWS_PENDING.dec(total)
+            VIEWS_FLUSHED.inc(total)
+            return total
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def start(self) -> None:
+        """주기적 flush 작업 시작 (app startup)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """주기 작업 중지 후 남은 조회수 최종 반영 (graceful shutdown)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+# 전역 인스턴스
+view_counter = ViewCounter(flush_interval=settings.VIEW_FLUSH_INTERVAL_SECONDS)
@@ -1,46 +1,127 @@
 """
 메모리 기반 데이터 저장소
 데이터베이스 연결 문제 해결 전까지 임시로 사용
+
+저장 방식:
+- 메모리: ID → 프로젝트 dict 인덱스 (조회 O(1))
+- 디스크: 스냅샷(temp_projects.json) + 변경 journal(temp_projects.json.journal, JSON Lines)
+  - 생성/수정/삭제는 journal에 한 줄씩 append (파일 전체를 다시 쓰지 않음)
+  - journal이 COMPACT_THRESHOLD 줄을 넘으면 스냅샷을 새로 쓰고 journal 비움 (compaction)
+  - 스냅샷은 임시 파일에 쓴 뒤 os.replace로 교체 (중간에 죽어도 이전 스냅샷 유지)
+  - 재시작 시 스냅샷 로드 후 journal 재적용 (재적용은 멱등이므로 compaction 도중 종료돼도 안전)
 """
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import json
 import os
 
+# journal이 이 줄 수를 넘으면 compaction
+COMPACT_THRESHOLD = 1000
+
+
 class MemoryStore:
-    def __init__(self):
-        self.projects: List[Dict[str, Any]] = []
+    def __init__(self, data_file: str = "temp_projects.json"):
+        self.projects: Dict[int, Dict[str, Any]] = {}
         self.next_id = 1
-        self.data_file = "temp_projects.json"
+        self.data_file = data_file
+        self.journal_file = f"{data_file}.journal"
+        self._journal = None
+        self._journal_entries = 0
         self.load_from_file()
     
     def load_from_file(self):
-        """파일에서 데이터 로드 (서버 재시작 시 데이터 유지)"""
+        """스냅샷 + journal에서 데이터 로드 (서버 재시작 시 데이터 유지)"""
         try:
             if os.path.exists(self.data_file):
                 with open(self.data_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    self.projects = data.get('projects', [])
+                    self.projects = {project["id"]: project for project in data.get('projects', [])}
                     self.next_id = data.get('next_id', 1)
+            self._replay_journal()
         except Exception as e:
             print(f"데이터 로드 실패: {e}")
             self.init_sample_data()
     
-    def save_to_file(self):
-        """파일에 데이터 저장"""
+    def _replay_journal(self):
+        """journal의 변경 사항을 순서대로 재적용 (마지막 줄이 잘린 경우 무시)"""
+        if not os.path.exists(self.journal_file):
+            return
+        corrupted = False
+        with open(self.journal_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    corrupted = True
+                    break
+                self._apply(entry)
+                self._journal_entries += 1
+        
+        if corrupted:
+            # 손상된 줄 뒤에 이어 쓰지 않도록 바로 스냅샷으로 정리
+            print("journal 마지막 기록 손상 - 무시하고 스냅샷으로 정리")
+            self.compact()
+    
+    def _apply(self, entry: Dict[str, Any]):
+        """journal 한 줄 적용 (같은 기록을 여러 번 적용해도 결과 동일)"""
+        op, project_id = entry["op"], entry["id"]
+        if op == "create":
+            self.projects[project_id] = entry["data"]
+            self.next_id = max(self.next_id, project_id + 1)
+        elif op == "update":
+            if project_id in self.projects:
+                self.projects[project_id].update(entry["data"])
+        elif op == "delete":
+            self.projects.pop(project_id, None)
+    
+    def _append(self, op: str, project_id: int, data: Optional[Dict[str, Any]] = None):
+        """journal에 변경 한 줄 기록 (필요 시 compaction)"""
+        try:
+            if self._journal is None:
+                self._journal = open(self.journal_file, 'a', encoding='utf-8')
+            entry = {"op": op, "id": project_id}
+            if data is not None:
+                entry["data"] = data
+            self._journal.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._journal.flush()
+            self._journal_entries += 1
+        except Exception as e:
+            print(f"데이터 저장 실패: {e}")
+            return
+        
+        if self._journal_entries >= COMPACT_THRESHOLD:
+            self.compact()
+    
+    def compact(self):
+        """현재 상태를 스냅샷으로 원자적 교체 후 journal 비움"""
+        tmp_file = f"{self.data_file}.tmp"
         try:
             data = {
-                'projects': self.projects,
+                'projects': list(self.projects.values()),
                 'next_id': self.next_id
             }
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.data_file)
+            
+            # 스냅샷 교체 후 journal 비움 (그 사이 종료돼도 재적용이 멱등이라 안전)
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            open(self.journal_file, 'w', encoding='utf-8').close()
+            self._journal_entries = 0
         except Exception as e:
-            print(f"데이터 저장 실패: {e}")
+            print(f"스냅샷 저장 실패: {e}")
+    
+    def save_to_file(self):
+        """파일에 데이터 저장 (전체 스냅샷 - compaction)"""
+        self.compact()
     
     def init_sample_data(self):
         """초기 샘플 데이터"""
-        self.projects = [
+        projects = [
             {
                 "id": 1,
                 "title": "🚀 팀으로 기획부터 배포까지 완주하는 사이드 프로젝트 멤버 구함",
@@ -142,19 +223,17 @@ class MemoryStore:
                 ]
             }
         ]
+        self.projects = {project["id"]: project for project in projects}
         self.next_id = 4
-        self.save_to_file()
+        self.compact()
     
     def get_all_projects(self) -> List[Dict[str, Any]]:
         """모든 프로젝트 조회"""
-        return self.projects
+        return list(self.projects.values())
     
     def get_project_by_id(self, project_id: int) -> Optional[Dict[str, Any]]:
         """ID로 프로젝트 조회"""
-        for project in self.projects:
-            if project["id"] == project_id:
-                return project
-        return None
+        return self.projects.get(project_id)
     
     def create_project(self, project_data: Dict[str, Any]) -> Dict[str, Any]:
         """새 프로젝트 생성"""
@@ -165,29 +244,27 @@ class MemoryStore:
             "views": 0,
             **project_data
         }
-        self.projects.append(project)
-        self.next_id += 1
-        self.save_to_file()
+        self.projects[project["id"]] = project
+        self.next_id = max(self.next_id, project["id"]) + 1
+        self._append("create", project["id"], project)
         return project
     
     def update_project(self, project_id: int, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """프로젝트 업데이트"""
-        for i, project in enumerate(self.projects):
-            if project["id"] == project_id:
-                self.projects[i].update(update_data)
-                self.projects[i]["updated_at"] = datetime.now().isoformat()
-                self.save_to_file()
-                return self.projects[i]
-        return None
+        project = self.projects.get(project_id)
+        if project is None:
+            return None
+        changes = {**update_data, "updated_at": datetime.now().isoformat()}
+        project.update(changes)
+        self._append("update", project_id, changes)
+        return project
     
     def delete_project(self, project_id: int) -> bool:
         """프로젝트 삭제"""
-        for i, project in enumerate(self.projects):
-            if project["id"] == project_id:
-                del self.projects[i]
-                self.save_to_file()
-                return True
-        return False
+        if self.projects.pop(project_id, None) is None:
+            return False
+        self._append("delete", project_id)
+        return True
 
 # 전역 인스턴스
-memory_store = MemoryStore()
\ No newline at end of file
+memory_store = MemoryStore()
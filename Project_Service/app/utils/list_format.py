@@ -0,0 +1,33 @@
+"""
+목록 응답 형식 유틸 (?format=compact / ?fields=)
+- format=compact: 엔드포인트가 정한 기본 compact 필드만 (모집 포지션 상세 등 큰 필드 제외)
+- fields=title,tags,...: 지정한 필드만 (키 필드 project_id는 항상 포함)
+필드 목록은 엔드포인트마다 응답 형태가 달라 호출하는 쪽에서 넘깁니다.
+"""
+from typing import Any, Dict, Optional, Tuple
+
+KEY_FIELD = "project_id"
+
+
+def parse_list_format(format: Optional[str], fields: Optional[str], available: Tuple[str, ...],
+                      compact_default: Tuple[str, ...]) -> Tuple[str, Optional[Tuple[str, ...]]]:
+    """
+    목록 응답 형식 결정 → ("full", None) 또는 ("compact", 필드 목록)
+    필드 목록은 available 순서를 따르며, 알 수 없는 필드/형식이면 ValueError
+    """
+    if fields:
+        requested = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = [f for f in requested if f not in available]
+        if unknown:
+            raise ValueError(f"알 수 없는 필드: {', '.join(unknown)} (사용 가능: {', '.join(available)})")
+        return "compact", tuple(f for f in available if f == KEY_FIELD or f in requested)
+    if format in (None, "", "full"):
+        return "full", None
+    if format == "compact":
+        return "compact", compact_default
+    raise ValueError("format은 'full' 또는 'compact'만 가능합니다.")
+
+
+def to_compact(item: Dict[str, Any], fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """전체 형식 목록 항목에서 compact 필드만 추림"""
+    return {f: item[f] for f in fields}
@@ -0,0 +1,67 @@
+"""
+Keyset(커서) 페이지네이션 유틸
+프로젝트 목록을 (created_at, project_id) 최신순으로 정렬하고,
+OFFSET 대신 마지막 행의 키 이후만 조회하여 깊은 페이지도 일정한 비용으로 조회합니다.
+(ix_projects_created_at_project_id 인덱스 사용)
+"""
+import base64
+import json
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, and_, or_
+
+from app.models.project_recruitment import Project
+
+# 다음 페이지 커서를 전달하는 응답 헤더 (목록 응답 형식을 바꾸지 않기 위해 헤더 사용)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, project_id: int) -> str:
+    """(created_at, project_id)를 불투명한 커서 문자열로 인코딩"""
+    payload = json.dumps({"c": created_at.isoformat(), "id": project_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """커서 문자열을 (created_at, project_id)로 디코딩 (형식 오류 시 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["c"]), int(payload["id"])
+    except Exception as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+
+def paginate_projects(query: Select, page: int, size: int, cursor: Optional[str] = None) -> Select:
+    """
+    프로젝트 목록 쿼리에 정렬/페이지네이션 적용
+    - cursor가 있으면 keyset 조건으로 조회 (page 무시)
+    - 없으면 기존 OFFSET 방식 유지 (첫 페이지 호환)
+    - 다음 페이지 존재 여부 확인을 위해 size + 1건 조회 → split_page()로 분리
+    """
+    query = query.order_by(Project.created_at.desc(), Project.project_id.desc())
+
+    if cursor:
+        created_at, project_id = decode_cursor(cursor)
+        query = query.where(
+            or_(
+                Project.created_at < created_at,
+                and_(Project.created_at == created_at, Project.project_id < project_id),
+            )
+        )
+    else:
+        query = query.offset((page - 1) * size)
+
+    return query.limit(size + 1)
+
+
+def split_page(projects: Sequence[Project], size: int) -> Tuple[List[Project], Optional[str]]:
+    """size + 1건 조회 결과를 (현재 페이지, 다음 커서)로 분리 (마지막 페이지면 커서 None)"""
+    projects = list(projects)
+    if len(projects) <= size:
+        return projects, None
+
+    page = projects[:size]
+    last = page[-1]
+    return page, encode_cursor(last.created_at, last.project_id)
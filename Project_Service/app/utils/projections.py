@@ -0,0 +1,59 @@
+"""
+목록 조회용 컬럼 프로젝션
+목록 API는 ORM 엔티티 대신 필요한 컬럼만 Row로 조회합니다.
+(identity map 등록/객체 생성 없이 튜플로 받아 바로 직렬화 - 큰 페이지에서 메모리/CPU 절약)
+Row는 컬럼명으로 속성 접근이 되므로 ORM 객체용 직렬화 함수를 그대로 사용할 수 있습니다.
+"""
+from typing import Dict, Iterable, List
+
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project_recruitment import Application, Project, ProjectRecruitmentPosition
+
+# 프로젝트 목록 (ProjectDetailResponse 필드)
+PROJECT_LIST_COLUMNS = (
+    Project.project_id, Project.user_id, Project.type, Project.title, Project.description,
+    Project.method, Project.status, Project.start_date, Project.end_date, Project.test_required,
+    Project.views, Project.created_at, Project.updated_at,
+)
+
+# 모집 포지션 (RecruitmentPositionResponse 필드)
+POSITION_LIST_COLUMNS = (
+    ProjectRecruitmentPosition.project_id, ProjectRecruitmentPosition.position_type,
+    ProjectRecruitmentPosition.required_stacks, ProjectRecruitmentPosition.target_count,
+    ProjectRecruitmentPosition.current_count, ProjectRecruitmentPosition.recruitment_deadline,
+)
+
+# 사용자 지원 현황 (지원서 message 등 Text 컬럼 제외)
+USER_APPLICATION_COLUMNS = (
+    Application.application_id, Application.project_id, Application.position_type,
+    Application.status, Application.created_at, Project.title.label("project_title"),
+)
+
+
+async def load_positions(db: AsyncSession, project_ids: Iterable[int]) -> Dict[int, List[Row]]:
+    """프로젝트들의 모집 포지션을 한 번에 조회하여 project_id별로 묶음"""
+    project_ids = list(project_ids)
+    positions: Dict[int, List[Row]] = {project_id: [] for project_id in project_ids}
+    if not project_ids:
+        return positions
+    result = await db.execute(
+        select(*POSITION_LIST_COLUMNS).where(ProjectRecruitmentPosition.project_id.in_(project_ids))
+    )
+    for row in result.all():
+        positions[row.project_id].append(row)
+    return positions
+
+
+def user_application_row(row: Row) -> Dict:
+    """USER_APPLICATION_COLUMNS Row → 사용자 지원 현황 항목"""
+    return {
+        "application_id": row.application_id,
+        "project_id": row.project_id,
+        "project_title": row.project_title,
+        "position_type": row.position_type.value if row.position_type else "UNKNOWN",
+        "status": row.status.value if row.status else "PENDING",
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+    }
@@ -0,0 +1,186 @@
+"""
+서비스 간 호출 Resilience 계층
+대상 서비스(downstream)마다 하나의 Circuit Breaker + Bulkhead + 재시도 정책을 공유합니다.
+(모듈마다 따로 Breaker를 두면 같은 서비스에 대한 장애 상태가 나뉘어 차단이 늦어짐)
+
+- Circuit Breaker: 연속 실패 시 OPEN → 복구 대기 후 HALF_OPEN에서 제한된 수의 probe만 허용
+- Bulkhead: 대상 서비스별 동시 호출 수 제한 (한 서비스 지연이 전체 워커를 잡아먹지 않도록)
+- Retry: 지수 백오프 + full jitter (재시도가 한꺼번에 몰리지 않도록)
+"""
+import asyncio
+import enum
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+import httpx
+from prometheus_client import Counter, Gauge
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+BREAKER_STATE = Gauge("circuit_breaker_state", "Circuit Breaker 상태 (0=CLOSED, 1=HALF_OPEN, 2=OPEN)", ["downstream"])
+CALL_REJECTIONS = Counter("resilience_rejections_total", "Resilience 계층에서 거부된 호출 수", ["downstream", "reason"])
+CALL_RETRIES = Counter("resilience_retries_total", "재시도한 호출 수", ["downstream"])
+CALL_FAILURES = Counter("resilience_failures_total", "실패로 기록된 호출 수", ["downstream"])
+
+
+class CircuitState(enum.Enum):
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+
+class CircuitOpenError(Exception):
+    """Circuit OPEN 또는 HALF_OPEN probe 한도 초과로 호출 거부"""
+
+
+class BulkheadFullError(Exception):
+    """동시 호출 한도 초과로 호출 거부"""
+
+
+class DownstreamError(Exception):
+    """대상 서비스 장애로 간주하는 응답 (5xx 등) - Breaker 실패로 기록되고 재시도 대상"""
+
+
+# Breaker 실패로 기록하고 재시도하는 오류 (연결 실패/타임아웃/5xx)
+_FAILURE_ERRORS = (DownstreamError, httpx.TransportError, asyncio.TimeoutError)
+
+
+class CircuitBreaker:
+    """연속 실패 기반 Circuit Breaker (HALF_OPEN 동시 probe 수 제한)"""
+
+    def __init__(self, name: str, failure_threshold: int, recovery_timeout: float, half_open_max_calls: int):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.failure_count = 0
+        self.opened_at: Optional[float] = None
+        self._half_open_calls = 0
+        self._set_state(CircuitState.CLOSED)
+
+    def _set_state(self, state: CircuitState) -> None:
+        self.state = state
+        BREAKER_STATE.labels(downstream=self.name).set(state.value)
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (허용 시 HALF_OPEN probe 슬롯을 점유하므로 반드시 record_*를 호출)"""
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() - self.opened_at < self.recovery_timeout:
+                return False
+            logger.info(f"🟡 [{self.name}] Circuit HALF_OPEN - 복구 테스트")
+            self._set_state(CircuitState.HALF_OPEN)
+            self._half_open_calls = 0
+
+        if self.state == CircuitState.HALF_OPEN:
+            if self._half_open_calls >= self.half_open_max_calls:
+                return False
+            self._half_open_calls += 1
+        return True
+
+    def record_success(self) -> None:
+        if self.state == CircuitState.HALF_OPEN:
+            logger.info(f"🟢 [{self.name}] Circuit CLOSED - 복구됨")
+        self.failure_count = 0
+        self._half_open_calls = 0
+        self._set_state(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        self.failure_count += 1
+        if self.state == CircuitState.HALF_OPEN or self.failure_count >= self.failure_threshold:
+            if self.state != CircuitState.OPEN:
+                logger.warning(f"🔴 [{self.name}] Circuit OPEN - 연속 {self.failure_count}회 실패")
+            self.opened_at = time.monotonic()
+            self._half_open_calls = 0
+            self._set_state(CircuitState.OPEN)
+
+    def release(self) -> None:
+        """성공/실패를 판단하지 않고 끝난 호출의 HALF_OPEN probe 슬롯 반환 (예: 요청 취소, 응답 처리 오류)"""
+        if self.state == CircuitState.HALF_OPEN and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+
+class ResilienceGuard:
+    """대상 서비스 하나에 대한 Breaker + Bulkhead + Retry 묶음"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.breaker = CircuitBreaker(
+            name,
+            failure_threshold=settings.MSA_BREAKER_FAILURE_THRESHOLD,
+            recovery_timeout=settings.MSA_BREAKER_RECOVERY_SECONDS,
+            half_open_max_calls=settings.MSA_BREAKER_HALF_OPEN_MAX_CALLS,
+        )
+        self.bulkhead = asyncio.Semaphore(settings.MSA_BULKHEAD_MAX_CONCURRENCY)
+        self.acquire_timeout = settings.MSA_BULKHEAD_ACQUIRE_TIMEOUT
+        self.backoff_base = settings.MSA_RETRY_BACKOFF_BASE_SECONDS
+        self.backoff_max = settings.MSA_RETRY_BACKOFF_MAX_SECONDS
+
+    def _backoff(self, attempt: int) -> float:
+        """full jitter: 0 ~ min(max, base * 2^attempt)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    async def _attempt(self, operation: Callable[[], Awaitable[T]]) -> T:
+        if not self.breaker.allow():
+            CALL_REJECTIONS.labels(downstream=self.name, reason="circuit_open").inc()
+            raise CircuitOpenError(f"{self.name} circuit open")
+
+        settled = False  # record_success/record_failure로 probe 슬롯 처리가 끝났는지
+        try:
+            try:
+                await asyncio.wait_for(self.bulkhead.acquire(), timeout=self.acquire_timeout)
+            except asyncio.TimeoutError:
+                CALL_REJECTIONS.labels(downstream=self.name, reason="bulkhead_full").inc()
+                raise BulkheadFullError(f"{self.name} bulkhead full")
+
+            try:
+                result = await operation()
+            except _FAILURE_ERRORS:
+                settled = True
+                self.breaker.record_failure()
+                CALL_FAILURES.labels(downstream=self.name).inc()
+                raise
+            finally:
+                self.bulkhead.release()
+
+            settled = True
+            self.breaker.record_success()
+            return result
+        finally:
+            if not settled:
+                # 장애로 보지 않는 오류/취소/Bulkhead 대기 중 타임아웃·취소는 probe 슬롯만 반환
+                self.breaker.release()
+
+    async def call(self, operation: Callable[[], Awaitable[T]], retries: int = 0) -> T:
+        """
+        operation 실행 (장애성 오류만 재시도, Breaker/Bulkhead 거부는 재시도하지 않음)
+        실패 시 마지막 예외를 그대로 전달
+        """
+        attempt = 0
+        while True:
+            try:
+                return await self._attempt(operation)
+            except (CircuitOpenError, BulkheadFullError):
+                raise
+            except _FAILURE_ERRORS:
+                if attempt >= retries:
+                    raise
+                CALL_RETRIES.labels(downstream=self.name).inc()
+                await asyncio.sleep(self._backoff(attempt))
+                attempt += 1
+
+
+_guards: Dict[str, ResilienceGuard] = {}
+
+
+def get_guard(downstream: str) -> ResilienceGuard:
+    """대상 서비스별 공유 Guard (프로세스 내 단일 인스턴스)"""
+    guard = _guards.get(downstream)
+    if guard is None:
+        guard = _guards[downstream] = ResilienceGuard(downstream)
+    return guard
@@ -0,0 +1,56 @@
+"""
+기술 스택 정규화 유틸
+required_stacks는 저장 경로에 따라 JSON 배열 문자열('["React","TypeScript"]'),
+콤마 구분 문자열('React,TypeScript'), 리스트 중 하나로 들어오므로 하나의 리스트로 정규화합니다.
+"""
+import json
+from typing import Any, List
+
+# project_stack.stack 컬럼 길이 (PK 일부)
+STACK_NAME_MAX_LENGTH = 50
+
+
+def parse_required_stacks(required_stacks: Any) -> List[str]:
+    """required_stacks 값을 중복 없는 스택 이름 리스트로 변환 (입력 순서 유지)"""
+    if not required_stacks:
+        return []
+
+    if isinstance(required_stacks, str):
+        try:
+            parsed = json.loads(required_stacks)
+        except ValueError:
+            parsed = required_stacks.split(",")
+        if isinstance(parsed, str):
+            parsed = [parsed]
+    elif isinstance(required_stacks, (list, tuple, set)):
+        parsed = list(required_stacks)
+    else:
+        return []
+
+    if not isinstance(parsed, list):
+        return []
+
+    stacks: List[str] = []
+    for stack in parsed:
+        name = str(stack).strip()
+        if name and name not in stacks:
+            stacks.append(name)
+    return stacks
+
+
+def parse_stack_index_names(required_stacks: Any) -> List[str]:
+    """
+    project_stack 인덱스에 저장/조회할 스택 이름 리스트 (입력 순서 유지)
+    - 컬럼 길이(50)에 맞게 자름 (초과 시 MySQL DataError)
+    - 대소문자만 다른 이름은 첫 번째 것만 유지 (MySQL 기본 collation은 대소문자를 구분하지 않아
+      'React'/'react'가 같은 PK로 충돌), 자른 뒤 같아지는 이름도 함께 제거
+    """
+    stacks: List[str] = []
+    seen = set()
+    for stack in parse_required_stacks(required_stacks):
+        name = stack[:STACK_NAME_MAX_LENGTH].rstrip()
+        key = name.casefold()
+        if key not in seen:
+            seen.add(key)
+            stacks.append(name)
+    return stacks
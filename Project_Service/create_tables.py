@@ -30,7 +30,7 @@ def create_tables():
         Base = declarative_base()
         
         # 모델 정의 (app.models.project_recruitment와 동일한 구조)
-        from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, Integer, BigInteger, Text, Boolean, Date, ForeignKey
+        from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, Integer, BigInteger, Text, Boolean, Date, ForeignKey, Index
         from sqlalchemy.dialects.mysql import CHAR
         from sqlalchemy.sql import func
         import enum
@@ -65,6 +65,9 @@ def create_tables():
         
         class Project(Base):
             __tablename__ = "projects"
+            __table_args__ = (
+                Index("ix_projects_status_type_created_at", "status", "type", "created_at", "project_id"),
+            )
             
             project_id = Column(BigInteger, primary_key=True, autoincrement=True)
             user_id = Column(CHAR(36), nullable=False, comment="🔗 팀장 ID")
@@ -93,8 +96,20 @@ def create_tables():
             created_at = Column(DateTime, nullable=False, default=func.now())
             updated_at = Column(DateTime, nullable=True)
         
+        class ProjectStack(Base):
+            __tablename__ = "project_stack"
+            
+            project_id = Column(BigInteger, ForeignKey("projects.project_id", ondelete="CASCADE"), primary_key=True, nullable=False)
+            position_type = Column(SQLEnum(PositionType), primary_key=True, nullable=False)
+            stack = Column(String(50), primary_key=True, nullable=False, index=True)
+        
         class Application(Base):
             __tablename__ = "applications"
+            __table_args__ = (
+                Index("ix_applications_project_id_created_at", "project_id", "created_at"),
+                Index("ix_applications_project_id_user_id", "project_id", "user_id"),
+                Index("ix_applications_user_id_created_at", "user_id", "created_at"),
+            )
             
             application_id = Column(BigInteger, primary_key=True, autoincrement=True)
             project_id = Column(BigInteger, ForeignKey("projects.project_id", ondelete="CASCADE"), nullable=False)
@@ -102,6 +117,28 @@ def create_tables():
             position_type = Column(SQLEnum(PositionType), nullable=False)
             message = Column(Text, nullable=False)
             status = Column(SQLEnum(ApplicationStatus), nullable=False, default=ApplicationStatus.PENDING)
+            decision_key = Column(String(64), nullable=True, comment="승인/거절 요청 멱등성 키")
+            created_at = Column(DateTime, nullable=False, default=func.now())
+            updated_at = Column(DateTime, nullable=True)
+        
+        class OutboxStatus(str, enum.Enum):
+            PENDING = "PENDING"
+            SENT = "SENT"
+            FAILED = "FAILED"
+        
+        class OutboxEvent(Base):
+            __tablename__ = "outbox_events"
+            
+            event_id = Column(BigInteger, primary_key=True, autoincrement=True)
+            aggregate_type = Column(String(50), nullable=False)
+            aggregate_id = Column(BigInteger, nullable=False, index=True)
+            event_type = Column(String(50), nullable=False)
+            payload = Column(Text, nullable=False)
+            status = Column(SQLEnum(OutboxStatus), nullable=False, default=OutboxStatus.PENDING)
+            attempts = Column(Integer, nullable=False, default=0)
+            next_attempt_at = Column(DateTime, nullable=False, default=func.now())
+            last_error = Column(Text, nullable=True)
+            result = Column(Text, nullable=True)
             created_at = Column(DateTime, nullable=False, default=func.now())
             updated_at = Column(DateTime, nullable=True)
         
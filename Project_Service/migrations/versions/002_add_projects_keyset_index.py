@@ -0,0 +1,29 @@
+"""Add keyset pagination index on projects
+
+Revision ID: 002_add_projects_keyset_index
+Revises: 001_create_project_tables
+Create Date: 2026-10-17
+
+프로젝트 목록 커서 페이지네이션용 복합 인덱스:
+- projects (created_at, project_id)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002_add_projects_keyset_index'
+down_revision: Union[str, Sequence[str], None] = '001_create_project_tables'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create keyset pagination index."""
+    op.create_index('ix_projects_created_at_project_id', 'projects', ['created_at', 'project_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop keyset pagination index."""
+    op.drop_index('ix_projects_created_at_project_id', table_name='projects')
@@ -0,0 +1,54 @@
+"""Create normalized project_stack index table
+
+Revision ID: 003_create_project_stack_index
+Revises: 002_add_projects_keyset_index
+Create Date: 2026-10-17
+
+project_recruitment_positions.required_stacks(JSON/콤마 문자열)를 정규화한 인덱스 테이블:
+- project_stack (project_id, position_type, stack)
+- 기존 모집 포지션 데이터로 백필
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.stacks import parse_stack_index_names  # 앱과 같은 규칙으로 백필 (env.py가 app을 sys.path에 추가)
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003_create_project_stack_index'
+down_revision: Union[str, Sequence[str], None] = '002_add_projects_keyset_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create project_stack table and backfill from required_stacks."""
+    project_stack = op.create_table('project_stack',
+        sa.Column('project_id', sa.BigInteger(), nullable=False),
+        sa.Column('position_type', sa.Enum('FRONTEND', 'BACKEND', 'DB', 'INFRA', 'DESIGN', 'ETC', name='positiontype'), nullable=False),
+        sa.Column('stack', sa.String(length=50), nullable=False),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.project_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('project_id', 'position_type', 'stack')
+    )
+    op.create_index('ix_project_stack_stack_project_id', 'project_stack', ['stack', 'project_id'], unique=False)
+
+    # 기존 데이터 백필
+    conn = op.get_bind()
+    positions = conn.execute(sa.text(
+        "SELECT project_id, position_type, required_stacks FROM project_recruitment_positions"
+    )).fetchall()
+    rows = [
+        {"project_id": project_id, "position_type": position_type, "stack": stack}
+        for project_id, position_type, required_stacks in positions
+        for stack in parse_stack_index_names(required_stacks)
+    ]
+    if rows:
+        op.bulk_insert(project_stack, rows)
+
+
+def downgrade() -> None:
+    """Drop project_stack table."""
+    op.drop_index('ix_project_stack_stack_project_id', table_name='project_stack')
+    op.drop_table('project_stack')
@@ -0,0 +1,49 @@
+"""Create outbox_events table
+
+Revision ID: 004_create_outbox_events
+Revises: 003_create_project_stack_index
+Create Date: 2026-10-17
+
+Transactional Outbox 테이블:
+- 프로젝트 생성과 같은 트랜잭션에서 팀 생성 이벤트 기록
+- 릴레이가 커밋 후 Team Service에 전달 (재시도/백오프)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004_create_outbox_events'
+down_revision: Union[str, Sequence[str], None] = '003_create_project_stack_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create outbox_events table."""
+    op.create_table('outbox_events',
+        sa.Column('event_id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('aggregate_type', sa.String(length=50), nullable=False),
+        sa.Column('aggregate_id', sa.BigInteger(), nullable=False),
+        sa.Column('event_type', sa.String(length=50), nullable=False),
+        sa.Column('payload', sa.Text(), nullable=False),
+        sa.Column('status', sa.Enum('PENDING', 'SENT', 'FAILED', name='outboxstatus'), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('next_attempt_at', sa.DateTime(), nullable=False),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('result', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('event_id')
+    )
+    op.create_index('ix_outbox_events_status_next_attempt_at', 'outbox_events', ['status', 'next_attempt_at'], unique=False)
+    op.create_index('ix_outbox_events_aggregate', 'outbox_events', ['aggregate_type', 'aggregate_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop outbox_events table."""
+    op.drop_index('ix_outbox_events_aggregate', table_name='outbox_events')
+    op.drop_index('ix_outbox_events_status_next_attempt_at', table_name='outbox_events')
+    op.drop_table('outbox_events')
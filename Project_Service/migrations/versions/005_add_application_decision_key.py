@@ -0,0 +1,31 @@
+"""Add decision_key to applications
+
+Revision ID: 005_add_application_decision_key
+Revises: 004_create_outbox_events
+Create Date: 2026-10-17
+
+지원서 승인/거절 멱등성 키:
+- 같은 키로 재요청 시 이전 결과 반환 (중복 좌석 예약 방지)
+- 팀 서비스 실패 보상 시 해당 결정만 정확히 되돌림
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005_add_application_decision_key'
+down_revision: Union[str, Sequence[str], None] = '004_create_outbox_events'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add applications.decision_key."""
+    op.add_column('applications', sa.Column('decision_key', sa.String(length=64), nullable=True, comment='승인/거절 요청 멱등성 키'))
+
+
+def downgrade() -> None:
+    """Drop applications.decision_key."""
+    op.drop_column('applications', 'decision_key')
@@ -0,0 +1,51 @@
+"""Add composite indexes for hot project/application queries
+
+Revision ID: 006_add_hot_query_indexes
+Revises: 005_add_application_decision_key
+Create Date: 2026-10-17
+
+자주 호출되는 조회 경로용 복합 인덱스 (InnoDB 보조 인덱스는 PK를 포함하므로 정렬/키 조회까지 커버):
+- applications (project_id, created_at): 프로젝트별 지원자 목록 최신순
+- applications (project_id, user_id): 중복 지원 확인
+- applications (user_id, created_at): 사용자별 지원 현황 최신순
+- projects (status, type, created_at, project_id): 상태/유형 필터 목록 최신순
+
+001의 단일 컬럼 인덱스 ix_applications_project_id / ix_applications_user_id는 위 복합 인덱스의
+선두 컬럼과 겹쳐 쓰기 비용만 늘리므로 제거 (FK용 인덱스는 복합 인덱스가 대신하도록 생성 후 제거)
+
+쿼리 플랜 확인: TEST_MYSQL_URL=... python -m pytest tests/test_query_plans.py
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006_add_hot_query_indexes'
+down_revision: Union[str, Sequence[str], None] = '005_add_application_decision_key'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create composite indexes and drop the redundant single-column ones."""
+    op.create_index('ix_applications_project_id_created_at', 'applications', ['project_id', 'created_at'], unique=False)
+    op.create_index('ix_applications_project_id_user_id', 'applications', ['project_id', 'user_id'], unique=False)
+    op.create_index('ix_applications_user_id_created_at', 'applications', ['user_id', 'created_at'], unique=False)
+    op.create_index('ix_projects_status_type_created_at', 'projects', ['status', 'type', 'created_at', 'project_id'], unique=False)
+
+    # 중복 단일 컬럼 인덱스 제거 (001에서 생성)
+    op.drop_index('ix_applications_user_id', table_name='applications')
+    op.drop_index('ix_applications_project_id', table_name='applications')
+
+
+def downgrade() -> None:
+    """Restore the single-column indexes and drop composite indexes."""
+    # 001의 단일 컬럼 인덱스 복원 (FK 인덱스가 비지 않도록 복합 인덱스 제거 전에 생성)
+    op.create_index('ix_applications_project_id', 'applications', ['project_id'], unique=False)
+    op.create_index('ix_applications_user_id', 'applications', ['user_id'], unique=False)
+
+    op.drop_index('ix_projects_status_type_created_at', table_name='projects')
+    op.drop_index('ix_applications_user_id_created_at', table_name='applications')
+    op.drop_index('ix_applications_project_id_user_id', table_name='applications')
+    op.drop_index('ix_applications_project_id_created_at', table_name='applications')
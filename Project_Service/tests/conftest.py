@@ -0,0 +1,7 @@
+"""
+테스트 공통 설정
+app.core.config가 import 시점에 DB URL을 읽으므로, 앱 모듈을 불러오기 전에 로컬 SQLite로 지정합니다.
+"""
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///./test_portforge_project.sqlite")
@@ -0,0 +1,188 @@
+"""
+지원자 일괄 승인/거절 테스트 (좌석 일괄 예약 + Team Service 실패 시 보상)
+SQLite 파일 DB에 프로젝트/포지션/지원서를 만들고 handle_applications_batch를 직접 호출합니다.
+Team Service 호출(msa_client.add_team_members_batch)과 알림 큐는 테스트용 함수로 교체합니다.
+"""
+import asyncio
+import datetime
+from typing import Dict, List, Optional
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import app.models  # noqa: F401 - 모든 테이블을 metadata에 등록
+from app.api import applications as applications_api
+from app.core.database import Base
+from app.models.project_recruitment import (
+    Application, ApplicationStatus, PositionType, Project, ProjectMethod,
+    ProjectRecruitmentPosition, ProjectStatus, ProjectType,
+)
+
+PROJECT_ID = 1
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'decisions.sqlite'}")
+
+    async def create():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create())
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def team_service(monkeypatch):
+    """Team Service 일괄 추가 응답 제어: failed_users는 error, unavailable=True면 연결 실패(None)"""
+    state = {"calls": [], "failed_users": set(), "unavailable": False}
+
+    async def add_team_members_batch(members: List[Dict]) -> Optional[Dict]:
+        state["calls"].append(members)
+        if state["unavailable"]:
+            return None
+        return {"data": {"results": [
+            {"user_id": m["user_id"], "status": "error" if m["user_id"] in state["failed_users"] else "added"}
+            for m in members
+        ]}}
+
+    monkeypatch.setattr(applications_api.msa_client, "add_team_members_batch", add_team_members_batch)
+    monkeypatch.setattr(applications_api.notification_queue, "enqueue_many", lambda notifications: None)
+    return state
+
+
+def _seed(session_factory, positions: Dict[PositionType, Optional[int]], applicants: List[PositionType]):
+    """positions: 포지션별 남은 좌석(target - current, None=인원 제한 없음), applicants: 지원서 포지션 목록 (id 1..N)"""
+    async def seed():
+        async with session_factory() as session:
+            session.add(Project(
+                project_id=PROJECT_ID, user_id="leader", type=ProjectType.PROJECT, title="테스트 프로젝트",
+                description="d", method=ProjectMethod.ONLINE, status=ProjectStatus.RECRUITING,
+                start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 3, 1), views=0,
+            ))
+            await session.flush()
+            for position_type, seats in positions.items():
+                session.add(ProjectRecruitmentPosition(
+                    project_id=PROJECT_ID, position_type=position_type,
+                    target_count=None if seats is None else seats + 1, current_count=1,
+                ))
+            for application_id, position_type in enumerate(applicants, start=1):
+                session.add(Application(
+                    application_id=application_id, project_id=PROJECT_ID, user_id=f"user-{application_id}",
+                    position_type=position_type, message="지원합니다", status=ApplicationStatus.PENDING,
+                ))
+            await session.commit()
+
+    asyncio.run(seed())
+
+
+def _decide(session_factory, decisions: List[Dict], idempotency_key: Optional[str] = None) -> Dict:
+    async def call():
+        async with session_factory() as session:
+            return await applications_api.handle_applications_batch(
+                PROJECT_ID, {"decisions": decisions}, idempotency_key=idempotency_key, db=session,
+            )
+
+    return asyncio.run(call())["data"]
+
+
+def _state(session_factory):
+    """(지원서 id → (상태, decision_key), 포지션 → current_count)"""
+    async def load():
+        async with session_factory() as session:
+            apps = (await session.execute(
+                select(Application.application_id, Application.status, Application.decision_key)
+            )).all()
+            positions = (await session.execute(
+                select(ProjectRecruitmentPosition.position_type, ProjectRecruitmentPosition.current_count)
+            )).all()
+        return {a.application_id: (a.status, a.decision_key) for a in apps}, dict(positions)
+
+    return asyncio.run(load())
+
+
+def _accept(*application_ids: int) -> List[Dict]:
+    return [{"application_id": application_id, "status": "accepted"} for application_id in application_ids]
+
+
+def test_reserve_seats_grants_only_remaining_seats(session_factory):
+    _seed(session_factory, {PositionType.BACKEND: 2, PositionType.FRONTEND: None}, [])
+
+    async def reserve():
+        async with session_factory() as session:
+            granted = (
+                await applications_api._reserve_seats(session, PROJECT_ID, PositionType.BACKEND, 5),
+                await applications_api._reserve_seats(session, PROJECT_ID, PositionType.BACKEND, 1),
+                await applications_api._reserve_seats(session, PROJECT_ID, PositionType.FRONTEND, 4),
+                await applications_api._reserve_seats(session, PROJECT_ID, PositionType.DESIGN, 1),
+            )
+            await session.commit()
+            return granted
+
+    assert asyncio.run(reserve()) == (2, 0, 4, None)
+    _, positions = _state(session_factory)
+    assert positions == {PositionType.BACKEND: 3, PositionType.FRONTEND: 5}
+
+
+def test_batch_accept_overflow_returns_to_pending(session_factory, team_service):
+    _seed(session_factory, {PositionType.BACKEND: 2}, [PositionType.BACKEND] * 4)
+
+    data = _decide(session_factory, _accept(1, 2, 3) + [{"application_id": 4, "status": "rejected"}])
+
+    assert [item["status"] for item in data["results"]] == ["accepted", "accepted", "failed", "rejected"]
+    assert "마감" in data["results"][2]["detail"]
+    assert data["summary"] == {"accepted": 2, "rejected": 1, "failed": 1}
+    assert [m["user_id"] for m in team_service["calls"][0]] == ["user-1", "user-2"]
+
+    apps, positions = _state(session_factory)
+    assert apps[3] == (ApplicationStatus.PENDING, None)
+    assert apps[4][0] == ApplicationStatus.REJECTED
+    assert positions[PositionType.BACKEND] == 3  # 1 + 예약 2 (초과분은 예약하지 않음)
+
+
+def test_team_failure_compensates_only_failed_items(session_factory, team_service):
+    _seed(session_factory, {PositionType.BACKEND: 3, PositionType.FRONTEND: 1},
+          [PositionType.BACKEND, PositionType.BACKEND, PositionType.FRONTEND])
+    team_service["failed_users"] = {"user-2", "user-3"}
+
+    data = _decide(session_factory, _accept(1, 2, 3))
+
+    assert [item["status"] for item in data["results"]] == ["accepted", "failed", "failed"]
+    apps, positions = _state(session_factory)
+    assert apps[1][0] == ApplicationStatus.ACCEPTED
+    assert apps[2] == (ApplicationStatus.PENDING, None)
+    assert apps[3] == (ApplicationStatus.PENDING, None)
+    # 실패 항목 수만큼 포지션별 좌석 반환
+    assert positions == {PositionType.BACKEND: 2, PositionType.FRONTEND: 1}
+
+
+def test_team_service_unavailable_reverts_all_accepts(session_factory, team_service):
+    _seed(session_factory, {PositionType.BACKEND: 2}, [PositionType.BACKEND] * 3)
+    team_service["unavailable"] = True
+
+    data = _decide(session_factory, _accept(1, 2) + [{"application_id": 3, "status": "rejected"}])
+
+    assert data["summary"] == {"accepted": 0, "rejected": 1, "failed": 2}
+    apps, positions = _state(session_factory)
+    assert apps[1] == (ApplicationStatus.PENDING, None)
+    assert apps[2] == (ApplicationStatus.PENDING, None)
+    assert apps[3][0] == ApplicationStatus.REJECTED
+    assert positions[PositionType.BACKEND] == 1
+
+
+def test_retry_with_same_key_does_not_reserve_twice(session_factory, team_service):
+    _seed(session_factory, {PositionType.BACKEND: 2}, [PositionType.BACKEND] * 2)
+
+    first = _decide(session_factory, _accept(1, 2), idempotency_key="retry-key")
+    second = _decide(session_factory, _accept(1, 2), idempotency_key="retry-key")
+    other = _decide(session_factory, _accept(1), idempotency_key="other-key")
+
+    assert first["summary"]["accepted"] == 2
+    assert second["summary"]["accepted"] == 2
+    assert other["results"][0]["status"] == "failed"
+    assert len(team_service["calls"]) == 1
+    _, positions = _state(session_factory)
+    assert positions[PositionType.BACKEND] == 3
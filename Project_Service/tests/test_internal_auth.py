@@ -0,0 +1,56 @@
+"""
+/internal 라우트 인증 테스트
+INTERNAL_SERVICE_TOKEN 설정 시 X-Internal-Token 일치 여부, 미설정 시 loopback 호출만 허용하는지 확인합니다.
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import internal
+from app.core.config import settings
+from app.services.user_profile_cache import user_profile_cache
+from app.utils.msa_client import INTERNAL_TOKEN_HEADER
+
+URL = "/internal/users/user-1/invalidate"
+
+
+def _client(host: str = "10.0.0.5") -> TestClient:
+    app = FastAPI()
+    app.include_router(internal.router)
+    return TestClient(app, client=(host, 50000))
+
+
+@pytest.fixture
+def token(monkeypatch):
+    monkeypatch.setattr(settings, "INTERNAL_SERVICE_TOKEN", "s3cret")
+    return "s3cret"
+
+
+def test_token_required_when_configured(token):
+    with _client() as client:
+        assert client.post(URL).status_code == 403
+        assert client.post(URL, headers={INTERNAL_TOKEN_HEADER: "wrong"}).status_code == 403
+
+
+def test_matching_token_invalidates_cache(token):
+    user_profile_cache.put_many([{"user_id": "user-1", "nickname": "old"}], user_profile_cache.generation)
+
+    with _client() as client:
+        response = client.post(URL, headers={INTERNAL_TOKEN_HEADER: token})
+
+    assert response.status_code == 200
+    assert user_profile_cache.get_many(["user-1"]) == ([], ["user-1"])
+
+
+def test_loopback_needs_token_when_configured(token):
+    # 토큰이 설정되면 같은 호스트에서 온 호출도 토큰이 있어야 함
+    with _client("127.0.0.1") as client:
+        assert client.post(URL).status_code == 403
+
+
+@pytest.mark.parametrize("host, expected", [("127.0.0.1", 200), ("::1", 200), ("10.0.0.5", 403)])
+def test_without_token_only_loopback_allowed(monkeypatch, host, expected):
+    monkeypatch.setattr(settings, "INTERNAL_SERVICE_TOKEN", "")
+
+    with _client(host) as client:
+        assert client.post(URL).status_code == expected
@@ -0,0 +1,109 @@
+"""
+outbox 팀 생성 최종 실패 시 보상 작업 테스트
+지원서가 있는 프로젝트도 보상으로 삭제되는지, 보상 작업이 실패하면 이벤트와 메트릭에 드러나는지 확인합니다.
+SQLite는 외래키를 기본으로 검사하지 않으므로 MySQL과 같게 PRAGMA foreign_keys를 켭니다.
+"""
+import asyncio
+import datetime
+
+import pytest
+from sqlalchemy import event as sa_event, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import app.models  # noqa: F401 - 모든 테이블을 metadata에 등록
+from app.core.database import Base
+from app.models.outbox import OutboxEvent, OutboxStatus
+from app.models.project_recruitment import (
+    Application, ApplicationStatus, PositionType, Project, ProjectMethod,
+    ProjectRecruitmentPosition, ProjectStatus, ProjectType,
+)
+from app.services import outbox_relay as relay_module
+from app.services.outbox_relay import OUTBOX_COMPENSATION_FAILURES, TEAM_CREATE, OutboxRelay
+
+PROJECT_ID = 1
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'outbox.sqlite'}")
+
+    @sa_event.listens_for(engine.sync_engine, "connect")
+    def _enable_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    async def create():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine)() as session:
+            session.add(Project(
+                project_id=PROJECT_ID, user_id="leader", type=ProjectType.PROJECT, title="테스트 프로젝트",
+                description="d", method=ProjectMethod.ONLINE, status=ProjectStatus.RECRUITING,
+                start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 3, 1), views=0,
+            ))
+            await session.flush()
+            session.add(ProjectRecruitmentPosition(
+                project_id=PROJECT_ID, position_type=PositionType.BACKEND,
+                required_stacks='["Python"]', target_count=2, current_count=0,
+            ))
+            session.add(Application(
+                application_id=1, project_id=PROJECT_ID, user_id="user-1", position_type=PositionType.BACKEND,
+                message="지원합니다", status=ApplicationStatus.PENDING,
+            ))
+            session.add(OutboxEvent(
+                event_id=1, aggregate_type="project", aggregate_id=PROJECT_ID, event_type=TEAM_CREATE,
+                payload="{}", status=OutboxStatus.PENDING, attempts=3,
+            ))
+            await session.commit()
+
+    asyncio.run(create())
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    monkeypatch.setattr(relay_module, "AsyncSessionLocal", factory)
+    yield factory
+    asyncio.run(engine.dispose())
+
+
+def _fail(relay: OutboxRelay) -> None:
+    event = {"event_id": 1, "event_type": TEAM_CREATE, "aggregate_id": PROJECT_ID, "payload": {}, "attempts": 3}
+    asyncio.run(relay._finish(event, OutboxStatus.FAILED, error="team.create 전달 실패", compensate=True))
+
+
+def _load(session_factory):
+    async def load():
+        async with session_factory() as session:
+            projects = (await session.execute(select(func.count()).select_from(Project))).scalar_one()
+            applications = (await session.execute(select(func.count()).select_from(Application))).scalar_one()
+            event = await session.get(OutboxEvent, 1)
+            return projects, applications, event
+
+    return asyncio.run(load())
+
+
+def _relay() -> OutboxRelay:
+    return OutboxRelay(poll_interval=1, batch_size=10, max_attempts=3, backoff_base=0.1, backoff_max=1, lease_seconds=60)
+
+
+def test_compensation_deletes_project_with_applications(session_factory):
+    _fail(_relay())
+
+    projects, applications, event = _load(session_factory)
+    assert (projects, applications) == (0, 0)
+    assert event.status == OutboxStatus.FAILED
+    assert event.last_error == "team.create 전달 실패"
+
+
+def test_compensation_failure_is_recorded(session_factory, monkeypatch):
+    async def broken_delete(self, project_id):
+        raise RuntimeError("DB 연결 끊김")
+
+    monkeypatch.setattr(relay_module.ProjectRecruitmentRepository, "delete_project", broken_delete)
+    failures = OUTBOX_COMPENSATION_FAILURES.labels(event_type=TEAM_CREATE)._value.get()
+
+    _fail(_relay())
+
+    projects, _, event = _load(session_factory)
+    assert projects == 1
+    assert event.status == OutboxStatus.FAILED
+    assert "보상 작업 실패: DB 연결 끊김" in event.last_error
+    assert OUTBOX_COMPENSATION_FAILURES.labels(event_type=TEAM_CREATE)._value.get() == failures + 1
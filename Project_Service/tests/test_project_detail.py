@@ -0,0 +1,115 @@
+"""
+프로젝트 상세 조회 테스트 (ETag 재검증 + write-behind 조회수 집계)
+SQLite 파일 DB에 프로젝트를 만들고 get_project_detail을 직접 호출합니다.
+사용자 조회만 조회수로 집계하고, 304 재검증과 다른 서비스의 내부 조회는 집계하지 않는지,
+조회수 반영이 ETag를 바꾸지 않는지 확인합니다.
+"""
+import asyncio
+import datetime
+from typing import Dict, Optional
+
+import pytest
+from fastapi import Response
+from starlette.requests import Request
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import app.models  # noqa: F401 - 모든 테이블을 metadata에 등록
+from app.api import projects as projects_api
+from app.core.database import Base
+from app.models.project_recruitment import (
+    PositionType, Project, ProjectMethod, ProjectRecruitmentPosition, ProjectStatus, ProjectType,
+)
+from app.repositories.project_recruitment_repository import ProjectRecruitmentRepository
+from app.services.view_counter import ViewCounter
+from app.utils.msa_client import INTERNAL_TOKEN_HEADER
+
+PROJECT_ID = 1
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'detail.sqlite'}")
+
+    async def create():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine)() as session:
+            session.add(Project(
+                project_id=PROJECT_ID, user_id="leader", type=ProjectType.PROJECT, title="테스트 프로젝트",
+                description="d", method=ProjectMethod.ONLINE, status=ProjectStatus.RECRUITING,
+                start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 3, 1), views=0,
+            ))
+            await session.flush()
+            session.add(ProjectRecruitmentPosition(
+                project_id=PROJECT_ID, position_type=PositionType.BACKEND,
+                required_stacks='["Python"]', target_count=2, current_count=0,
+            ))
+            await session.commit()
+
+    asyncio.run(create())
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def counter(monkeypatch):
+    fresh = ViewCounter(flush_interval=60)
+    monkeypatch.setattr(projects_api, "view_counter", fresh)
+    return fresh
+
+
+def _get(session_factory, headers: Optional[Dict[str, str]] = None):
+    scope = {
+        "type": "http", "method": "GET", "path": f"/projects/{PROJECT_ID}",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+    }
+
+    async def call():
+        async with session_factory() as session:
+            response = Response()
+            result = await projects_api.get_project_detail(PROJECT_ID, Request(scope), response, db=session)
+            return result, response
+
+    return asyncio.run(call())
+
+
+async def _flush_views(session_factory, views: int) -> None:
+    """ViewCounter.flush와 같은 경로로 조회수 일괄 반영"""
+    async with session_factory() as session:
+        await ProjectRecruitmentRepository(session).add_views_batch({PROJECT_ID: views})
+
+
+def test_user_view_is_counted(session_factory, counter):
+    detail, response = _get(session_factory)
+
+    assert counter.pending_for(PROJECT_ID) == 1
+    assert detail.views == 1
+    assert response.headers["ETag"]
+
+
+def test_revalidation_is_not_counted(session_factory, counter):
+    _, response = _get(session_factory)
+    etag = response.headers["ETag"]
+
+    result, _ = _get(session_factory, {"If-None-Match": etag})
+
+    assert result.status_code == 304
+    assert counter.pending_for(PROJECT_ID) == 1
+
+
+def test_internal_lookup_is_not_counted(session_factory, counter):
+    detail, _ = _get(session_factory, {INTERNAL_TOKEN_HEADER: "s3cret"})
+
+    assert counter.pending_for(PROJECT_ID) == 0
+    assert detail.views == 0
+
+
+def test_views_do_not_change_etag(session_factory, counter):
+    _, first = _get(session_factory)
+    asyncio.run(_flush_views(session_factory, 10))
+
+    result, _ = _get(session_factory, {"If-None-Match": first.headers["ETag"]})
+
+    assert result.status_code == 304
+    detail, _ = _get(session_factory)
+    assert detail.views == 12  # DB 10 + 아직 반영되지 않은 조회 2
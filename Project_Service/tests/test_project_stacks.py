@@ -0,0 +1,45 @@
+"""
+project_stack 인덱스 스택 이름 정규화 테스트
+MySQL 기본 collation(대소문자 구분 없음)과 stack 컬럼 길이(50)에서 PK 충돌/DataError가 나지 않도록
+대소문자 중복 제거와 자르기가 저장/백필/필터에 같은 규칙으로 적용되는지 확인합니다.
+"""
+from app.models.project_recruitment import PositionType, ProjectStack
+from app.repositories.project_recruitment_repository import build_project_stack_rows
+from app.utils.stacks import STACK_NAME_MAX_LENGTH, parse_stack_index_names
+
+
+def test_case_variants_keep_first_spelling():
+    assert parse_stack_index_names('["React", "react", "REACT ", "TypeScript"]') == ["React", "TypeScript"]
+    assert parse_stack_index_names("Node.js,node.JS,Python") == ["Node.js", "Python"]
+
+
+def test_long_names_are_truncated_and_deduplicated():
+    prefix = "X" * STACK_NAME_MAX_LENGTH
+    stacks = parse_stack_index_names([prefix + "-alpha", prefix + "-beta", "Go"])
+
+    # 자른 뒤 같아지는 이름은 하나만 남음
+    assert stacks == [prefix, "Go"]
+
+
+def test_truncation_does_not_leave_trailing_space():
+    name = "A" * (STACK_NAME_MAX_LENGTH - 1) + " tail"
+
+    assert parse_stack_index_names([name]) == ["A" * (STACK_NAME_MAX_LENGTH - 1)]
+
+
+def test_stack_rows_are_unique_per_position():
+    rows = build_project_stack_rows(1, [
+        (PositionType.FRONTEND, '["React","react","TypeScript"]'),
+        (PositionType.BACKEND, "Python,PYTHON," + "y" * 60),
+    ])
+
+    keys = [(row.position_type, row.stack.casefold()) for row in rows]
+    assert len(keys) == len(set(keys))
+    assert all(len(row.stack) <= STACK_NAME_MAX_LENGTH for row in rows)
+    assert [(row.position_type, row.stack) for row in rows] == [
+        (PositionType.FRONTEND, "React"),
+        (PositionType.FRONTEND, "TypeScript"),
+        (PositionType.BACKEND, "Python"),
+        (PositionType.BACKEND, "y" * STACK_NAME_MAX_LENGTH),
+    ]
+    assert ProjectStack.__table__.c.stack.type.length == STACK_NAME_MAX_LENGTH
@@ -0,0 +1,80 @@
+"""
+기술 스택 추천 bit-sliced 랭킹 테스트
+rank()가 프로젝트별 popcount(사용자 스택 일치 수)로 직접 정렬한 결과와 같은지 확인합니다.
+"""
+import random
+from typing import Dict, FrozenSet, List, Tuple
+
+import pytest
+
+from app.services.recommendations import StackIndex, _bit_sliced_sum, _score_mask, rank
+
+
+def _make_index(n_projects: int, bitmaps: Dict[str, int]) -> StackIndex:
+    return StackIndex(
+        version=1,
+        built_at=0.0,
+        projects=[{"project_id": i} for i in range(n_projects)],
+        bitmaps=bitmaps,
+    )
+
+
+def _brute_force_rank(n_projects: int, bitmaps: Dict[str, int], user_stacks: FrozenSet[str], limit: int) -> List[Tuple[int, int]]:
+    """프로젝트마다 일치하는 스택 수를 직접 세어 점수 내림차순 → 비트 번호(최신) 오름차순 정렬"""
+    scored = []
+    for bit in range(n_projects):
+        score = sum(1 for s in user_stacks if (bitmaps.get(s, 0) >> bit) & 1)
+        if score:
+            scored.append((bit, score))
+    scored.sort(key=lambda item: (-item[1], item[0]))
+    return scored[:limit]
+
+
+def test_rank_skips_projects_without_matches():
+    # 점수 비트 수(1)보다 사용자 스택 수(2)가 많아도 일치 0개 프로젝트가 점수 2로 잡히면 안 됨
+    bitmaps = {"react": 0b001, "python": 0b010, "figma": 0b100}
+    index = _make_index(3, bitmaps)
+
+    assert rank(index, frozenset({"react", "python"}), limit=10) == [(0, 1), (1, 1)]
+
+
+def test_rank_orders_by_score_then_newest():
+    bitmaps = {"react": 0b0111, "typescript": 0b0110, "python": 0b1100}
+    index = _make_index(4, bitmaps)
+
+    assert rank(index, frozenset({"react", "typescript", "python"}), limit=10) == [(2, 3), (1, 2), (0, 1), (3, 1)]
+    assert rank(index, frozenset({"react", "typescript", "python"}), limit=2) == [(2, 3), (1, 2)]
+
+
+def test_rank_ignores_unknown_stacks():
+    index = _make_index(2, {"react": 0b01})
+
+    assert rank(index, frozenset({"kotlin"}), limit=5) == []
+    assert rank(index, frozenset({"react", "kotlin"}), limit=5) == [(0, 1)]
+
+
+def test_score_mask_rejects_scores_wider_than_counters():
+    counters = _bit_sliced_sum([0b01, 0b10])  # 모든 프로젝트 점수 ≤ 1 → 점수 비트 1개
+
+    assert len(counters) == 1
+    assert _score_mask(counters, 2, 0b11) == 0
+    assert _score_mask(counters, 1, 0b11) == 0b11
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_rank_matches_brute_force_popcount(seed):
+    rng = random.Random(seed)
+    n_projects = rng.randint(1, 200)
+    stacks = [f"stack{i}" for i in range(rng.randint(1, 12))]
+    # 희소/밀집 비트맵을 섞어 점수 분포가 한쪽으로 쏠리는 경우까지 포함
+    density = rng.choice([0.05, 0.3, 0.7])
+    bitmaps = {
+        s: sum(1 << bit for bit in range(n_projects) if rng.random() < density)
+        for s in stacks
+    }
+    user_stacks = frozenset(rng.sample(stacks + ["unknown"], rng.randint(1, len(stacks) + 1)))
+    limit = rng.randint(1, n_projects + 5)
+
+    index = _make_index(n_projects, bitmaps)
+
+    assert rank(index, user_stacks, limit) == _brute_force_rank(n_projects, bitmaps, user_stacks, limit)
@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends
-from typing import Optional
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, Field
 
 from app.schemas.base import ResponseEnvelope
 from app.core.deps import get_current_user
-from app.services.notification_service import list_notifications, create_notification
+from app.services.notification_service import list_notifications, create_notification, create_notifications_batch
 
 router = APIRouter()
 
@@ -15,6 +15,10 @@ class NotificationCreate(BaseModel):
     link: Optional[str] = None
 
 
+class NotificationBatchCreate(BaseModel):
+    notifications: List[NotificationCreate] = Field(..., max_length=500)
+
+
 @router.get("", response_model=ResponseEnvelope)
 async def list_notifications_api(user_id: Optional[str] = None, current_user=Depends(get_current_user)):
     data = await list_notifications(user_id or str(current_user.get("id")))
@@ -30,3 +34,10 @@ async def create_notification_api(notification: NotificationCreate):
         link=notification.link
     )
     return ResponseEnvelope(success=True, code="NOTI_001", message="Notification created", data=data)
+
+
+@router.post("/batch", response_model=ResponseEnvelope)
+async def create_notifications_batch_api(batch: NotificationBatchCreate):
+    """알림 일괄 생성 API (다른 서비스의 알림 큐에서 호출, 단일 bulk INSERT)"""
+    created = await create_notifications_batch([n.model_dump() for n in batch.notifications])
+    return ResponseEnvelope(success=True, code="NOTI_002", message="Notifications created", data={"created": created})
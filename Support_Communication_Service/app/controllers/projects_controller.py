@@ -8,10 +8,9 @@ from pydantic import BaseModel
 from app.schemas.base import ResponseEnvelope
 from app.core.deps import get_current_user
 from app.services.notification_service import create_notification
-from app.utils.msa_client import MSAClient
+from app.utils.msa_client import msa_client
 
 router = APIRouter()
-msa_client = MSAClient()
 
 
 class ProjectApplyRequest(BaseModel):
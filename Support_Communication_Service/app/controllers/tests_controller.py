@@ -6,10 +6,9 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from app.schemas.base import ResponseEnvelope
 from app.core.deps import get_current_user
-from app.utils.msa_client import MSAClient
+from app.utils.msa_client import msa_client
 
 router = APIRouter()
-msa_client = MSAClient()
 
 
 class TestGenerateRequest(BaseModel):
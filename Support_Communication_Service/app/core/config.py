@@ -21,6 +21,16 @@ class Settings(BaseSettings):
     COGNITO_USERPOOL_ID: str = ""
     COGNITO_APP_CLIENT_ID: str = ""
     
+    # [MSA HTTP Client - 서비스 간 통신 커넥션 풀]
+    MSA_HTTP_TIMEOUT: float = 30.0
+    MSA_MAX_CONNECTIONS: int = 100            # 대상 서비스별 최대 연결 수
+    MSA_MAX_KEEPALIVE_CONNECTIONS: int = 20   # 유지할 keep-alive 연결 수
+    MSA_KEEPALIVE_EXPIRY: float = 30.0        # 유휴 연결 만료 시간(초)
+    MSA_HTTP2: bool = False                   # HTTP/2 사용 (h2 패키지 필요)
+
+    # [MSA Internal Auth - 서비스 간 /internal 호출 인증]
+    INTERNAL_SERVICE_TOKEN: str = ""         # X-Internal-Token 공유 토큰 (비어 있으면 /internal은 loopback 호출만 허용)
+    
     # [Security - JWT Settings]
     # Cognito는 RS256을 사용하므로 알고리즘을 고정합니다.
     JWT_ALGORITHM: str = "RS256"
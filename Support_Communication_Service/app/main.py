@@ -5,6 +5,7 @@ from prometheus_fastapi_instrumentator import Instrumentator
 from app.core.middleware import LoggingMiddleware
 from fastapi.middleware.cors import CORSMiddleware
 from app.controllers import all_routers
+from app.utils.msa_client import msa_client, register_pool_metrics
 
 app = FastAPI(
     title="Portforge Support & Communication Service",
@@ -26,11 +27,21 @@ app.add_middleware(
 
 # 2. 프로메테우스 메트릭 설정 (자동으로 /metrics 엔드포인트 생성)
 Instrumentator().instrument(app).expose(app)
+register_pool_metrics()  # MSAClient 커넥션 풀 상태
 
 # 3. 반복문으로 새 컨트롤러(api) 자동 등록
 for router, prefix, tag in all_routers:
     app.include_router(router, prefix=prefix, tags=[tag])
 
+# MSA 통신용 공유 커넥션 풀 생성/정리
+@app.on_event("startup")
+async def startup_event():
+    await msa_client.startup()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await msa_client.aclose()
+
 # 전역 예외 핸들러: 한 번 등록하면 팀원들은 신경 안 써도 됨
 @app.exception_handler(BusinessException)
 async def business_exception_handler(request: Request, exc: BusinessException):
@@ -1,6 +1,6 @@
 from typing import Optional, List, Dict, Any
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import AsyncSessionLocal
@@ -34,6 +34,22 @@ async def create_notification(
         }
 
 
+async def create_notifications_batch(notifications: List[Dict[str, Any]]) -> int:
+    """
+    Insert many notification rows with a single bulk INSERT and return the count.
+    """
+    if not notifications:
+        return 0
+    rows = [
+        {"user_id": n["user_id"], "message": n["message"], "link": n.get("link")}
+        for n in notifications
+    ]
+    async with AsyncSessionLocal() as session:  # type: AsyncSession
+        await session.execute(insert(Notification), rows)
+        await session.commit()
+    return len(rows)
+
+
 async def list_notifications(user_id: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Fetch notifications, optionally filtered by user_id.
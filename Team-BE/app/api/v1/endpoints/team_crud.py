@@ -16,6 +16,7 @@ from app.core.database import get_db
 from app.models.team import Team, TeamMember, SharedFile, Invitation
 from app.models.task import Task
 from app.models.enums import TeamRole, StackCategory
+from app.utils.projections import TASK_LIST_COLUMNS
 
 logger = logging.getLogger(__name__)
 
@@ -185,6 +186,90 @@ async def add_team_member(member_data: dict, db: AsyncSession = Depends(get_db))
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"팀 멤버 추가 실패: {str(e)}")
 
+MAX_BATCH_MEMBERS = 500
+
+
+@router.post("/members/batch")
+async def add_team_members_batch(batch_data: dict, db: AsyncSession = Depends(get_db)):
+    """
+    팀 멤버 일괄 추가 - Project Service에서 지원자 일괄 승인 시 호출
+    팀/기존 멤버를 한 번에 조회하고 한 트랜잭션으로 추가, 항목별 결과 반환
+    (이미 멤버인 경우도 성공 - 재요청해도 안전)
+    """
+    try:
+        members = batch_data.get("members")
+        if not isinstance(members, list) or not members:
+            raise HTTPException(status_code=400, detail="members 목록은 필수입니다.")
+        if len(members) > MAX_BATCH_MEMBERS:
+            raise HTTPException(status_code=400, detail=f"한 번에 최대 {MAX_BATCH_MEMBERS}명까지 추가할 수 있습니다.")
+        
+        # 팀 일괄 조회
+        project_ids = {m.get("project_id") for m in members if isinstance(m, dict) and m.get("project_id")}
+        team_result = await db.execute(select(Team).where(Team.project_id.in_(project_ids)))
+        teams = {team.project_id: team for team in team_result.scalars().all()}
+        
+        # 기존 멤버 일괄 조회
+        user_ids = {m.get("user_id") for m in members if isinstance(m, dict) and m.get("user_id")}
+        existing = set()
+        if teams and user_ids:
+            existing_result = await db.execute(
+                select(TeamMember.team_id, TeamMember.user_id).where(
+                    TeamMember.team_id.in_([team.team_id for team in teams.values()]),
+                    TeamMember.user_id.in_(user_ids),
+                )
+            )
+            existing = {tuple(row) for row in existing_result.all()}
+        
+        results = []
+        new_members = []
+        for member_data in members:
+            member_data = member_data if isinstance(member_data, dict) else {}
+            project_id = member_data.get("project_id")
+            user_id = member_data.get("user_id")
+            item = {"project_id": project_id, "user_id": user_id}
+            
+            if not project_id or not user_id:
+                results.append({**item, "status": "error", "detail": "project_id와 user_id는 필수입니다."})
+                continue
+            
+            team = teams.get(project_id)
+            if not team:
+                results.append({**item, "status": "error", "detail": "팀을 찾을 수 없습니다."})
+                continue
+            
+            if (team.team_id, user_id) in existing:
+                results.append({**item, "team_id": team.team_id, "status": "exists"})
+                continue
+            
+            role = TeamRole.LEADER if member_data.get("role") == "LEADER" else TeamRole.MEMBER
+            new_members.append(TeamMember(
+                team_id=team.team_id,
+                user_id=user_id,
+                role=role,
+                position_type=convert_position_type(member_data.get("position_type", "BACKEND")),
+            ))
+            existing.add((team.team_id, user_id))
+            results.append({**item, "team_id": team.team_id, "status": "added"})
+        
+        if new_members:
+            db.add_all(new_members)
+            await db.commit()
+        
+        logger.info(f"팀 멤버 일괄 추가: {len(new_members)}명 추가 / 요청 {len(members)}건")
+        
+        return {
+            "status": "success",
+            "message": f"{len(new_members)}명의 팀 멤버가 추가되었습니다.",
+            "data": {"results": results}
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"팀 멤버 일괄 추가 실패: {str(e)}")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"팀 멤버 일괄 추가 실패: {str(e)}")
+
 # =====================================================
 # 3. 팀 정보 조회 (프로젝트 ID로)
 # =====================================================
@@ -346,14 +431,15 @@ async def delete_team_by_project(project_id: int, db: AsyncSession = Depends(get
 async def get_tasks(project_id: int, status: Optional[str] = None, db: AsyncSession = Depends(get_db)):
     """칸반 보드 태스크 조회"""
     try:
-        query = select(Task).where(Task.project_id == project_id)
+        # ORM 엔티티 대신 필요한 컬럼만 Row로 조회
+        query = select(*TASK_LIST_COLUMNS).where(Task.project_id == project_id)
         
         if status:
             query = query.where(Task.status == status)
         
         query = query.order_by(Task.created_at.desc())
         result = await db.execute(query)
-        tasks = result.scalars().all()
+        tasks = result.all()
         
         tasks_data = []
         for task in tasks:
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, UploadFile, File, Form
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, text
+from sqlalchemy import func, select, text
 from typing import Optional
 from app.core.database import get_db
 from app.models.enums import TeamRole, StackCategory
 import logging
 from datetime import datetime
 from app.utils.s3_paths import get_team_s3_key, get_meeting_s3_key, get_file_upload_s3_key
+from app.utils.etag import etag_matches, make_etag
+from app.utils.msa_client import msa_client  # 앱 수명 동안 공유하는 커넥션 풀
+from app.services.user_profile_cache import user_profile_cache
 from app.models.team import Team, TeamMember, SharedFile # 모델 추가 import
 
 # 로깅 설정
@@ -17,11 +20,27 @@ router = APIRouter()
 # ============= 간단한 팀 API =============
 
 @router.get("/{project_id}/stats")
-async def get_team_stats(project_id: int, db: AsyncSession = Depends(get_db)):
-    """팀 대시보드 정보 조회 (간단 버전)"""
+async def get_team_stats(project_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_db)):
+    """팀 대시보드 정보 조회 (간단 버전, If-None-Match가 같으면 304)"""
     try:
         from app.models.team import Team, TeamMember
         
+        # ETag용 버전 조회 (팀 수정 시각 + 멤버 수/최종 수정 시각 - 집계 쿼리 한 번)
+        # 응답에 Auth 닉네임이 포함되므로 사용자 정보 캐시 버전도 ETag에 포함 (닉네임 변경 시 304 방지)
+        version_result = await db.execute(
+            select(Team.team_id, Team.updated_at, func.count(TeamMember.user_id), func.max(TeamMember.updated_at))
+            .outerjoin(TeamMember, TeamMember.team_id == Team.team_id)
+            .where(Team.project_id == project_id)
+            .group_by(Team.team_id)
+        )
+        version = version_result.first()
+        headers = None
+        if version:
+            etag = make_etag(project_id, *version, *user_profile_cache.etag_version())
+            headers = {"ETag": etag, "Cache-Control": "no-cache"}
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        
         # 팀 정보 조회
         team_result = await db.execute(select(Team).where(Team.project_id == project_id))
         team = team_result.scalar_one_or_none()
@@ -71,12 +90,12 @@ async def get_team_stats(project_id: int, db: AsyncSession = Depends(get_db)):
         
         # Auth 서비스에서 사용자 정보 일괄 조회 시도
         users_dict = {}
+        users_loaded = not user_ids
         try:
-            from app.utils.msa_client import MSAClient
-            msa_client = MSAClient()
             users_data = await msa_client.get_users_batch(user_ids)
             if users_data:
                 users_dict = {u["user_id"]: u for u in users_data}
+                users_loaded = True
         except Exception as e:
             logger.warning(f"Auth 서비스 조회 실패: {str(e)}")
         
@@ -97,6 +116,11 @@ async def get_team_stats(project_id: int, db: AsyncSession = Depends(get_db)):
                 "position_type": position_clean,
                 "updated_at": member.updated_at.isoformat() if member.updated_at else None
             })
+        
+        # ETag는 실제 데이터를 끝까지 만든 응답에만 부여
+        # (Mock/오류 응답이나 닉네임 대신 user_id로 채운 응답이 304로 재사용되지 않도록)
+        if headers and users_loaded:
+            response.headers.update(headers)
         return {
             "team": team_data,
             "members": members_data,
@@ -135,29 +159,16 @@ async def get_tasks(project_id: int, status: Optional[str] = None, db: AsyncSess
     """칸반 보드 태스크 조회"""
     try:
         from app.models.task import Task
+        from app.utils.projections import TASK_LIST_COLUMNS, task_row
         
-        query = select(Task).where(Task.project_id == project_id)
+        # ORM 엔티티 대신 필요한 컬럼만 Row로 조회
+        query = select(*TASK_LIST_COLUMNS).where(Task.project_id == project_id)
         
         if status:
             query = query.where(Task.status == status)
             
         result = await db.execute(query)
-        tasks = result.scalars().all()
-        
-        return [
-            {
-                "task_id": task.task_id,
-                "project_id": task.project_id,
-                "title": task.title,
-                "description": task.description,
-                "status": task.status.value if hasattr(task.status, 'value') else task.status,
-                "priority": task.priority.value if hasattr(task.priority, 'value') else task.priority,
-                "created_by": task.created_by,
-                "assignee_id": task.assignee_id,
-                "due_date": task.due_date.isoformat() if task.due_date else None,
-                "created_at": task.created_at.isoformat() if task.created_at else None
-            } for task in tasks
-        ]
+        return [task_row(row) for row in result.all()]
     except Exception as e:
         logger.error(f"태스크 조회 실패: {str(e)}")
         # 실패 시 빈 리스트 반환 (프론트엔드 에러 방지)
@@ -165,9 +176,11 @@ async def get_tasks(project_id: int, status: Optional[str] = None, db: AsyncSess
 
 @router.get("/{project_id}/files")
 async def get_team_files(project_id: int, db: AsyncSession = Depends(get_db)):
-    """팀 파일 목록 조회"""
+    """팀 파일 목록 조회 (다운로드 URL은 페이지 단위 일괄 서명, 만료 전까지 캐시 재사용)"""
     try:
         from app.models.team import Team
+        from app.core.config import settings
+        from app.services.file_service import file_service
         
         # 팀 ID 조회
         team_result = await db.execute(select(Team).where(Team.project_id == project_id))
@@ -183,6 +196,9 @@ async def get_team_files(project_id: int, db: AsyncSession = Depends(get_db)):
             .order_by(SharedFile.created_at.desc())
         )
         files = result.scalars().all()
+        download_urls = await file_service.get_download_urls(
+            [f.s3_key for f in files], settings.FILE_DOWNLOAD_URL_EXPIRES_SECONDS
+        )
         
         return {
             "success": True,
@@ -194,7 +210,8 @@ async def get_team_files(project_id: int, db: AsyncSession = Depends(get_db)):
                     "type": getattr(f, 'file_type', 'unknown'),
                     "uploader": f.uploaded_by,
                     "date": f.created_at.strftime("%Y-%m-%d") if f.created_at else "",
-                    "s3_key": f.s3_key
+                    "s3_key": f.s3_key,
+                    "download_url": download_urls.get(f.s3_key)
                 }
                 for f in files
             ]
@@ -278,6 +295,23 @@ class FileUploadRequest(BaseModel):
     description: Optional[str] = None
 
 
+class FileUploadUrlRequest(BaseModel):
+    """브라우저 직접 업로드 URL 발급 요청"""
+    file_name: str
+    file_size: int
+    content_type: Optional[str] = None
+
+
+class FileUploadCompleteRequest(BaseModel):
+    """브라우저 직접 업로드 완료 요청 (PUT 응답의 ETag 포함)"""
+    s3_key: str
+    file_name: str
+    file_size: int
+    etag: str
+    user_id: str
+    description: Optional[str] = None
+
+
 class InvitationCreateRequest(BaseModel):
     """팀원 초대 요청"""
     position_type: str
@@ -356,9 +390,6 @@ async def trigger_meeting(
     
     # AI 서비스 호출 (MSA 클라이언트 사용)
     try:
-        from app.utils.msa_client import MSAClient
-        msa_client = MSAClient()
-        
         if request.action == "start":
             result = await msa_client.call_ai_meeting_start({
                 "team_id": project_id,
@@ -456,9 +487,6 @@ async def summarize_meeting(
     """회의록 AI 요약 요청 (AI 서비스 연동)"""
     
     try:
-        from app.utils.msa_client import MSAClient
-        msa_client = MSAClient()
-        
         # AI 서비스에 요약 요청
         result = await msa_client.call_ai_minutes_generate({
             "team_id": project_id,
@@ -655,7 +683,7 @@ async def upload_file_multipart(
 ):
     """파일 업로드 (실제 파일 + 메타데이터 저장)"""
     from app.models.team import Team, SharedFile
-    from app.services.file_service import FileService
+    from app.services.file_service import file_service
     
     try:
         # 팀 확인
@@ -668,9 +696,8 @@ async def upload_file_multipart(
                 detail="팀을 찾을 수 없습니다."
             )
         
-        # MinIO에 파일 업로드
-        file_service = FileService()
-        upload_result = file_service.upload_file(file, team.team_id, user_id)
+        # MinIO에 파일 업로드 (공유 클라이언트, 업로드 스레드 풀에서 전송)
+        upload_result = await file_service.upload_file(file, team.team_id, user_id)
         
         # DB에 메타데이터 저장
         shared_file = SharedFile(
@@ -759,6 +786,106 @@ async def upload_file(
         )
 
 
+# 7-2. 브라우저 직접 업로드 (presigned PUT URL 발급 -> MinIO/S3로 직접 PUT -> 완료 확인)
+@router.post("/{project_id}/files/upload-url")
+async def create_file_upload_url(
+    project_id: int,
+    request: FileUploadUrlRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """파일 바이트가 API 서버를 거치지 않도록 presigned PUT URL 발급"""
+    from app.services.file_service import MAX_FILE_SIZE, file_service
+    
+    team_result = await db.execute(select(Team.team_id).where(Team.project_id == project_id))
+    team_id = team_result.scalar_one_or_none()
+    if team_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="팀을 찾을 수 없습니다.")
+    if request.file_size > MAX_FILE_SIZE:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="파일 크기가 10MB를 초과합니다.")
+    
+    upload = await file_service.create_upload_url(team_id, request.file_name)
+    return {
+        "success": True,
+        "method": "PUT",
+        "headers": {"Content-Type": request.content_type or "application/octet-stream"},
+        **upload
+    }
+
+
+@router.post("/{project_id}/files/complete", status_code=status.HTTP_201_CREATED)
+async def complete_file_upload(
+    project_id: int,
+    request: FileUploadCompleteRequest,
+    response: Response,
+    db: AsyncSession = Depends(get_db)
+):
+    """직접 업로드 완료 처리 - stat_object로 크기/ETag 확인 후 SharedFile 저장 (같은 키 재요청은 기존 파일 반환)"""
+    from app.services.file_service import MAX_FILE_SIZE, file_service
+    
+    team_result = await db.execute(select(Team.team_id).where(Team.project_id == project_id))
+    team_id = team_result.scalar_one_or_none()
+    if team_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="팀을 찾을 수 없습니다.")
+    if not file_service.is_shared_file_key(team_id, request.s3_key):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="이 팀에서 발급된 업로드 키가 아닙니다.")
+    
+    existing_result = await db.execute(
+        select(SharedFile).where(SharedFile.team_id == team_id, SharedFile.s3_key == request.s3_key)
+    )
+    shared_file = existing_result.scalar_one_or_none()
+    
+    if shared_file is not None:
+        response.status_code = status.HTTP_200_OK
+    else:
+        info = await file_service.stat_file(request.s3_key)
+        if info is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="업로드된 파일을 찾을 수 없습니다.")
+        
+        # presigned PUT은 크기를 제한할 수 없으므로 여기서 확인하고, 맞지 않는 객체는 삭제
+        if info["size"] > MAX_FILE_SIZE:
+            await file_service.remove_file(request.s3_key)
+            raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="파일 크기가 10MB를 초과합니다.")
+        if info["size"] != request.file_size or (info["etag"] or "").strip('"') != request.etag.strip('"'):
+            await file_service.remove_file(request.s3_key)
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="업로드된 파일의 크기 또는 ETag가 일치하지 않습니다. 다시 업로드해주세요.")
+        
+        shared_file = SharedFile(
+            project_id=project_id,
+            team_id=team_id,
+            file_name=request.file_name,
+            file_size=info["size"],
+            file_type=(info["content_type"] or "application/octet-stream")[:50],
+            file_url=file_service.object_url(request.s3_key),
+            s3_key=request.s3_key,
+            uploaded_by=request.user_id,
+            description=request.description
+        )
+        try:
+            db.add(shared_file)
+            await db.commit()
+            await db.refresh(shared_file)
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"파일 메타데이터 저장 실패: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"파일 업로드 중 오류 발생: {str(e)}"
+            )
+    
+    return {
+        "success": True,
+        "message": "파일이 업로드되었습니다.",
+        "file": {
+            "file_id": shared_file.file_id,
+            "name": shared_file.file_name,
+            "size": f"{shared_file.file_size / 1024 / 1024:.2f} MB" if shared_file.file_size else "0 MB",
+            "s3_key": shared_file.s3_key,
+            "uploaded_by": shared_file.uploaded_by,
+            "created_at": shared_file.created_at.isoformat() if shared_file.created_at else None
+        }
+    }
+
+
 # 8. 팀원 초대 API
 @router.post("/{project_id}/invitations", status_code=status.HTTP_201_CREATED)
 async def create_invitation(
@@ -0,0 +1,382 @@
+"""
+Team Service - 재개 가능한 대용량 업로드 API
+팀 공유 파일(10MB 초과 포함)과 회의 녹음을 part 단위로 MinIO/S3에 직접 업로드합니다.
+
+1. POST /{project_id}/uploads                        세션 생성 (multipart 시작 + 첫 part URL 발급)
+2. PUT  <part_url>                                   브라우저가 part를 MinIO/S3로 직접 전송
+3. GET  /{project_id}/uploads/{upload_id}            연결이 끊긴 뒤 재개 시 업로드된/남은 part 조회
+4. POST /{project_id}/uploads/{upload_id}/part-urls  남은 part URL 재발급
+5. POST /{project_id}/uploads/{upload_id}/complete   part 확인 후 multipart 완료 + SharedFile 저장
+6. DELETE /{project_id}/uploads/{upload_id}          업로드 취소
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+from minio.error import S3Error
+from typing import List, Optional
+from datetime import datetime, timedelta
+import logging
+import uuid
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.models.team import Team, MeetingSession, SharedFile, UploadSession
+from app.models.enums import UploadKind, UploadStatus
+from app.services.file_service import file_service
+from app.utils.s3_paths import get_meeting_audio_s3_key
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# 한 번에 발급하는 part URL 최대 개수
+MAX_PART_URLS_PER_REQUEST = 100
+
+
+class UploadCreateRequest(BaseModel):
+    """재개 가능 업로드 세션 생성 요청"""
+    kind: UploadKind = UploadKind.SHARED_FILE
+    file_name: str
+    file_size: int
+    content_type: Optional[str] = None
+    user_id: str
+    description: Optional[str] = None
+    meeting_session_id: Optional[int] = None  # MEETING_AUDIO일 때 필수
+
+
+class PartUrlsRequest(BaseModel):
+    """part URL 재발급 요청"""
+    part_numbers: List[int]
+
+
+# =====================================================
+# 헬퍼 함수
+# =====================================================
+async def _get_session(db: AsyncSession, project_id: int, upload_id: str) -> UploadSession:
+    result = await db.execute(
+        select(UploadSession).where(UploadSession.upload_id == upload_id, UploadSession.project_id == project_id)
+    )
+    session = result.scalar_one_or_none()
+    if session is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="업로드 세션을 찾을 수 없습니다.")
+    return session
+
+
+async def _abort_session(db: AsyncSession, session: UploadSession) -> None:
+    """MinIO multipart 취소(업로드된 part 삭제) + 세션 ABORTED"""
+    try:
+        await file_service.abort_multipart_upload(session.s3_key, session.s3_upload_id)
+    except S3Error as e:
+        if e.code != "NoSuchUpload":
+            logger.warning(f"multipart 업로드 취소 실패: {session.upload_id} - {e}")
+    session.status = UploadStatus.ABORTED
+    await db.commit()
+
+
+async def _ensure_resumable(db: AsyncSession, session: UploadSession) -> None:
+    """진행 중인 세션인지 확인 (만료된 세션은 정리 후 410)"""
+    if session.status == UploadStatus.ABORTED:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="취소되었거나 만료된 업로드입니다. 다시 업로드해주세요.")
+    if session.status == UploadStatus.IN_PROGRESS and session.expires_at <= datetime.now():
+        await _abort_session(db, session)
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="취소되었거나 만료된 업로드입니다. 다시 업로드해주세요.")
+
+
+async def _list_parts(db: AsyncSession, session: UploadSession, allow_completed: bool = False) -> Optional[list]:
+    """
+    업로드된 part 목록 조회
+    allow_completed=True면 multipart가 이미 합쳐진 경우(이전 완료 요청의 응답만 유실) None 반환
+    """
+    try:
+        return await file_service.list_uploaded_parts(session.s3_key, session.s3_upload_id)
+    except S3Error as e:
+        if e.code == "NoSuchUpload":
+            if allow_completed and await file_service.stat_file(session.s3_key) is not None:
+                return None
+            # 스토리지 수명 주기 정책 등으로 multipart가 정리된 경우
+            session.status = UploadStatus.ABORTED
+            await db.commit()
+            raise HTTPException(status_code=status.HTTP_410_GONE, detail="취소되었거나 만료된 업로드입니다. 다시 업로드해주세요.")
+        logger.error(f"업로드 part 조회 실패: {session.upload_id} - {e}")
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="업로드 상태를 조회할 수 없습니다.")
+
+
+def _session_state(session: UploadSession, parts: Optional[list] = None) -> dict:
+    data = {
+        "upload_id": session.upload_id,
+        "kind": session.kind.value,
+        "status": session.status.value,
+        "s3_key": session.s3_key,
+        "file_name": session.file_name,
+        "file_size": session.file_size,
+        "part_size": session.part_size,
+        "part_count": session.part_count,
+        "expires_at": session.expires_at.isoformat() if session.expires_at else None,
+    }
+    if parts is not None:
+        uploaded = {part.part_number for part in parts}
+        data["uploaded_parts"] = [
+            {"part_number": part.part_number, "size": part.size, "etag": part.etag} for part in parts
+        ]
+        data["uploaded_bytes"] = sum(part.size or 0 for part in parts)
+        data["missing_parts"] = [n for n in range(1, session.part_count + 1) if n not in uploaded]
+    return data
+
+
+async def _completed_response(db: AsyncSession, session: UploadSession) -> dict:
+    response = {"success": True, "upload": _session_state(session)}
+    if session.kind == UploadKind.MEETING_AUDIO:
+        response["meeting_session_id"] = session.meeting_session_id
+    elif session.file_id:
+        shared_file = await db.get(SharedFile, session.file_id)
+        if shared_file:
+            response["file"] = {
+                "file_id": shared_file.file_id,
+                "name": shared_file.file_name,
+                "size": f"{shared_file.file_size / 1024 / 1024:.2f} MB" if shared_file.file_size else "0 MB",
+                "s3_key": shared_file.s3_key,
+                "uploaded_by": shared_file.uploaded_by,
+                "created_at": shared_file.created_at.isoformat() if shared_file.created_at else None
+            }
+    return response
+
+
+async def _complete_multipart(db: AsyncSession, session: UploadSession) -> None:
+    """COMPLETING 세션의 part를 확인하고 MinIO multipart 완료 (실패 시 HTTPException)"""
+    parts = await _list_parts(db, session, allow_completed=True)
+    if parts is None:
+        return
+    state = _session_state(session, parts)
+    if state["missing_parts"] or state["uploaded_bytes"] != session.file_size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"업로드되지 않은 part가 있습니다: {state['missing_parts'][:20]} "
+                   f"({state['uploaded_bytes']}/{session.file_size} bytes)"
+        )
+
+    try:
+        await file_service.complete_multipart_upload(session.s3_key, session.s3_upload_id, parts)
+    except S3Error as e:
+        # 동시에 진행된 다른 완료 요청이 먼저 합친 경우
+        if e.code == "NoSuchUpload" and await file_service.stat_file(session.s3_key) is not None:
+            return
+        logger.error(f"multipart 업로드 완료 실패: {session.upload_id} - {e}")
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="업로드를 완료할 수 없습니다. 업로드 상태를 확인 후 다시 시도해주세요."
+        )
+
+
+async def _release_claim(db: AsyncSession, upload_id: str) -> None:
+    """완료 처리 실패/취소 시 COMPLETING -> IN_PROGRESS 복원 (다시 완료 요청할 수 있도록, ABORTED로 정리된 세션은 그대로)"""
+    try:
+        await db.rollback()
+        await db.execute(
+            update(UploadSession)
+            .where(UploadSession.upload_id == upload_id, UploadSession.status == UploadStatus.COMPLETING)
+            .values(status=UploadStatus.IN_PROGRESS)
+        )
+        await db.commit()
+    except Exception as e:
+        logger.error(f"업로드 완료 상태 복원 실패: {upload_id} - {e}")
+
+
+async def _finalize(db: AsyncSession, session: UploadSession) -> None:
+    """MinIO 완료 후 DB 기록 (공유 파일이면 SharedFile 생성, COMPLETING -> COMPLETED 조건부 변경으로 한 번만)"""
+    claim = await db.execute(
+        update(UploadSession)
+        .where(UploadSession.upload_id == session.upload_id, UploadSession.status == UploadStatus.COMPLETING)
+        .values(status=UploadStatus.COMPLETED)
+    )
+    if claim.rowcount != 1:
+        # 동시에 진행된 다른 완료 요청이 먼저 기록한 경우
+        await db.rollback()
+        await db.refresh(session)
+        if session.status != UploadStatus.COMPLETED:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="업로드 완료 처리 중입니다. 잠시 후 다시 확인해주세요.")
+        return
+
+    if session.kind == UploadKind.SHARED_FILE:
+        shared_file = SharedFile(
+            project_id=session.project_id,
+            team_id=session.team_id,
+            file_name=session.file_name,
+            file_size=session.file_size,
+            file_type=session.content_type[:50],
+            file_url=file_service.object_url(session.s3_key),
+            s3_key=session.s3_key,
+            uploaded_by=session.uploaded_by,
+            description=session.description
+        )
+        db.add(shared_file)
+        await db.flush()
+        session.file_id = shared_file.file_id
+    await db.commit()
+    await db.refresh(session)
+
+
+# =====================================================
+# API
+# =====================================================
+@router.post("/{project_id}/uploads", status_code=status.HTTP_201_CREATED)
+async def create_upload(project_id: int, request: UploadCreateRequest, db: AsyncSession = Depends(get_db)):
+    """재개 가능 업로드 세션 생성 - part 크기/개수와 첫 part URL 반환"""
+    team_result = await db.execute(select(Team.team_id).where(Team.project_id == project_id))
+    team_id = team_result.scalar_one_or_none()
+    if team_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="팀을 찾을 수 없습니다.")
+    if request.file_size <= 0:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="빈 파일은 업로드할 수 없습니다.")
+    if request.file_size > settings.FILE_MULTIPART_MAX_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"파일 크기가 {settings.FILE_MULTIPART_MAX_SIZE // (1024 * 1024)}MB를 초과합니다."
+        )
+
+    if request.kind == UploadKind.MEETING_AUDIO:
+        if request.meeting_session_id is None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="회의 녹음 업로드에는 meeting_session_id가 필요합니다.")
+        meeting_result = await db.execute(
+            select(MeetingSession.session_id).where(
+                MeetingSession.session_id == request.meeting_session_id,
+                MeetingSession.team_id == team_id
+            )
+        )
+        if meeting_result.scalar_one_or_none() is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="회의 세션을 찾을 수 없습니다.")
+        s3_key = get_meeting_audio_s3_key(team_id, request.meeting_session_id)
+    else:
+        s3_key = file_service.shared_file_key(team_id, request.file_name)
+
+    content_type = request.content_type or "application/octet-stream"
+    part_size = file_service.multipart_part_size(request.file_size)
+    part_count = -(-request.file_size // part_size)
+
+    try:
+        s3_upload_id = await file_service.create_multipart_upload(s3_key, content_type)
+    except S3Error as e:
+        logger.error(f"multipart 업로드 시작 실패: {s3_key} - {e}")
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="업로드를 시작할 수 없습니다.")
+
+    session = UploadSession(
+        upload_id=str(uuid.uuid4()),
+        project_id=project_id,
+        team_id=team_id,
+        kind=request.kind,
+        meeting_session_id=request.meeting_session_id if request.kind == UploadKind.MEETING_AUDIO else None,
+        s3_key=s3_key,
+        s3_upload_id=s3_upload_id,
+        file_name=request.file_name,
+        content_type=content_type[:100],
+        file_size=request.file_size,
+        part_size=part_size,
+        part_count=part_count,
+        uploaded_by=request.user_id,
+        description=request.description,
+        status=UploadStatus.IN_PROGRESS,
+        expires_at=datetime.now() + timedelta(seconds=settings.FILE_MULTIPART_SESSION_TTL_SECONDS)
+    )
+    try:
+        db.add(session)
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"업로드 세션 저장 실패: {str(e)}")
+        try:
+            await file_service.abort_multipart_upload(s3_key, s3_upload_id)
+        except S3Error:
+            pass
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="업로드 세션 생성 중 오류가 발생했습니다.")
+
+    part_urls = await file_service.presign_upload_parts(
+        s3_key, s3_upload_id, range(1, min(part_count, MAX_PART_URLS_PER_REQUEST) + 1)
+    )
+    logger.info(f"📤 재개 가능 업로드 시작: {session.upload_id} ({part_count} parts)")
+    return {"success": True, "upload": _session_state(session), "part_urls": part_urls}
+
+
+@router.get("/{project_id}/uploads/{upload_id}")
+async def get_upload(project_id: int, upload_id: str, db: AsyncSession = Depends(get_db)):
+    """업로드 진행 상태 (재개 시 missing_parts만 다시 전송)"""
+    session = await _get_session(db, project_id, upload_id)
+    if session.status == UploadStatus.COMPLETED:
+        return {"success": True, "upload": _session_state(session)}
+    await _ensure_resumable(db, session)
+    parts = await _list_parts(db, session)
+    return {"success": True, "upload": _session_state(session, parts)}
+
+
+@router.post("/{project_id}/uploads/{upload_id}/part-urls")
+async def create_part_urls(
+    project_id: int,
+    upload_id: str,
+    request: PartUrlsRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """part URL 재발급 (만료되었거나 재개 시 남은 part 전송용)"""
+    session = await _get_session(db, project_id, upload_id)
+    await _ensure_resumable(db, session)
+    if session.status != UploadStatus.IN_PROGRESS:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 완료 처리된 업로드입니다.")
+    if not request.part_numbers or len(request.part_numbers) > MAX_PART_URLS_PER_REQUEST:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"part URL은 한 번에 1~{MAX_PART_URLS_PER_REQUEST}개까지 발급할 수 있습니다."
+        )
+    invalid = [n for n in request.part_numbers if not 1 <= n <= session.part_count]
+    if invalid:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"잘못된 part 번호: {invalid}")
+
+    part_urls = await file_service.presign_upload_parts(session.s3_key, session.s3_upload_id, sorted(set(request.part_numbers)))
+    return {"success": True, "part_urls": part_urls}
+
+
+@router.post("/{project_id}/uploads/{upload_id}/complete")
+async def complete_upload(project_id: int, upload_id: str, db: AsyncSession = Depends(get_db)):
+    """모든 part 확인 후 multipart 완료 (이미 완료된 세션은 같은 결과 반환)"""
+    session = await _get_session(db, project_id, upload_id)
+    if session.status == UploadStatus.COMPLETED:
+        return await _completed_response(db, session)
+    await _ensure_resumable(db, session)
+
+    if session.status == UploadStatus.COMPLETING:
+        # 이전 완료 요청이 중단된 세션 - MinIO 완료 후 DB 기록 전에 실패했으면 기록만 이어서 진행
+        if await file_service.stat_file(session.s3_key) is not None:
+            await _finalize(db, session)
+            return await _completed_response(db, session)
+        # MinIO 완료 전에 중단된 경우(프로세스 종료 등) part 확인부터 다시 진행
+    else:
+        # 동시 완료 요청 중 하나만 진행 (IN_PROGRESS -> COMPLETING 조건부 변경)
+        claim = await db.execute(
+            update(UploadSession)
+            .where(UploadSession.upload_id == upload_id, UploadSession.status == UploadStatus.IN_PROGRESS)
+            .values(status=UploadStatus.COMPLETING)
+        )
+        await db.commit()
+        if claim.rowcount != 1:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="업로드 완료 처리 중입니다. 잠시 후 다시 확인해주세요.")
+        await db.refresh(session)
+
+    try:
+        await _complete_multipart(db, session)
+        await _finalize(db, session)
+    except BaseException:
+        # 일시적 오류/예상치 못한 오류/요청 취소로 COMPLETING에 멈추지 않도록 복원 후 전달
+        await _release_claim(db, upload_id)
+        raise
+
+    logger.info(f"✅ 재개 가능 업로드 완료: {upload_id} -> {session.s3_key}")
+    return await _completed_response(db, session)
+
+
+@router.delete("/{project_id}/uploads/{upload_id}")
+async def abort_upload(project_id: int, upload_id: str, db: AsyncSession = Depends(get_db)):
+    """업로드 취소 (MinIO에 올라간 part 삭제)"""
+    session = await _get_session(db, project_id, upload_id)
+    if session.status == UploadStatus.COMPLETED:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 완료된 업로드입니다.")
+    if session.status != UploadStatus.ABORTED:
+        await _abort_session(db, session)
+    return {"success": True, "upload": _session_state(session)}
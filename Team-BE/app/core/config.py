@@ -29,6 +29,33 @@ class Settings(BaseSettings):
     MINIO_BUCKET: str = "portforge-files"
     MINIO_SECURE: bool = False
     
+    # [File Upload - MinIO 업로드 스레드 풀]
+    FILE_UPLOAD_WORKERS: int = 4                      # 동시에 MinIO로 전송하는 업로드 수
+    FILE_UPLOAD_PART_SIZE: int = 5 * 1024 * 1024      # multipart part 크기 (MinIO 최소 5MB)
+    FILE_UPLOAD_URL_EXPIRES_SECONDS: int = 900        # 브라우저 직접 업로드용 presigned PUT URL 유효 시간
+    FILE_MULTIPART_MAX_SIZE: int = 2 * 1024 * 1024 * 1024   # 재개 가능 업로드 최대 크기 (대용량 파일/회의 녹음)
+    FILE_MULTIPART_PART_SIZE: int = 8 * 1024 * 1024         # 재개 가능 업로드 part 크기 (S3 최소 5MB)
+    FILE_MULTIPART_SESSION_TTL_SECONDS: int = 24 * 3600     # 업로드 세션 유효 시간 (이후 재개 불가)
+    
+    # [File Download - presigned GET URL 캐시]
+    FILE_DOWNLOAD_URL_EXPIRES_SECONDS: int = 3600           # 파일 목록에 내려주는 다운로드 URL 유효 시간
+    FILE_DOWNLOAD_URL_REFRESH_MARGIN_SECONDS: int = 300     # 만료까지 이 시간 이상 남은 URL만 재사용
+    FILE_DOWNLOAD_URL_CACHE_MAX_ENTRIES: int = 10000
+    
+    # [MSA HTTP Client - 서비스 간 통신 커넥션 풀]
+    MSA_HTTP_TIMEOUT: float = 30.0
+    MSA_MAX_CONNECTIONS: int = 100            # 대상 서비스별 최대 연결 수
+    MSA_MAX_KEEPALIVE_CONNECTIONS: int = 20   # 유지할 keep-alive 연결 수
+    MSA_KEEPALIVE_EXPIRY: float = 30.0        # 유휴 연결 만료 시간(초)
+    MSA_HTTP2: bool = False                   # HTTP/2 사용 (h2 패키지 필요)
+
+    # [MSA Internal Auth - 서비스 간 /internal 호출 인증]
+    INTERNAL_SERVICE_TOKEN: str = ""         # X-Internal-Token 공유 토큰 (비어 있으면 /internal은 loopback 호출만 허용)
+    
+    # [User Profile Cache - Auth 사용자 기본 정보 캐시 (get_users_batch 앞단)]
+    USER_PROFILE_CACHE_TTL_SECONDS: float = 60.0   # 무효화 알림이 누락돼도 이 시간 후에는 다시 조회
+    USER_PROFILE_CACHE_MAX_ENTRIES: int = 10000
+    
     class Config:
         env_file = ".env"
         extra = "allow"  # .env 파일의 추가 키 허용
@@ -0,0 +1,27 @@
+# app/core/deps.py
+import secrets
+from fastapi import HTTPException, Request, status
+from app.core.config import settings
+from app.utils.msa_client import INTERNAL_TOKEN_HEADER
+
+# 토큰 미설정(로컬 개발) 시 /internal 호출을 허용할 클라이언트 주소
+LOOPBACK_HOSTS = {"127.0.0.1", "::1", "localhost"}
+
+
+async def verify_internal_service(request: Request) -> None:
+    """
+    /internal 라우트 전용 - 다른 MSA 서비스의 호출인지 확인합니다.
+    INTERNAL_SERVICE_TOKEN이 설정되어 있으면 X-Internal-Token 헤더가 일치해야 하고,
+    설정되어 있지 않으면 loopback 주소에서 온 호출만 허용합니다.
+    """
+    if settings.INTERNAL_SERVICE_TOKEN:
+        token = request.headers.get(INTERNAL_TOKEN_HEADER, "")
+        if secrets.compare_digest(token.encode(), settings.INTERNAL_SERVICE_TOKEN.encode()):
+            return
+    elif request.client and request.client.host in LOOPBACK_HOSTS:
+        return
+
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Internal service access only",
+    )
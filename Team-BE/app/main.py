@@ -1,6 +1,9 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.utils.msa_client import msa_client, register_pool_metrics
+from app.services.user_profile_cache import register_user_profile_cache_metrics
+from app.services.file_service import file_service
 import logging
 
 # 로깅 설정
@@ -24,8 +27,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 프로메테우스 메트릭 (선택적 - 설치된 경우에만 /metrics 노출)
+try:
+    from prometheus_fastapi_instrumentator import Instrumentator
+    Instrumentator().instrument(app).expose(app)
+    register_pool_metrics()  # MSAClient 커넥션 풀 상태
+    register_user_profile_cache_metrics()  # Auth 사용자 정보 캐시 적중률/크기
+except ImportError:
+    logger.warning("⚠️ prometheus_fastapi_instrumentator가 설치되지 않았습니다.")
+
+# MSA 통신용 공유 커넥션 풀 생성/정리 + MinIO 버킷 확인/업로드 스레드 풀
+@app.on_event("startup")
+async def startup_event():
+    await msa_client.startup()
+    await file_service.startup()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await file_service.shutdown()
+    await msa_client.aclose()
+
 # 핵심 API만 등록 - 복잡한 기능들 제거
-from app.api.v1.endpoints import teams, team_crud
+from app.api.v1.endpoints import teams, team_crud, internal, uploads
 
 # 통합 API (프로젝트+팀 생성) - 레거시 호환용
 # app.include_router(integration.router, prefix="/api/v1/integration", tags=["integration"])
@@ -36,6 +59,12 @@ app.include_router(teams.router, prefix="/api/v1/teams", tags=["teams"])
 # MSA 분리용 팀 API (Project Service에서 호출)
 app.include_router(team_crud.router, prefix="/api/v1/teams", tags=["team-msa"])
 
+# 재개 가능한 대용량 업로드 API (공유 파일 / 회의 녹음)
+app.include_router(uploads.router, prefix="/api/v1/teams", tags=["team-uploads"])
+
+# 서비스 간 내부 API (Auth 프로필 변경 시 사용자 정보 캐시 무효화)
+app.include_router(internal.router)
+
 @app.get("/")
 async def root():
     logger.info("Root endpoint accessed")
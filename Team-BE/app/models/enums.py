@@ -85,4 +85,16 @@ class MeetingStatus(Enum):
 class ReportType(Enum):
     MEETING_MINUTES = "MEETING_MINUTES"
     PROJECT_PLAN = "PROJECT_PLAN"
-    PROGRESS_REPORT = "PROGRESS_REPORT"
\ No newline at end of file
+    PROGRESS_REPORT = "PROGRESS_REPORT"
+
+# 재개 가능 업로드 대상
+class UploadKind(Enum):
+    SHARED_FILE = "SHARED_FILE"
+    MEETING_AUDIO = "MEETING_AUDIO"
+
+# 재개 가능 업로드 상태
+class UploadStatus(Enum):
+    IN_PROGRESS = "IN_PROGRESS"
+    COMPLETING = "COMPLETING"
+    COMPLETED = "COMPLETED"
+    ABORTED = "ABORTED"
@@ -3,7 +3,7 @@ from sqlalchemy.dialects.mysql import CHAR
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
-from app.models.enums import TeamRole, StackCategory, MeetingStatus, ReportType
+from app.models.enums import TeamRole, StackCategory, MeetingStatus, ReportType, UploadKind, UploadStatus
 
 class Team(Base):
     __tablename__ = "teams"
@@ -13,7 +13,7 @@ class Team(Base):
     name = Column(String(50), nullable=False)
     s3_key = Column(String(1024), nullable=False)
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime)
+    updated_at = Column(DateTime, onupdate=func.now())  # ETag 버전
     
     # 관계 설정 (같은 서비스 내에서만)
     members = relationship("TeamMember", back_populates="team", cascade="all, delete-orphan")
@@ -28,7 +28,7 @@ class TeamMember(Base):
     user_id = Column(String(36), primary_key=True)
     role = Column(SQLEnum(TeamRole), default=TeamRole.MEMBER)
     position_type = Column(SQLEnum(StackCategory), nullable=False)
-    updated_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     
     # 관계 설정
     team = relationship("Team", back_populates="members")
@@ -63,6 +63,31 @@ class SharedFile(Base):
     description = Column(Text)
     created_at = Column(DateTime, default=func.now())
 
+# 재개 가능한 multipart 업로드 세션 (브라우저가 part별 presigned URL로 MinIO/S3에 직접 업로드)
+class UploadSession(Base):
+    __tablename__ = "upload_sessions"
+    
+    upload_id = Column(String(36), primary_key=True)
+    project_id = Column(BigInteger, nullable=False)
+    team_id = Column(BigInteger, nullable=False)
+    kind = Column(SQLEnum(UploadKind), nullable=False)
+    meeting_session_id = Column(BigInteger, comment="MEETING_AUDIO일 때 회의 세션")
+    s3_key = Column(String(1024), nullable=False)
+    s3_upload_id = Column(String(255), nullable=False, comment="MinIO/S3 multipart UploadId")
+    file_name = Column(String(255), nullable=False)
+    content_type = Column(String(100), nullable=False)
+    file_size = Column(BigInteger, nullable=False)
+    part_size = Column(BigInteger, nullable=False)
+    part_count = Column(Integer, nullable=False)
+    uploaded_by = Column(String(36), nullable=False)
+    description = Column(Text)
+    status = Column(SQLEnum(UploadStatus), nullable=False, default=UploadStatus.IN_PROGRESS)
+    file_id = Column(BigInteger, comment="완료 후 생성된 SharedFile")
+    expires_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+
 # 팀원 초대용 Invitation 모델
 class Invitation(Base):
     __tablename__ = "invitations"
@@ -1,18 +1,33 @@
 """
 파일 업로드/다운로드 서비스 (MinIO S3)
+MinIO SDK는 동기 I/O이므로 업로드는 전용 스레드 풀에서 실행합니다.
+(이벤트 루프와 기본 스레드 풀을 점유하지 않아 업로드 중에도 채팅/태스크 API가 지연되지 않음)
 """
 
+import asyncio
 import os
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List, Tuple
 from minio import Minio
+from minio.datatypes import Part
 from minio.error import S3Error
 from fastapi import UploadFile, HTTPException
 import logging
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
+# 팀 공유 파일 최대 크기 (10MB)
+MAX_FILE_SIZE = 10 * 1024 * 1024
+
+# S3 multipart 업로드 최대 part 수
+MAX_MULTIPART_PARTS = 10000
+
 class FileService:
     def __init__(self):
         self.endpoint = os.getenv("MINIO_ENDPOINT", "localhost:9000")
@@ -21,16 +36,37 @@ class FileService:
         self.bucket_name = os.getenv("MINIO_BUCKET_NAME", "team-files")
         self.secure = os.getenv("MINIO_SECURE", "false").lower() == "true"
         
-        # MinIO 클라이언트 초기화
+        # MinIO 클라이언트 초기화 (네트워크 호출 없음, 앱 수명 동안 재사용)
         self.client = Minio(
             self.endpoint,
             access_key=self.access_key,
             secret_key=self.secret_key,
             secure=self.secure
         )
-        
-        # 버킷 생성 (없으면)
-        self._ensure_bucket_exists()
+        self.executor = ThreadPoolExecutor(
+            max_workers=settings.FILE_UPLOAD_WORKERS, thread_name_prefix="minio-upload"
+        )
+        # (s3_key, 유효 시간) -> (presigned GET URL, 재사용 기한) - 만료 직전까지 같은 URL 재사용
+        self._download_urls: "OrderedDict[Tuple[str, int], Tuple[str, float]]" = OrderedDict()
+        self._region_ready = False  # 버킷 region 조회 완료 여부 (이후 presigned 서명은 네트워크 없는 CPU 작업)
+    
+    # =================================================================
+    # 수명 관리 (main.py startup/shutdown에서 호출)
+    # =================================================================
+    async def startup(self):
+        """버킷 확인/생성 (요청마다 하지 않고 앱 시작 시 1회)"""
+        try:
+            await self._run(self._ensure_bucket_exists)
+        except Exception as e:
+            # MinIO가 아직 떠 있지 않아도 서비스는 시작 (업로드 시 오류로 응답)
+            logger.warning(f"⚠️ MinIO 버킷 확인 실패: {e}")
+    
+    async def shutdown(self):
+        self.executor.shutdown(wait=False)
+    
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
     
     def _ensure_bucket_exists(self):
         """버킷이 존재하지 않으면 생성"""
@@ -41,9 +77,9 @@ class FileService:
         except S3Error as e:
             logger.error(f"버킷 생성 실패: {e}")
     
-    def upload_file(self, file: UploadFile, team_id: int, user_id: str) -> dict:
+    async def upload_file(self, file: UploadFile, team_id: int, user_id: str) -> dict:
         """
-        파일 업로드
+        파일 업로드 (크기 확인 + MinIO 전송을 업로드 스레드 풀에서 실행)
         
         Args:
             file: 업로드할 파일
@@ -53,10 +89,10 @@ class FileService:
         Returns:
             dict: 업로드된 파일 정보
         """
+        return await self._run(self._upload_file_sync, file, team_id, user_id)
+    
+    def _upload_file_sync(self, file: UploadFile, team_id: int, user_id: str) -> dict:
         try:
-            # 파일 크기 체크 (10MB = 10 * 1024 * 1024 bytes)
-            MAX_FILE_SIZE = 10 * 1024 * 1024
-            
             # 파일 크기 확인
             file.file.seek(0, 2)  # 파일 끝으로 이동
             file_size = file.file.tell()
@@ -68,20 +104,16 @@ class FileService:
                     detail="파일 크기가 10MB를 초과합니다."
                 )
             
-            # 파일명 생성 (UUID + 원본 파일명)
-            file_extension = os.path.splitext(file.filename)[1] if file.filename else ""
-            unique_filename = f"{uuid.uuid4()}{file_extension}"
+            s3_key = self.shared_file_key(team_id, file.filename)
             
-            # S3 키 생성 (teams/{team_id}/shared_files/{unique_filename})
-            s3_key = f"teams/{team_id}/shared_files/{unique_filename}"
-            
-            # MinIO에 파일 업로드
+            # MinIO에 파일 업로드 (임시 파일에서 part 단위로 읽어 전송, part_size 초과 시 multipart)
             self.client.put_object(
                 bucket_name=self.bucket_name,
                 object_name=s3_key,
                 data=file.file,
                 length=file_size,
-                content_type=file.content_type or "application/octet-stream"
+                content_type=file.content_type or "application/octet-stream",
+                part_size=settings.FILE_UPLOAD_PART_SIZE
             )
             
             logger.info(f"파일 업로드 성공: {s3_key}")
@@ -95,6 +127,8 @@ class FileService:
                 "uploaded_at": datetime.now()
             }
             
+        except HTTPException:
+            raise
         except S3Error as e:
             logger.error(f"MinIO 업로드 실패: {e}")
             raise HTTPException(
@@ -108,9 +142,157 @@ class FileService:
                 detail=f"파일 업로드 중 오류가 발생했습니다: {str(e)}"
             )
     
+    # =================================================================
+    # 브라우저 직접 업로드 (presigned PUT -> 완료 확인)
+    # =================================================================
+    @staticmethod
+    def shared_file_key(team_id: int, filename: Optional[str]) -> str:
+        """S3 키 생성 (teams/{team_id}/shared_files/{UUID + 원본 확장자})"""
+        file_extension = os.path.splitext(filename)[1] if filename else ""
+        return f"teams/{team_id}/shared_files/{uuid.uuid4()}{file_extension}"
+    
+    @staticmethod
+    def is_shared_file_key(team_id: int, s3_key: str) -> bool:
+        """완료 요청의 키가 이 팀 공유 파일 경로에서 발급된 형태인지 확인"""
+        prefix = f"teams/{team_id}/shared_files/"
+        name = s3_key[len(prefix):]
+        return s3_key.startswith(prefix) and bool(name) and "/" not in name
+    
+    def object_url(self, s3_key: str) -> str:
+        scheme = "https" if self.secure else "http"
+        return f"{scheme}://{self.endpoint}/{self.bucket_name}/{s3_key}"
+    
+    async def create_upload_url(self, team_id: int, filename: str) -> dict:
+        """
+        브라우저가 MinIO/S3로 직접 PUT 할 presigned URL 발급
+        
+        Returns:
+            dict: s3_key, upload_url, expires_in
+        """
+        s3_key = self.shared_file_key(team_id, filename)
+        expires = settings.FILE_UPLOAD_URL_EXPIRES_SECONDS
+        try:
+            # 서명 계산은 로컬이지만 첫 호출 시 버킷 region 조회가 있을 수 있어 스레드 풀에서 실행
+            url = await self._run(
+                lambda: self.client.presigned_put_object(
+                    bucket_name=self.bucket_name,
+                    object_name=s3_key,
+                    expires=timedelta(seconds=expires)
+                )
+            )
+        except S3Error as e:
+            logger.error(f"업로드 URL 생성 실패: {e}")
+            raise HTTPException(
+                status_code=500,
+                detail="업로드 URL 생성에 실패했습니다."
+            )
+        return {"s3_key": s3_key, "upload_url": url, "expires_in": expires}
+    
+    async def stat_file(self, s3_key: str) -> Optional[dict]:
+        """업로드 완료 확인용 객체 정보 조회 (없으면 None)"""
+        return await self._run(self.get_file_info, s3_key)
+    
+    async def remove_file(self, s3_key: str) -> bool:
+        # 캐시는 이벤트 루프에서만 변경 (삭제된 파일의 URL을 더 내려주지 않도록)
+        for key in [key for key in self._download_urls if key[0] == s3_key]:
+            del self._download_urls[key]
+        return await self._run(self.delete_file, s3_key)
+    
+    # =================================================================
+    # 재개 가능한 multipart 업로드 (part별 presigned PUT -> MinIO ListParts로 진행 상태 확인 -> 완료)
+    # 파일 바이트는 API 서버를 거치지 않으므로 파일 크기와 무관하게 메모리 사용량이 일정
+    # MinIO SDK는 multipart 단계별 공개 API가 없어 S3 API 래퍼(_create_multipart_upload 등)를 사용
+    # =================================================================
+    @staticmethod
+    def multipart_part_size(file_size: int) -> int:
+        """part 크기 (설정값 이상, part 수가 S3 최대 10,000개를 넘지 않도록)"""
+        return max(settings.FILE_MULTIPART_PART_SIZE, -(-file_size // MAX_MULTIPART_PARTS))
+    
+    async def create_multipart_upload(self, s3_key: str, content_type: str) -> str:
+        """multipart 업로드 시작 (MinIO/S3 UploadId 반환)"""
+        return await self._run(
+            self.client._create_multipart_upload, self.bucket_name, s3_key, {"Content-Type": content_type}
+        )
+    
+    async def presign_upload_parts(self, s3_key: str, upload_id: str, part_numbers: Iterable[int]) -> Dict[int, str]:
+        """part 번호별 presigned PUT URL 발급"""
+        expires = timedelta(seconds=settings.FILE_UPLOAD_URL_EXPIRES_SECONDS)
+        
+        def sign() -> Dict[int, str]:
+            return {
+                part_number: self.client.get_presigned_url(
+                    "PUT", self.bucket_name, s3_key, expires=expires,
+                    extra_query_params={"partNumber": str(part_number), "uploadId": upload_id}
+                )
+                for part_number in part_numbers
+            }
+        return await self._run(sign)
+    
+    def _list_uploaded_parts_sync(self, s3_key: str, upload_id: str) -> List[Part]:
+        parts: List[Part] = []
+        marker = None
+        while True:
+            result = self.client._list_parts(self.bucket_name, s3_key, upload_id, part_number_marker=marker)
+            parts.extend(result.parts)
+            if not result.is_truncated:
+                return parts
+            marker = result.next_part_number_marker
+    
+    async def list_uploaded_parts(self, s3_key: str, upload_id: str) -> List[Part]:
+        """MinIO에 올라간 part 목록 (번호/크기/ETag)"""
+        return await self._run(self._list_uploaded_parts_sync, s3_key, upload_id)
+    
+    async def complete_multipart_upload(self, s3_key: str, upload_id: str, parts: List[Part]) -> None:
+        await self._run(
+            self.client._complete_multipart_upload,
+            self.bucket_name, s3_key, upload_id,
+            [Part(part.part_number, part.etag) for part in parts]
+        )
+    
+    async def abort_multipart_upload(self, s3_key: str, upload_id: str) -> None:
+        await self._run(self.client._abort_multipart_upload, self.bucket_name, s3_key, upload_id)
+    
+    # =================================================================
+    # 다운로드 URL (presigned GET 캐시)
+    # =================================================================
+    def _cached_download_url(self, s3_key: str, expires: int) -> Optional[str]:
+        entry = self._download_urls.get((s3_key, expires))
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            del self._download_urls[(s3_key, expires)]
+            return None
+        self._download_urls.move_to_end((s3_key, expires))
+        return entry[0]
+    
+    def _store_download_url(self, s3_key: str, expires: int, url: str, signed_at: float) -> None:
+        # 받은 쪽이 최소 REFRESH_MARGIN 동안은 쓸 수 있도록 만료 전에 새로 서명
+        reuse_until = signed_at + expires - min(settings.FILE_DOWNLOAD_URL_REFRESH_MARGIN_SECONDS, expires // 2)
+        self._download_urls[(s3_key, expires)] = (url, reuse_until)
+        self._download_urls.move_to_end((s3_key, expires))
+        while len(self._download_urls) > settings.FILE_DOWNLOAD_URL_CACHE_MAX_ENTRIES:
+            self._download_urls.popitem(last=False)
+    
+    async def _ensure_region(self) -> None:
+        """
+        버킷 region을 한 번만 조회해 클라이언트에 캐시 (GetBucketLocation)
+        업로드 스레드 풀을 점유하지 않도록 기본 executor에서 실행
+        """
+        if self._region_ready:
+            return
+        await asyncio.to_thread(self.client._get_region, self.bucket_name)
+        self._region_ready = True
+    
+    def _sign_download_url(self, s3_key: str, expires: int) -> str:
+        return self.client.presigned_get_object(
+            bucket_name=self.bucket_name,
+            object_name=s3_key,
+            expires=timedelta(seconds=expires)
+        )
+    
     def get_download_url(self, s3_key: str, expires: int = 3600) -> str:
         """
-        파일 다운로드 URL 생성 (임시 URL)
+        파일 다운로드 URL 생성 (임시 URL, 만료 직전까지 캐시된 URL 재사용)
         
         Args:
             s3_key: S3 객체 키
@@ -119,12 +301,13 @@ class FileService:
         Returns:
             str: 다운로드 URL
         """
+        url = self._cached_download_url(s3_key, expires)
+        if url is not None:
+            return url
         try:
-            url = self.client.presigned_get_object(
-                bucket_name=self.bucket_name,
-                object_name=s3_key,
-                expires=timedelta(seconds=expires)
-            )
+            signed_at = time.monotonic()
+            url = self._sign_download_url(s3_key, expires)
+            self._store_download_url(s3_key, expires, url, signed_at)
             return url
         except S3Error as e:
             logger.error(f"다운로드 URL 생성 실패: {e}")
@@ -133,6 +316,43 @@ class FileService:
                 detail="다운로드 URL 생성에 실패했습니다."
             )
     
+    async def get_download_urls(self, s3_keys: Iterable[str], expires: int = 3600) -> Dict[str, str]:
+        """
+        파일 목록 한 페이지의 다운로드 URL 일괄 생성
+        캐시에 없는 키만 서명 (첫 호출의 버킷 region 조회만 기본 executor에서 - 업로드 스레드 풀은 쓰지 않음)
+        서명에 실패한 키는 결과에서 빠짐
+        """
+        urls: Dict[str, str] = {}
+        missing: List[str] = []
+        for s3_key in dict.fromkeys(s3_keys):
+            url = self._cached_download_url(s3_key, expires)
+            if url is None:
+                missing.append(s3_key)
+            else:
+                urls[s3_key] = url
+        if not missing:
+            return urls
+        
+        try:
+            await self._ensure_region()
+        except Exception as e:
+            # region 조회 연결 실패 시 URL 없이 목록만 반환
+            logger.error(f"다운로드 URL 생성 중단: {e}")
+            return urls
+        
+        # region을 알면 서명은 로컬 HMAC 계산뿐이므로 스레드 풀 없이 바로 처리
+        signed_at = time.monotonic()
+        signed = {}
+        for s3_key in missing:
+            try:
+                signed[s3_key] = self._sign_download_url(s3_key, expires)
+            except S3Error as e:
+                logger.error(f"다운로드 URL 생성 실패: {s3_key} - {e}")
+        for s3_key, url in signed.items():
+            self._store_download_url(s3_key, expires, url, signed_at)
+        urls.update(signed)
+        return urls
+    
     def delete_file(self, s3_key: str) -> bool:
         """
         파일 삭제
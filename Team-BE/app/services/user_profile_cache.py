@@ -0,0 +1,132 @@
+"""
+Auth 사용자 기본 정보(닉네임/프로필 이미지) 프로세스 로컬 캐시
+MSAClient.get_users_batch 앞단에서 동작하며, 캐시에 없는 user_id만 Auth /users/batch로 조회합니다.
+- LRU + TTL: 최근 조회한 사용자만 보관하고, 무효화 알림이 누락돼도 TTL 후에는 다시 조회
+- Auth update_user_me에서 닉네임/프로필 이미지 변경 시 POST /internal/users/{user_id}/invalidate 로 무효화
+- 무효화 세대(generation)를 두어, 조회 도중 무효화된 사용자는 오래된 응답으로 다시 채우지 않음
+"""
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class UserProfileCache:
+    """user_id별 Auth 기본 정보 응답을 보관하는 TTL + LRU 캐시"""
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Dict, float]]" = OrderedDict()
+        self._invalidated_at: Dict[str, int] = {}  # user_id -> 무효화 시점 세대
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        """조회 시작 시점에 받아 두었다가 put_many()에 넘김"""
+        return self._generation
+
+    def etag_version(self) -> Tuple[int, int]:
+        """
+        사용자 정보(닉네임 등)를 포함한 응답의 ETag 구성 요소
+        - 무효화 세대: 프로필 변경 알림을 받으면 바뀜
+        - TTL 구간 번호: 알림이 누락돼도 TTL마다 바뀌어 304 재검증 응답이 캐시 TTL 이상 묵지 않음
+        """
+        return self._generation, int(time.time() // self.ttl) if self.ttl > 0 else 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(self, user_ids: Iterable[str]) -> Tuple[List[Dict], List[str]]:
+        """캐시된 사용자 정보와 Auth에서 조회해야 할 user_id 목록 반환"""
+        now = time.monotonic()
+        found: List[Dict] = []
+        missing: List[str] = []
+        for user_id in dict.fromkeys(user_ids):  # 중복 제거 (순서 유지)
+            entry = self._entries.get(user_id)
+            if entry is None or entry[1] <= now:
+                if entry is not None:
+                    del self._entries[user_id]
+                missing.append(user_id)
+                continue
+            self._entries.move_to_end(user_id)
+            found.append(entry[0])
+
+        self.hits += len(found)
+        self.misses += len(missing)
+        return found, missing
+
+    def put_many(self, users: Iterable[Dict], generation: int) -> None:
+        """Auth 응답 저장 (조회 시작 후 무효화된 사용자는 저장하지 않음)"""
+        expires_at = time.monotonic() + self.ttl
+        for user in users:
+            user_id = user.get("user_id")
+            if not user_id or self._invalidated_at.get(user_id, -1) >= generation:
+                continue
+            self._entries[user_id] = (user, expires_at)
+            self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str) -> None:
+        """프로필 변경 알림 수신 시 해당 사용자 항목 제거"""
+        self._invalidated_at[user_id] = self._generation
+        self._generation += 1
+        self._entries.pop(user_id, None)
+        self.invalidations += 1
+        # 무효화 기록 무한 증가 방지 (비운 직후 끝난 조회가 오래된 값을 넣더라도 TTL 후 다시 조회)
+        if len(self._invalidated_at) > self.max_entries:
+            self._invalidated_at.clear()
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+        self._invalidated_at.clear()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+user_profile_cache = UserProfileCache(
+    ttl=settings.USER_PROFILE_CACHE_TTL_SECONDS,
+    max_entries=settings.USER_PROFILE_CACHE_MAX_ENTRIES,
+)
+
+
+def register_user_profile_cache_metrics():
+    """사용자 정보 캐시 적중률/크기를 Prometheus /metrics에 노출"""
+    try:
+        from prometheus_client import REGISTRY
+        from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+    except ImportError:
+        logger.warning("⚠️ prometheus_client가 없어 사용자 정보 캐시 메트릭을 등록하지 않습니다.")
+        return
+
+    class _UserProfileCacheCollector:
+        def collect(self):
+            stats = user_profile_cache.stats()
+            yield GaugeMetricFamily("user_profile_cache_entries", "사용자 정보 캐시 항목 수", value=stats["entries"])
+            yield GaugeMetricFamily("user_profile_cache_hit_ratio", "사용자 정보 캐시 적중률 (user_id 단위, 프로세스 시작 이후)", value=stats["hit_ratio"])
+            yield CounterMetricFamily("user_profile_cache_hits", "사용자 정보 캐시 적중 user_id 수", value=stats["hits"])
+            yield CounterMetricFamily("user_profile_cache_misses", "사용자 정보 캐시 미스 user_id 수 (Auth 조회 대상)", value=stats["misses"])
+            yield CounterMetricFamily("user_profile_cache_invalidations", "사용자 정보 캐시 무효화 횟수", value=stats["invalidations"])
+
+    try:
+        REGISTRY.register(_UserProfileCacheCollector())
+    except ValueError:
+        # --reload 등으로 중복 등록되는 경우 무시
+        pass
@@ -0,0 +1,29 @@
+"""
+조건부 GET (ETag / If-None-Match) 유틸
+리소스의 버전 값(updated_at, 하위 항목 수/최종 수정 시각 등)으로 약한 ETag를 만들고,
+클라이언트가 보낸 If-None-Match와 같으면 본문 없이 304를 응답합니다.
+"""
+import hashlib
+from typing import Any, Optional
+
+
+def make_etag(*version: Any) -> str:
+    """버전 값들로 약한 ETag 생성 (같은 버전이면 같은 값)"""
+    digest = hashlib.sha1(repr(version).encode("utf-8")).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 etag와 일치하는지 (여러 값/`*`/약한 비교 지원)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
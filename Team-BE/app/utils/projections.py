@@ -0,0 +1,32 @@
+"""
+목록 조회용 컬럼 프로젝션
+목록 API는 ORM 엔티티 대신 필요한 컬럼만 Row로 조회합니다.
+(identity map 등록/객체 생성 없이 튜플로 받아 바로 직렬화 - 큰 목록에서 메모리/CPU 절약)
+"""
+from typing import Dict
+
+from sqlalchemy.engine import Row
+
+from app.models.task import Task
+
+# 칸반 보드 태스크 목록
+TASK_LIST_COLUMNS = (
+    Task.task_id, Task.project_id, Task.title, Task.description, Task.status, Task.priority,
+    Task.created_by, Task.assignee_id, Task.due_date, Task.created_at,
+)
+
+
+def task_row(row: Row) -> Dict:
+    """TASK_LIST_COLUMNS Row → 태스크 항목"""
+    return {
+        "task_id": row.task_id,
+        "project_id": row.project_id,
+        "title": row.title,
+        "description": row.description,
+        "status": row.status.value if hasattr(row.status, 'value') else row.status,
+        "priority": row.priority.value if hasattr(row.priority, 'value') else row.priority,
+        "created_by": row.created_by,
+        "assignee_id": row.assignee_id,
+        "due_date": row.due_date.isoformat() if row.due_date else None,
+        "created_at": row.created_at.isoformat() if row.created_at else None
+    }
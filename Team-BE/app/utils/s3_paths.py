@@ -167,6 +167,11 @@ def get_meeting_s3_key(team_id: int, date: str = None) -> str:
     return s3_path_manager.team_meeting(team_id, date)
 
 
+def get_meeting_audio_s3_key(team_id: int, session_id: int) -> str:
+    """회의 오디오 녹음 S3 키 생성"""
+    return s3_path_manager.team_meeting_audio(team_id, session_id)
+
+
 def get_chat_backup_s3_key(team_id: int, date: str = None) -> str:
     """채팅 백업 S3 키 생성"""
     return s3_path_manager.team_chat_backup(team_id, date)
@@ -56,6 +56,16 @@ class TaskPriority(str, enum.Enum):
     MEDIUM = "MEDIUM"
     LOW = "LOW"
 
+class UploadKind(str, enum.Enum):
+    SHARED_FILE = "SHARED_FILE"
+    MEETING_AUDIO = "MEETING_AUDIO"
+
+class UploadStatus(str, enum.Enum):
+    IN_PROGRESS = "IN_PROGRESS"
+    COMPLETING = "COMPLETING"
+    COMPLETED = "COMPLETED"
+    ABORTED = "ABORTED"
+
 # 모델 정의
 class Team(Base):
     __tablename__ = "teams"
@@ -100,6 +110,29 @@ class SharedFile(Base):
     description = Column(Text)
     created_at = Column(DateTime, default=func.now())
 
+class UploadSession(Base):
+    __tablename__ = "upload_sessions"
+    
+    upload_id = Column(String(36), primary_key=True)
+    project_id = Column(BigInteger, nullable=False)
+    team_id = Column(BigInteger, nullable=False)
+    kind = Column(SQLEnum(UploadKind), nullable=False)
+    meeting_session_id = Column(BigInteger)
+    s3_key = Column(String(1024), nullable=False)
+    s3_upload_id = Column(String(255), nullable=False)
+    file_name = Column(String(255), nullable=False)
+    content_type = Column(String(100), nullable=False)
+    file_size = Column(BigInteger, nullable=False)
+    part_size = Column(BigInteger, nullable=False)
+    part_count = Column(Integer, nullable=False)
+    uploaded_by = Column(String(36), nullable=False)
+    description = Column(Text)
+    status = Column(SQLEnum(UploadStatus), nullable=False, default=UploadStatus.IN_PROGRESS)
+    file_id = Column(BigInteger)
+    expires_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
 class Invitation(Base):
     __tablename__ = "invitations"
     
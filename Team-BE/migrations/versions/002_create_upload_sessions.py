@@ -0,0 +1,52 @@
+"""Create upload_sessions table
+
+Revision ID: 002_create_upload_sessions
+Revises: 001_create_team_tables
+Create Date: 2026-10-17
+
+재개 가능한 multipart 업로드 세션 (팀 공유 파일 / 회의 녹음):
+- upload_sessions: MinIO/S3 multipart UploadId와 part 크기/개수, 진행 상태
+  (업로드된 part 목록은 MinIO ListParts로 조회)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002_create_upload_sessions'
+down_revision: Union[str, Sequence[str], None] = '001_create_team_tables'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create upload_sessions table."""
+    op.create_table('upload_sessions',
+        sa.Column('upload_id', sa.String(length=36), nullable=False),
+        sa.Column('project_id', sa.BigInteger(), nullable=False),
+        sa.Column('team_id', sa.BigInteger(), nullable=False),
+        sa.Column('kind', sa.Enum('SHARED_FILE', 'MEETING_AUDIO', name='uploadkind'), nullable=False),
+        sa.Column('meeting_session_id', sa.BigInteger(), nullable=True),
+        sa.Column('s3_key', sa.String(length=1024), nullable=False),
+        sa.Column('s3_upload_id', sa.String(length=255), nullable=False),
+        sa.Column('file_name', sa.String(length=255), nullable=False),
+        sa.Column('content_type', sa.String(length=100), nullable=False),
+        sa.Column('file_size', sa.BigInteger(), nullable=False),
+        sa.Column('part_size', sa.BigInteger(), nullable=False),
+        sa.Column('part_count', sa.Integer(), nullable=False),
+        sa.Column('uploaded_by', sa.String(length=36), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('status', sa.Enum('IN_PROGRESS', 'COMPLETING', 'COMPLETED', 'ABORTED', name='uploadstatus'), nullable=False),
+        sa.Column('file_id', sa.BigInteger(), nullable=True),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('NOW()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('NOW()'), nullable=True),
+        sa.PrimaryKeyConstraint('upload_id')
+    )
+
+
+def downgrade() -> None:
+    """Drop upload_sessions table."""
+    op.drop_table('upload_sessions')
@@ -0,0 +1,16 @@
+"""
+테스트 공통 설정
+- app.core.config가 import 시점에 DB URL을 읽으므로, 앱 모듈을 불러오기 전에 로컬 SQLite로 지정
+- SQLite는 BIGINT PRIMARY KEY를 자동 증가시키지 않으므로 테스트 DB에서만 INTEGER로 생성
+"""
+import os
+
+from sqlalchemy import BigInteger
+from sqlalchemy.ext.compiler import compiles
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///./test_portforge_team.sqlite")
+
+
+@compiles(BigInteger, "sqlite")
+def _bigint_as_integer(type_, compiler, **kw):
+    return "INTEGER"
@@ -0,0 +1,116 @@
+"""
+팀 대시보드(/teams/{project_id}/stats) ETag 테스트
+실제 데이터를 끝까지 만든 응답에만 ETag를 붙이고, Mock/오류 응답과 Auth 조회 실패 응답에는 붙이지 않는지 확인합니다.
+Auth 호출(msa_client.get_users_batch)은 테스트용 함수로 교체합니다.
+"""
+import asyncio
+from typing import Dict, List, Optional
+
+import pytest
+from fastapi import Response
+from starlette.requests import Request
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import app.models  # noqa: F401 - 모든 테이블을 metadata에 등록
+from app.api.v1.endpoints import teams as teams_api
+from app.core.database import Base
+from app.models.enums import StackCategory, TeamRole
+from app.models.team import Team, TeamMember
+
+PROJECT_ID = 7
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'stats.sqlite'}")
+
+    async def create():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine)() as session:
+            team = Team(project_id=PROJECT_ID, name="팀", s3_key=f"teams/{PROJECT_ID}/")
+            session.add(team)
+            await session.flush()
+            session.add(TeamMember(team_id=team.team_id, user_id="user-1", role=TeamRole.LEADER,
+                                   position_type=StackCategory.BACKEND))
+            await session.commit()
+
+    asyncio.run(create())
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def auth(monkeypatch):
+    """Auth 사용자 조회 응답 제어: unavailable=True면 연결 실패(None)"""
+    state = {"unavailable": False}
+
+    async def get_users_batch(user_ids: List[str]) -> Optional[List[Dict]]:
+        if state["unavailable"]:
+            return None
+        return [{"user_id": user_id, "nickname": f"닉네임-{user_id}"} for user_id in user_ids]
+
+    monkeypatch.setattr(teams_api.msa_client, "get_users_batch", get_users_batch)
+    return state
+
+
+class FailingSession:
+    """ETag 버전 조회 이후의 쿼리가 실패하는 세션"""
+
+    def __init__(self, session):
+        self.session = session
+        self.calls = 0
+
+    async def execute(self, *args, **kwargs):
+        self.calls += 1
+        if self.calls > 1:
+            raise RuntimeError("DB 연결 끊김")
+        return await self.session.execute(*args, **kwargs)
+
+
+def _stats(session_factory, project_id: int = PROJECT_ID, headers: Optional[Dict[str, str]] = None, wrap=None):
+    scope = {
+        "type": "http", "method": "GET", "path": f"/teams/{project_id}/stats",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+    }
+
+    async def call():
+        async with session_factory() as session:
+            response = Response()
+            db = wrap(session) if wrap else session
+            result = await teams_api.get_team_stats(project_id, Request(scope), response, db=db)
+            return result, response
+
+    return asyncio.run(call())
+
+
+def test_success_is_tagged_and_revalidates(session_factory, auth):
+    data, response = _stats(session_factory)
+
+    assert data["members"][0]["nickname"] == "닉네임-user-1"
+    etag = response.headers["ETag"]
+    result, _ = _stats(session_factory, headers={"If-None-Match": etag})
+    assert result.status_code == 304
+
+
+def test_auth_failure_is_not_tagged(session_factory, auth):
+    auth["unavailable"] = True
+
+    data, response = _stats(session_factory)
+
+    assert data["members"][0]["nickname"] == "user-1"
+    assert "ETag" not in response.headers
+
+
+def test_error_fallback_is_not_tagged(session_factory, auth):
+    data, response = _stats(session_factory, wrap=FailingSession)
+
+    assert data["members"][0]["user_id"] == "현재사용자"
+    assert "ETag" not in response.headers
+
+
+def test_missing_team_mock_is_not_tagged(session_factory, auth):
+    data, response = _stats(session_factory, project_id=999)
+
+    assert data["members"][0]["user_id"] == "현재사용자"
+    assert "ETag" not in response.headers
@@ -0,0 +1,258 @@
+"""
+재개 가능 업로드(multipart) 상태 전이 테스트
+IN_PROGRESS -> COMPLETING -> COMPLETED 흐름과, 완료 처리 중 실패/취소 시 IN_PROGRESS 복원을 확인합니다.
+MinIO 호출은 메모리에서 multipart 상태를 흉내 내는 FakeStorage로 교체합니다.
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+import pytest
+from fastapi import HTTPException
+from minio.datatypes import Part
+from minio.error import S3Error
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import app.models  # noqa: F401 - 모든 테이블을 metadata에 등록
+from app.api.v1.endpoints import uploads as uploads_api
+from app.core.config import settings
+from app.core.database import Base
+from app.models.enums import UploadStatus
+from app.models.team import SharedFile, Team, UploadSession
+
+PROJECT_ID = 7
+PART_SIZE = settings.FILE_MULTIPART_PART_SIZE
+FILE_SIZE = 2 * PART_SIZE + 1024  # part 3개 (마지막 part는 1KB)
+
+
+def _s3_error(code: str) -> S3Error:
+    return S3Error(None, code, code, "/team-files", "request-id", "host-id")
+
+
+class FakeStorage:
+    """multipart 업로드 하나의 MinIO 상태 (업로드된 part, 합쳐진 객체)"""
+
+    def __init__(self):
+        self.parts: Dict[int, int] = {}          # part 번호 -> 크기
+        self.objects: Dict[str, int] = {}        # 합쳐진 객체 키 -> 크기
+        self.open_uploads = set()
+        self.list_error: Optional[BaseException] = None
+        self.complete_error: Optional[BaseException] = None
+        self.complete_calls = 0
+        self.aborted = []
+
+    def upload_all_parts(self, file_size: int = FILE_SIZE) -> None:
+        part_number = 1
+        while file_size > 0:
+            self.parts[part_number] = min(PART_SIZE, file_size)
+            file_size -= PART_SIZE
+            part_number += 1
+
+    async def create_multipart_upload(self, s3_key: str, content_type: str) -> str:
+        self.open_uploads.add("s3-upload-1")
+        return "s3-upload-1"
+
+    async def presign_upload_parts(self, s3_key: str, upload_id: str, part_numbers: Iterable[int]) -> Dict[int, str]:
+        return {n: f"http://minio/{s3_key}?uploadId={upload_id}&partNumber={n}" for n in part_numbers}
+
+    async def list_uploaded_parts(self, s3_key: str, upload_id: str) -> List[Part]:
+        if self.list_error is not None:
+            raise self.list_error
+        if upload_id not in self.open_uploads:
+            raise _s3_error("NoSuchUpload")
+        return [Part(n, f"etag-{n}", None, size) for n, size in sorted(self.parts.items())]
+
+    async def complete_multipart_upload(self, s3_key: str, upload_id: str, parts: List[Part]) -> None:
+        self.complete_calls += 1
+        if upload_id not in self.open_uploads:
+            raise _s3_error("NoSuchUpload")
+        self.open_uploads.discard(upload_id)
+        self.objects[s3_key] = sum(part.size for part in parts)
+        if self.complete_error is not None:
+            # 스토리지에서는 완료됐지만 응답을 받지 못한 경우
+            raise self.complete_error
+
+    async def abort_multipart_upload(self, s3_key: str, upload_id: str) -> None:
+        self.open_uploads.discard(upload_id)
+        self.aborted.append(upload_id)
+
+    async def stat_file(self, s3_key: str) -> Optional[dict]:
+        size = self.objects.get(s3_key)
+        return None if size is None else {"size": size}
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    fake = FakeStorage()
+    for name in ("create_multipart_upload", "presign_upload_parts", "list_uploaded_parts",
+                 "complete_multipart_upload", "abort_multipart_upload", "stat_file"):
+        monkeypatch.setattr(uploads_api.file_service, name, getattr(fake, name))
+    return fake
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'uploads.sqlite'}")
+
+    async def create():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine)() as session:
+            session.add(Team(project_id=PROJECT_ID, name="팀", s3_key=f"teams/{PROJECT_ID}/"))
+            await session.commit()
+
+    asyncio.run(create())
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    asyncio.run(engine.dispose())
+
+
+def _call(session_factory, endpoint, *args):
+    async def call():
+        async with session_factory() as session:
+            return await endpoint(PROJECT_ID, *args, db=session)
+
+    return asyncio.run(call())
+
+
+def _create(session_factory) -> str:
+    request = uploads_api.UploadCreateRequest(file_name="회의록.zip", file_size=FILE_SIZE, user_id="user-1")
+    data = _call(session_factory, uploads_api.create_upload, request)
+    assert data["upload"]["part_count"] == 3
+    assert sorted(data["part_urls"]) == [1, 2, 3]
+    return data["upload"]["upload_id"]
+
+
+def _complete(session_factory, upload_id: str) -> dict:
+    return _call(session_factory, uploads_api.complete_upload, upload_id)
+
+
+def _status(session_factory, upload_id: str) -> UploadStatus:
+    async def load():
+        async with session_factory() as session:
+            return (await session.get(UploadSession, upload_id)).status
+
+    return asyncio.run(load())
+
+
+def _s3_key(session_factory, upload_id: str) -> str:
+    async def load():
+        async with session_factory() as session:
+            return (await session.get(UploadSession, upload_id)).s3_key
+
+    return asyncio.run(load())
+
+
+def _set_status(session_factory, upload_id: str, **values) -> None:
+    async def save():
+        async with session_factory() as session:
+            upload = await session.get(UploadSession, upload_id)
+            for key, value in values.items():
+                setattr(upload, key, value)
+            await session.commit()
+
+    asyncio.run(save())
+
+
+def _shared_file_count(session_factory) -> int:
+    async def count():
+        async with session_factory() as session:
+            return (await session.execute(select(func.count()).select_from(SharedFile))).scalar_one()
+
+    return asyncio.run(count())
+
+
+def test_complete_creates_shared_file_once(session_factory, storage):
+    upload_id = _create(session_factory)
+    storage.upload_all_parts()
+
+    first = _complete(session_factory, upload_id)
+    again = _complete(session_factory, upload_id)
+
+    assert first["upload"]["status"] == "COMPLETED"
+    assert first["file"]["file_id"] == again["file"]["file_id"]
+    assert storage.complete_calls == 1
+    assert _shared_file_count(session_factory) == 1
+
+
+def test_missing_parts_keep_session_resumable(session_factory, storage):
+    upload_id = _create(session_factory)
+    storage.parts = {1: PART_SIZE}
+
+    with pytest.raises(HTTPException) as exc:
+        _complete(session_factory, upload_id)
+
+    assert exc.value.status_code == 400
+    assert _status(session_factory, upload_id) == UploadStatus.IN_PROGRESS
+    state = _call(session_factory, uploads_api.get_upload, upload_id)["upload"]
+    assert state["missing_parts"] == [2, 3]
+    part_urls = _call(session_factory, uploads_api.create_part_urls, upload_id, uploads_api.PartUrlsRequest(part_numbers=[2, 3]))
+    assert sorted(part_urls["part_urls"]) == [2, 3]
+
+
+@pytest.mark.parametrize("error, expected", [
+    (_s3_error("InternalError"), HTTPException),   # ListParts 일시 오류 -> 502
+    (ConnectionResetError("reset"), ConnectionResetError),
+    (asyncio.CancelledError(), asyncio.CancelledError),
+])
+def test_list_failure_after_claim_restores_in_progress(session_factory, storage, error, expected):
+    upload_id = _create(session_factory)
+    storage.upload_all_parts()
+    storage.list_error = error
+
+    with pytest.raises(expected):
+        _complete(session_factory, upload_id)
+    assert _status(session_factory, upload_id) == UploadStatus.IN_PROGRESS
+
+    storage.list_error = None
+    assert _complete(session_factory, upload_id)["upload"]["status"] == "COMPLETED"
+
+
+def test_lost_complete_response_finalizes_on_retry(session_factory, storage):
+    upload_id = _create(session_factory)
+    storage.upload_all_parts()
+    storage.complete_error = ConnectionResetError("응답 유실")
+
+    with pytest.raises(ConnectionResetError):
+        _complete(session_factory, upload_id)
+    assert _status(session_factory, upload_id) == UploadStatus.IN_PROGRESS
+
+    # multipart는 이미 합쳐졌으므로 ListParts가 NoSuchUpload -> 합쳐진 객체로 마무리
+    storage.complete_error = None
+    assert _complete(session_factory, upload_id)["upload"]["status"] == "COMPLETED"
+    assert storage.complete_calls == 1
+    assert _shared_file_count(session_factory) == 1
+
+
+def test_stuck_completing_without_object_resumes_completion(session_factory, storage):
+    upload_id = _create(session_factory)
+    storage.upload_all_parts()
+    _set_status(session_factory, upload_id, status=UploadStatus.COMPLETING)  # 클레임 직후 프로세스 종료
+
+    assert _complete(session_factory, upload_id)["upload"]["status"] == "COMPLETED"
+    assert storage.complete_calls == 1
+
+
+def test_stuck_completing_with_object_only_records(session_factory, storage):
+    upload_id = _create(session_factory)
+    storage.upload_all_parts()
+    _set_status(session_factory, upload_id, status=UploadStatus.COMPLETING)
+    # MinIO 완료까지 마친 뒤 DB 기록 전에 종료된 경우
+    storage.open_uploads.clear()
+    storage.objects[_s3_key(session_factory, upload_id)] = FILE_SIZE
+
+    assert _complete(session_factory, upload_id)["upload"]["status"] == "COMPLETED"
+    assert storage.complete_calls == 0
+    assert _shared_file_count(session_factory) == 1
+
+
+def test_expired_session_is_aborted(session_factory, storage):
+    upload_id = _create(session_factory)
+    _set_status(session_factory, upload_id, expires_at=datetime.now() - timedelta(seconds=1))
+
+    with pytest.raises(HTTPException) as exc:
+        _complete(session_factory, upload_id)
+
+    assert exc.value.status_code == 410
+    assert _status(session_factory, upload_id) == UploadStatus.ABORTED
+    assert storage.aborted == ["s3-upload-1"]
@@ -69,6 +69,12 @@ def seed_project():
             try:
                 conn.execute(text("TRUNCATE TABLE project_recruitment_positions"))
             except: pass
+            try:
+                conn.execute(text("TRUNCATE TABLE project_stack"))
+            except: pass
+            try:
+                conn.execute(text("TRUNCATE TABLE outbox_events"))
+            except: pass
             try:
                 conn.execute(text("TRUNCATE TABLE projects"))
             except: pass